@@ -17,8 +17,14 @@ Database
 from fastapi import APIRouter
 from app.features.grocery.routers.v1.router import router as grocery_router
 from app.features.auth.routers.v1.router import router as auth_router
+from app.features.metrics.routers.v1.router import router as metrics_router
+from app.features.health.routers.v1.router import router as health_router
 
 api_router = APIRouter()
 api_router.include_router(grocery_router)
 
 api_router.include_router(auth_router)
+
+api_router.include_router(metrics_router)
+
+api_router.include_router(health_router)
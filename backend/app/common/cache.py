@@ -0,0 +1,111 @@
+"""
+cache.py (cross-feature)
+
+Bounded in-process LRU + TTL cache with version-counter invalidation.
+
+Entries are stored under (version, key). Writers call `bump_version()`,
+which makes every older entry unreachable at once, so invalidation is O(1)
+no matter how many filter combinations are cached. A reader captures
+`version` *before* its DB read and stores under that version, so a write
+racing with a slow read can never be cached as fresh.
+
+Single event loop, no awaits inside → no locking needed.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class VersionedTTLCache:
+    def __init__(
+            self,
+            max_entries: int,
+            ttl_seconds: float,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[int, Hashable], tuple[float, Any]] = OrderedDict()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: Hashable) -> Any | None:
+        if not self.enabled:
+            return None
+        entry_key = (self._version, key)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[entry_key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return value
+
+    def set(
+            self,
+            key: Hashable,
+            value: Any,
+            version: int | None = None,
+            ttl_seconds: float | None = None,
+    ) -> None:
+        """`ttl_seconds` shortens this entry's lifetime below the cache's TTL (never extends it)"""
+        if not self.enabled:
+            return
+        version = self._version if version is None else version
+        if version != self._version:
+            # data was read before a write landed → already stale
+            return
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl_seconds <= 0:
+            return
+        entry_key = (version, key)
+        self._entries[entry_key] = (self._clock() + ttl_seconds, value)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def bump_version(self) -> int:
+        """Invalidate everything cached so far"""
+        self._version += 1
+        self._entries.clear()
+        self.invalidations += 1
+        return self._version
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'version': self._version,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+        }
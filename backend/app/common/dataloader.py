@@ -0,0 +1,84 @@
+"""
+dataloader.py (cross-feature)
+
+Dataloader-style batcher: per-key lookups requested in the same event-loop
+tick are coalesced into ONE batch call (e.g. one `WHERE id = ANY(:ids)`)
+instead of one query — and one pooled connection — per key.
+
+    loader = DataLoader(load_groceries_by_ids)
+    a, b = await asyncio.gather(loader.load(id_a), loader.load(id_b))   # one query
+
+A loader caches its results for its own lifetime, so create one per request
+(per unit of work), never a process-wide one.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Mapping, Optional, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    def __init__(self, batch_load: BatchLoadFn, max_batch_size: Optional[int] = None):
+        """
+        `batch_load` receives unique keys and returns a mapping key → value;
+        keys missing from the mapping resolve to None.
+        """
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._dispatch_scheduled = False
+        # strong references to in-flight batches (the loop only keeps weak ones)
+        self._batches: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> Awaitable[Optional[V]]:
+        """
+        Queue `key` for the next batch. Deliberately not a coroutine: the key is
+        queued right away, so every `load` made before the current tick yields
+        ends up in the same batch.
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Sequence[K]) -> list[Optional[V]]:
+        """Values in the order of `keys` (duplicates included), None for missing keys"""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        keys, self._queue = self._queue, []
+        batch_size = self._max_batch_size or len(keys)
+        for start in range(0, len(keys), batch_size):
+            task = asyncio.create_task(self._load_batch(keys[start:start + batch_size]))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, keys: list[K]) -> None:
+        try:
+            values = await self._batch_load(keys)
+        except Exception as e:
+            # don't cache failures: a later load() retries the key
+            for key in keys:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(values.get(key))
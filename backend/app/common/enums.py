@@ -31,3 +31,19 @@ class Seller(str, Enum):
     DEFAULT = 'default'
     AGORA = 'agora'
     ONLINE = 'online'
+
+
+class ExportFormat(str, Enum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class GrocerySort(str, Enum):
+    NAME = 'name'
+    NAME_DESC = '-name'
+    CURRENT_PRICE = 'current_price'
+    CURRENT_PRICE_DESC = '-current_price'
+    BEST_PRICE = 'best_price'
+    BEST_PRICE_DESC = '-best_price'
+    UPDATED_AT = 'updated_at'
+    UPDATED_AT_DESC = '-updated_at'
@@ -0,0 +1,97 @@
+"""
+executor.py (cross-feature)
+
+Bounded thread pool for CPU-heavy blocking calls (password hashing, ...)
+that must not run on the event loop.
+
+    •	at most `workers` calls run at once, at most `queue_size` more wait
+    •	a call arriving when both are full is rejected immediately (503)
+    •	a call not finished within `timeout_seconds` is abandoned (503); if it
+    	is still queued it never starts, if it is already running its slot
+    	stays taken until it returns, so the bound always holds
+
+Queue wait (submit → start) and run time are recorded per call. With
+`workers=0` calls run inline on the event loop (no offloading, no bound).
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app.core.exceptions import ServiceUnavailableException
+from app.core.metrics import LatencyRecorder
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    def __init__(self, name: str, workers: int, queue_size: int, timeout_seconds: float):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout_seconds = timeout_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.queue_wait = LatencyRecorder()
+        self.run_time = LatencyRecorder()
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.queue_size
+
+    def _timed(self, submitted_at: float, fn: Callable[..., T], *args: Any) -> T:
+        started_at = time.perf_counter()
+        self.queue_wait.record(started_at - submitted_at)
+        try:
+            return fn(*args)
+        finally:
+            self.run_time.record(time.perf_counter() - started_at)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.workers <= 0:
+            return self._timed(time.perf_counter(), fn, *args)
+
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self.rejected += 1
+                raise ServiceUnavailableException()
+            self._in_flight += 1
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+
+        future = self._executor.submit(partial(self._timed, time.perf_counter(), fn, *args))
+        # released when the call really ends (or is cancelled before starting),
+        # not when the caller stops waiting
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_seconds)
+        except TimeoutError as e:
+            self.timeouts += 1
+            raise ServiceUnavailableException() from e
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'timeout_seconds': self.timeout_seconds,
+            'in_flight': self._in_flight,
+            'rejected': self.rejected,
+            'timeouts': self.timeouts,
+            'queue_wait': self.queue_wait.stats(),
+            'run_time': self.run_time.stats(),
+        }
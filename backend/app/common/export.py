@@ -0,0 +1,50 @@
+"""
+export.py (cross-feature)
+
+Incremental encoders for streaming exports. Each call encodes one batch of
+rows into a bytes chunk, so an export never holds more than one batch.
+"""
+
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import Any, Iterable, Mapping, Sequence
+
+from pydantic_core import to_json
+
+from app.common.enums import ExportFormat
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: 'application/x-ndjson',
+    ExportFormat.CSV: 'text/csv; charset=utf-8',
+}
+
+
+def encode_ndjson(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    return b''.join(to_json(row) + b'\n' for row in rows)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CsvEncoder:
+    def __init__(self, fields: Sequence[str]):
+        self.fields = fields
+
+    def header(self) -> bytes:
+        return self._write([self.fields])
+
+    def encode(self, rows: Iterable[Mapping[str, Any]]) -> bytes:
+        return self._write([_csv_value(row[field]) for field in self.fields] for row in rows)
+
+    @staticmethod
+    def _write(lines: Iterable[Iterable[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(lines)
+        return buffer.getvalue().encode()
@@ -0,0 +1,41 @@
+"""
+http_cache.py (cross-feature)
+
+ETag / conditional GET helpers (RFC 9110 §8.8.3, §13.1.2).
+"""
+
+import hashlib
+from typing import Any
+
+from starlette import status
+from starlette.responses import Response
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from a cheap freshness fingerprint (e.g. a table's change counter)"""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """`If-None-Match` uses weak comparison: W/ prefixes are ignored, `*` matches anything"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str, max_age: int) -> dict[str, str]:
+    # public: shared caches (reverse proxy / CDN) may store it;
+    # must-revalidate: once stale, revalidate with If-None-Match (→ cheap 304)
+    return {
+        'ETag': etag,
+        'Cache-Control': f'public, max-age={max_age}, must-revalidate',
+    }
+
+
+def not_modified_response(headers: dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,93 @@
+"""
+pagination.py (cross-feature)
+
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, url-safe token holding the sort-key values of the
+last row of a page. The next page is fetched with
+`WHERE (key_1, ..., id) > (:v_1, ..., :id)` so every page costs the same
+index range scan, no matter how deep the client has paged (unlike OFFSET).
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from app.core.exceptions import InvalidQueryParameterException
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+
+@dataclass
+class CursorParams:
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[str] = None
+    # whitelisted sort key, '-' prefix for descending; a cursor is only valid for the sort it came from
+    sort: Optional[str] = None
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    limit: int = DEFAULT_PAGE_LIMIT
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass
+class SerializedCursorPage:
+    """A `CursorPage` whose items are already encoded as one JSON array"""
+    data_json: bytes
+    limit: int = DEFAULT_PAGE_LIMIT
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _from_json_value(value: Any, python_type: type) -> Any:
+    if value is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque cursor."""
+    raw = json.dumps([_to_json_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, python_types: Sequence[type]) -> tuple:
+    """Decode a cursor back into typed sort-key values, rejecting tampered tokens."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(python_types):
+            raise ValueError("cursor does not match the sort key")
+        return tuple(_from_json_value(value, tp) for value, tp in zip(values, python_types))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidQueryParameterException(message='Invalid pagination cursor') from e
@@ -0,0 +1,112 @@
+"""
+responses.py (cross-feature)
+
+Fast serialization path for `ApiResponseSchema` envelopes.
+
+Routes return an `ApiJSONResponse` instead of a bare `ApiResponseSchema`, so
+FastAPI skips its response_model re-validation and jsonable_encoder pass
+(`response_model` stays on the route for the OpenAPI docs only).
+
+The payload is encoded straight to bytes by a TypeAdapter compiled once per
+payload type, then spliced into an envelope rendered by `ApiResponseSchema`
+itself — the wire format is byte-for-byte what FastAPI produced before.
+"""
+
+import time
+from functools import lru_cache
+from typing import Any, Mapping
+
+from pydantic import TypeAdapter, BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+from app.core.api_response_schema import ApiResponseSchema
+from app.core.request_timing import current_timing
+
+_EnvelopeSchema = ApiResponseSchema[None]
+# `data` is the last envelope field, so a rendered envelope always ends like this
+_EMPTY_DATA_TAIL = b'null}'
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(data_type: Any) -> TypeAdapter:
+    """One compiled serializer per payload type, built on first use"""
+    return TypeAdapter(data_type)
+
+
+def dump_json(value: Any, data_type: Any) -> bytes:
+    timing = current_timing()
+    if timing is None:
+        return get_type_adapter(data_type).dump_json(value)
+    started_at = time.perf_counter()
+    try:
+        return get_type_adapter(data_type).dump_json(value)
+    finally:
+        timing.serialization_seconds += time.perf_counter() - started_at
+
+
+def render_api_response(
+        data_json: bytes = b'null',
+        *,
+        message: str,
+        success: bool = True,
+        extra_json: Mapping[str, bytes] | None = None,
+) -> bytes:
+    """
+    Render `{"success", "message", "timestamp", "data", **extra}` around an
+    already-encoded payload.
+    """
+    envelope = dump_json(_EnvelopeSchema(success=success, message=message), _EnvelopeSchema)
+    body = envelope[:-len(_EMPTY_DATA_TAIL)] + data_json
+    for key, value_json in (extra_json or {}).items():
+        body += b',"' + key.encode() + b'":' + value_json
+    return body + b'}'
+
+
+class ApiJSONResponse(Response):
+    media_type = 'application/json'
+
+    @classmethod
+    def from_json(
+            cls,
+            data_json: bytes = b'null',
+            *,
+            message: str,
+            success: bool = True,
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            background: BackgroundTask | None = None,
+            **extra: BaseModel,
+    ) -> 'ApiJSONResponse':
+        """Envelope around a pre-encoded payload; `extra` fields follow `data` (e.g. pagination)"""
+        content = render_api_response(
+            data_json,
+            message=message,
+            success=success,
+            extra_json={key: dump_json(value, type(value)) for key, value in extra.items()},
+        )
+        return cls(content=content, status_code=status_code, headers=headers, background=background)
+
+    @classmethod
+    def from_data(
+            cls,
+            data: Any,
+            data_type: Any,
+            *,
+            message: str,
+            success: bool = True,
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            background: BackgroundTask | None = None,
+            **extra: BaseModel,
+    ) -> 'ApiJSONResponse':
+        """Envelope around `data`, encoded with the cached serializer for `data_type`"""
+        return cls.from_json(
+            dump_json(data, data_type),
+            message=message,
+            success=success,
+            status_code=status_code,
+            headers=headers,
+            background=background,
+            **extra,
+        )
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Generic, TypeVar, Optional
+from typing import Generic, TypeVar, Optional, List
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -10,3 +10,13 @@ class ApiResponseSchema(BaseModel, Generic[T]):
     message: str = "Operation completed successfully"
     timestamp: datetime = Field(default_factory=lambda _: datetime.now(timezone.utc))
     data: Optional[T] = None
+
+
+class CursorPaginationSchema(BaseModel):
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class PaginatedApiResponseSchema(ApiResponseSchema[List[T]], Generic[T]):
+    pagination: CursorPaginationSchema
@@ -2,9 +2,12 @@ from urllib.parse import quote_plus
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.db.statement_cache import StatementCacheMode
+
 
 class Settings(BaseSettings):
-    SECRET_KEY: str
+    # HS256 signing secret; not needed with an asymmetric ALGORITHM
+    SECRET_KEY: str | None = None
     LOG_LEVEL: str
     ENVIRONMENT: str
     SHOW_SQL_LOG: bool = False
@@ -18,14 +21,64 @@ class Settings(BaseSettings):
     POOL_SIZE: int
     MAX_OVERFLOW: int
     POOL_TIMEOUT: int
+    # Pool checkouts waiting longer than this are logged (see /v1/metrics db_pool to size the pool)
+    DB_POOL_SLOW_CHECKOUT_MS: int = 100
+    # Prepared statement caching: direct | pooler_named | pooler (see app/db/statement_cache.py).
+    # `pooler` is safe behind any transaction-mode pooler; use `direct` on a direct connection
+    DB_STATEMENT_CACHE_MODE: StatementCacheMode = StatementCacheMode.POOLER
+    # Read replicas for read-only routes (JSON list of postgresql+asyncpg:// URLs); empty → primary only
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_HEALTH_CHECK_SECONDS: int = 5
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    # A replica further behind than this is skipped until it catches up
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    # After a write, the client's reads go to the primary for this long
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    # Send per-request DB / serialization timings to clients as a Server-Timing header
+    SERVER_TIMING_HEADER: bool = True
+    # Open pools / compile hot statements / build serializers before reporting ready
+    STARTUP_WARM_UP: bool = True
+    # On shutdown, how long in-flight requests may still finish before pools are disposed
+    SHUTDOWN_DRAIN_SECONDS: float = 10.0
+
+    # In-process grocery read cache (per worker); 0 disables it
+    GROCERY_CACHE_MAX_ENTRIES: int = 512
+    GROCERY_CACHE_TTL_SECONDS: int = 30
+    # Cache-Control max-age of public grocery GETs; clients/CDNs revalidate via ETag after it
+    GROCERY_HTTP_MAX_AGE: int = 0
+    # Monthly price history partitions created ahead of time on startup
+    PRICE_HISTORY_PARTITIONS_AHEAD: int = 2
 
     # Default to localhost for safety, but allow override via .env
     ALLOW_ORIGINS: list[str] = ["http://localhost:5173"]
 
     # JWT token settings
+    # HS256 (SECRET_KEY) or EdDSA / ES256 (key pair, see app/utils/jwt_keys.py)
     ALGORITHM: str = 'HS256'
+    # PEM private key; only processes that issue tokens need it
+    JWT_PRIVATE_KEY_FILE: str | None = None
+    # `kid` of the signing key; defaults to its JWK thumbprint
+    JWT_KEY_ID: str | None = None
+    # JWKS file of additional public keys trusted for verification (rotation, verify-only workers)
+    JWT_JWKS_FILE: str | None = None
+    # Verified token claims cached per worker until the token's `exp`; 0 disables it
+    JWT_CLAIMS_CACHE_MAX_ENTRIES: int = 4096
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 24 * 60
+    # How often each worker pulls refresh token revocations made by other workers
+    REFRESH_REVOCATION_SYNC_SECONDS: int = 5
+    # In-process cache of authenticated users (per worker); 0 disables it
+    AUTH_USER_CACHE_MAX_ENTRIES: int = 1024
+    AUTH_USER_CACHE_TTL_SECONDS: int = 60
+    # Take the user id / username claims of an access token at face value for
+    # its lifetime: no user lookup at all, but a deleted user keeps access
+    # until the token expires
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False
+    # Password hashing thread pool (per worker); 0 workers hashes on the event loop
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 5.0
 
     model_config = SettingsConfigDict(
         env_file=('.env', 'backend/.env'),
@@ -39,7 +92,6 @@ class Settings(BaseSettings):
         return (
             f"postgresql+asyncpg://{self.DB_USER}:{quote_plus(self.DB_PASSWORD)}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
-            f"?prepared_statement_cache_size=0"
         )
 
 
@@ -1,11 +1,13 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.exceptions import UnauthorizedException
 from app.core.security import oauth2_scheme
 from app.db.session import get_db as _get_db
-from app.features.auth.models import User
+from app.features.auth.cache import CurrentUser, user_cache, cache_user, record_trusted_claims
 from app.features.auth.repository import AuthRepository
+from app.features.auth.revocation import revoked_families
 from app.utils.jwt_helper import JWTHelper
 
 get_db = _get_db
@@ -14,13 +16,28 @@ get_db = _get_db
 async def get_current_user(
         token: str = Depends(oauth2_scheme),
         db: AsyncSession = Depends(get_db),
-) -> User:
-    user_email = JWTHelper.verify_token(token)
-    if user_email is None:
+) -> CurrentUser:
+    claims = JWTHelper.decode_token(token)
+    user_email = claims.get('sub')
+    if user_email is None or claims.get('type') != 'access':
         raise UnauthorizedException()
-    # Fetch fresh user from database (recommended)
+    if revoked_families.is_revoked(claims.get('fam')):
+        raise UnauthorizedException(message='Session revoked, please login again')
+
+    if settings.AUTH_TRUST_TOKEN_CLAIMS:
+        user = CurrentUser.from_claims(claims)
+        if user is not None:
+            record_trusted_claims()
+            return user
+
+    cached_user = user_cache.get(user_email)
+    if cached_user is not None:
+        return cached_user
+
+    # the session only checks out a connection here, on a cache miss
+    version = user_cache.version
     user = await AuthRepository(db).get_user_by_email(email=user_email)
     if user is None:
         raise UnauthorizedException()
 
-    return user
+    return cache_user(user, version)
@@ -1,7 +1,23 @@
 from fastapi import Request, FastAPI
+from sqlalchemy import exc as sa_exc
 from starlette.responses import JSONResponse
 
-from app.core.exceptions import AppBaseException
+from app.core.exceptions import AppBaseException, DatabasePoolTimeoutException
+
+
+def error_response(exc: AppBaseException) -> JSONResponse:
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={
+            'success': False,
+            "error": {
+                'error_code': exc.error_code,
+                'message': exc.message,
+                'detail': exc.detail,
+                'status': exc.status,
+            }
+        }
+    )
 
 
 def register_exception_handlers(app: FastAPI):
@@ -12,15 +28,11 @@ def register_exception_handlers(app: FastAPI):
 
     @app.exception_handler(AppBaseException)
     async def app_base_exception_handler(_request: Request, exc: AppBaseException):
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                'success': False,
-                "error": {
-                    'error_code': exc.error_code,
-                    'message': exc.message,
-                    'detail': exc.detail,
-                    'status': exc.status,
-                }
-            }
-        )
+        # repositories wrap SQLAlchemyError, an exhausted pool is still a 503
+        if isinstance(exc.__cause__, sa_exc.TimeoutError):
+            exc = DatabasePoolTimeoutException()
+        return error_response(exc)
+
+    @app.exception_handler(sa_exc.TimeoutError)
+    async def pool_timeout_handler(_request: Request, _exc: sa_exc.TimeoutError):
+        return error_response(DatabasePoolTimeoutException())
@@ -37,6 +37,13 @@ class InvalidUUIDException(AppBaseException):
     message = 'Provided UUID is invalid'
 
 
+class InvalidQueryParameterException(AppBaseException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    error_code = 'invalid_query_parameter'
+    detail = 'Invalid query parameter'
+    message = 'Provided query parameter is invalid'
+
+
 class ConflictException(AppBaseException):
     status_code = status.HTTP_409_CONFLICT
     error_code = 'conflict'
@@ -56,3 +63,15 @@ class DatabaseException(AppBaseException):
     error_code = 'database_error'
     detail = 'Database error'
     message = 'Database error'
+
+
+class ServiceUnavailableException(AppBaseException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    error_code = 'service_unavailable'
+    detail = 'Service unavailable'
+    message = 'Server is busy, please try again shortly'
+
+
+class DatabasePoolTimeoutException(ServiceUnavailableException):
+    error_code = 'database_pool_timeout'
+    detail = 'No database connection available'
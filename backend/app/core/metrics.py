@@ -0,0 +1,87 @@
+"""
+In-process metrics registry.
+
+Components register a zero-arg callable returning a JSON-able dict; the
+metrics endpoint snapshots all of them on request. Metrics are per worker
+process.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Sequence
+
+MetricsSource = Callable[[], dict[str, Any]]
+
+_sources: dict[str, MetricsSource] = {}
+
+
+def register_metrics_source(name: str, source: MetricsSource) -> None:
+    _sources[name] = source
+
+
+def collect_metrics() -> dict[str, dict[str, Any]]:
+    return {name: source() for name, source in _sources.items()}
+
+
+class LatencyRecorder:
+    """
+    Count / mean / max over the process lifetime plus p50 / p99 over the last
+    `window` samples. Safe to record from worker threads.
+    """
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._recent: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._recent.append(seconds)
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, total, maximum = self.count, self.total_seconds, self.max_seconds
+
+        def percentile(p: float) -> float:
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))] * 1000, 3) if recent else 0.0
+
+        return {
+            'count': count,
+            'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p99_ms': percentile(0.99),
+            'max_ms': round(maximum * 1000, 3),
+        }
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus style: cumulative `le` buckets plus
+    count and sum). Event-loop only, no locking.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.bounds = tuple(sorted(buckets)) + (math.inf,)
+        self._counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def stats(self) -> dict[str, Any]:
+        buckets, cumulative = {}, 0
+        for bound, count in zip(self.bounds, self._counts):
+            cumulative += count
+            buckets['+Inf' if bound == math.inf else f'{bound:g}'] = cumulative
+        return {'count': self.count, 'sum': round(self.sum, 6), 'buckets': buckets}
@@ -0,0 +1,80 @@
+"""
+Process lifecycle as seen by load balancers and orchestrators.
+
+    •	starting → lifespan startup is running (JWT keys, partitions, warm-up)
+    •	ready    → warm-up finished, requests are served
+    •	draining → shutdown began: new requests get 503, in-flight ones are
+    	awaited (up to SHUTDOWN_DRAIN_SECONDS) before pools are disposed
+
+`GET /api/v1/health/ready` answers 200 only while ready; in-flight requests
+are counted by `InFlightRequestMiddleware`.
+"""
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any
+
+from app.core.metrics import register_metrics_source
+
+
+class Phase(str, Enum):
+    STARTING = 'starting'
+    READY = 'ready'
+    DRAINING = 'draining'
+
+
+class Readiness:
+    def __init__(self):
+        self.phase = Phase.STARTING
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # step → seconds, filled by the warm-up
+        self.warm_up_seconds: dict[str, float] = {}
+        self.rejected_while_draining = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.phase is Phase.READY
+
+    @property
+    def draining(self) -> bool:
+        return self.phase is Phase.DRAINING
+
+    def mark_ready(self) -> None:
+        self.phase = Phase.READY
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self._idle.clear()
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+    async def drain(self, timeout_seconds: float) -> int:
+        """Stop taking requests and wait for the in-flight ones; returns how many were still running"""
+        self.phase = Phase.DRAINING
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                await self._idle.wait()
+        except TimeoutError:
+            pass
+        return self.in_flight
+
+    def record_warm_up_step(self, step: str, started_at: float) -> None:
+        self.warm_up_seconds[step] = round(time.perf_counter() - started_at, 3)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'phase': self.phase.value,
+            'in_flight': self.in_flight,
+            'warm_up_seconds': self.warm_up_seconds,
+            'rejected_while_draining': self.rejected_while_draining,
+        }
+
+
+readiness = Readiness()
+register_metrics_source('lifecycle', readiness.stats)
@@ -0,0 +1,99 @@
+"""
+Per-request SQL and serialization timing.
+
+`ServerTimingMiddleware` opens a `RequestTiming` for every request in a
+contextvar; the cursor hooks of `instrument_query_timing` add each statement
+and its duration to it, `dump_json` adds the time spent serializing. The
+totals become the response's `Server-Timing` header
+
+    Server-Timing: db;dur=4.2;desc="3 queries", serialize;dur=0.3, total;dur=9.8
+
+and fields of the request log line. Work outside a request (startup,
+background tasks) isn't tracked. Savepoints are transaction control, like the
+BEGIN / COMMIT asyncpg never sends through a cursor, so they aren't counted.
+
+`track_request` nests: an inner context adds its totals to the outer one on
+exit, so tests can wrap whole requests (see tests/conftest.py).
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_SAVEPOINT_STATEMENTS = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+@dataclass
+class RequestTiming:
+    statements: int = 0
+    db_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def add(self, other: 'RequestTiming') -> None:
+        self.statements += other.statements
+        self.db_seconds += other.db_seconds
+        self.serialization_seconds += other.serialization_seconds
+
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries", '
+            f'serialize;dur={self.serialization_seconds * 1000:.1f}, '
+            f'total;dur={self.total_seconds() * 1000:.1f}'
+        )
+
+    def log_fields(self) -> dict[str, Any]:
+        return {
+            'db_statements': self.statements,
+            'db_ms': round(self.db_seconds * 1000, 2),
+            'serialization_ms': round(self.serialization_seconds * 1000, 2),
+            'total_ms': round(self.total_seconds() * 1000, 2),
+        }
+
+
+_current_timing: ContextVar[RequestTiming | None] = ContextVar('request_timing', default=None)
+
+
+def current_timing() -> RequestTiming | None:
+    return _current_timing.get()
+
+
+@contextmanager
+def track_request() -> Iterator[RequestTiming]:
+    """Timing of everything run in this context (and the tasks it spawns) until exit"""
+    outer = _current_timing.get()
+    timing = RequestTiming()
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+        if outer is not None:
+            outer.add(timing)
+
+
+def _before_cursor_execute(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+    if _current_timing.get() is not None and not statement.startswith(_SAVEPOINT_STATEMENTS):
+        # on the execution context, so a failed statement leaves nothing behind
+        context.request_timing_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    timing = _current_timing.get()
+    started_at = getattr(context, 'request_timing_started_at', None)
+    if timing is not None and started_at is not None:
+        timing.statements += 1
+        timing.db_seconds += time.perf_counter() - started_at
+
+
+def instrument_query_timing(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
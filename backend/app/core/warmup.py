@@ -0,0 +1,141 @@
+"""
+Startup warm-up, run by the lifespan before the worker reports ready.
+
+Everything below is otherwise built lazily by the first requests after a
+deploy:
+
+    •	pools       → POOL_SIZE connections opened per engine (primary and
+    	replicas), each running the hot read statements once, so SQLAlchemy's
+    	compiled cache is filled and, in `direct` statement cache mode, every
+    	connection has them prepared
+    •	schemas     → the cached response serializers of every route and the
+    	OpenAPI schema (`custom_openapi`)
+    •	hashing     → the Argon2 backend and the hashing pool's threads
+
+A failing step is logged and skipped; the app still starts, just cold.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Iterator, List, Union, get_args, get_origin
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.pagination import CursorParams
+from app.common.responses import get_type_adapter
+from app.core.api_response_schema import ApiResponseSchema
+from app.core.config import settings
+from app.core.exceptions import AppBaseException
+from app.core.readiness import readiness
+from app.db.session import async_session_factory, replicas
+from app.features.auth.repository import AuthRepository
+from app.features.grocery.fieldsets import DETAIL_COLUMNS, LIST_COLUMNS
+from app.features.grocery.filters import GroceryFilterParams
+from app.features.grocery.repository import GroceryRepository
+from app.utils.hashing import hash_password, password_hash_executor
+
+logger = logging.getLogger(__name__)
+
+# never matches a row; only the statements matter
+_NIL_ID = UUID(int=0)
+
+
+async def _run_hot_reads(session: AsyncSession, include_auth: bool) -> None:
+    """The statements behind the list, detail, batch and (primary only) authentication paths"""
+    groceries = GroceryRepository(session)
+    await groceries.get_version()
+    await groceries.get_groceries(GroceryFilterParams(), CursorParams(), LIST_COLUMNS)
+    await groceries.get_updated_at(_NIL_ID)
+    await groceries.get_row_by_id(_NIL_ID, DETAIL_COLUMNS)
+    await groceries.get_rows_by_ids([_NIL_ID], DETAIL_COLUMNS)
+    if include_auth:
+        await AuthRepository(session).get_user_by_email('')
+
+
+async def _warm_connection(session_factory: async_sessionmaker[AsyncSession], include_auth: bool) -> None:
+    async with session_factory() as session:
+        await _run_hot_reads(session, include_auth)
+
+
+async def _warm_pool(session_factory: async_sessionmaker[AsyncSession], include_auth: bool) -> None:
+    # all sessions check out before any of them returns its connection, so
+    # each one opens (and prepares on) a connection of its own
+    await asyncio.gather(*[
+        _warm_connection(session_factory, include_auth) for _ in range(settings.POOL_SIZE)
+    ])
+
+
+async def warm_up_pools() -> None:
+    try:
+        await _warm_pool(async_session_factory, include_auth=True)
+    except (AppBaseException, OSError, SQLAlchemyError):
+        logger.exception('Could not warm up the primary pool')
+    for replica in replicas.replicas:
+        if not replica.healthy:
+            continue
+        try:
+            await _warm_pool(replica.session_factory, include_auth=False)
+        except (AppBaseException, OSError, SQLAlchemyError):
+            logger.exception(f'Could not warm up the pool of replica {replica.name}')
+
+
+def _is_envelope(response_model: Any) -> bool:
+    return isinstance(response_model, type) and issubclass(response_model, ApiResponseSchema)
+
+
+def _payload_types(route: APIRoute) -> Iterator[Any]:
+    """`data` types a route serializes: `Optional[List[Union[A, B]]]` → List[A], List[B]"""
+    data_type = route.response_model.model_fields['data'].annotation
+    for payload in get_args(data_type):
+        if payload is type(None):
+            continue
+        if get_origin(payload) is Union:
+            yield from get_args(payload)
+        elif get_origin(payload) is list and get_origin(get_args(payload)[0]) is Union:
+            yield from (List[item] for item in get_args(get_args(payload)[0]))
+        else:
+            yield payload
+
+
+def warm_up_schemas(app: FastAPI) -> None:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and _is_envelope(route.response_model):
+            for payload_type in _payload_types(route):
+                get_type_adapter(payload_type)
+            # envelope extras serialized next to `data` (e.g. pagination)
+            for name, field in route.response_model.model_fields.items():
+                if name not in ApiResponseSchema.model_fields:
+                    get_type_adapter(field.annotation)
+    app.openapi()
+
+
+async def warm_up_password_hashing() -> None:
+    # one call per thread, so every hashing thread is started
+    await asyncio.gather(*[
+        hash_password('warm-up') for _ in range(max(password_hash_executor.workers, 1))
+    ])
+
+
+async def warm_up(app: FastAPI) -> None:
+    started_at = time.perf_counter()
+    await warm_up_pools()
+    readiness.record_warm_up_step('pools', started_at)
+
+    step_started_at = time.perf_counter()
+    warm_up_schemas(app)
+    readiness.record_warm_up_step('schemas', step_started_at)
+
+    step_started_at = time.perf_counter()
+    try:
+        await warm_up_password_hashing()
+    except AppBaseException:
+        logger.exception('Could not warm up password hashing')
+    readiness.record_warm_up_step('password_hashing', step_started_at)
+
+    readiness.record_warm_up_step('total', started_at)
+    logger.info(f'Warm-up finished in {readiness.warm_up_seconds["total"]:.3f}s: {readiness.warm_up_seconds}')
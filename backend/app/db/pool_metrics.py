@@ -0,0 +1,123 @@
+"""
+Connection pool instrumentation, per engine (primary and each replica).
+
+    •	checkout wait  → histogram of the time a session waited for a pooled
+    	connection (including opening a new one); waits above
+    	DB_POOL_SLOW_CHECKOUT_MS are logged with the pool's state
+    •	timeouts       → checkouts that gave up after POOL_TIMEOUT; surfaced to
+    	clients as 503 `database_pool_timeout`
+    •	gauges         → size, checked out (and its peak), overflow in use,
+    	age of the oldest open connection
+    •	connection age → histogram of how long connections lived once closed
+
+Checkout wait needs a pool subclass — there is no "checkout requested"
+event — the rest comes from pool events.
+"""
+
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+CONNECTION_AGE_BUCKETS = (1, 10, 60, 300, 900, 1800, 3600, 4 * 3600, 24 * 3600)
+
+
+class PoolMetrics:
+    def __init__(self, name: str, engine: AsyncEngine, slow_checkout_seconds: float):
+        self.name = name
+        self.engine = engine
+        self.slow_checkout_seconds = slow_checkout_seconds
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self.connection_age = Histogram(CONNECTION_AGE_BUCKETS)
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.peak_checked_out = 0
+        # id(dbapi connection) → when it was opened
+        self._opened_at: dict[int, float] = {}
+
+    @property
+    def pool(self) -> AsyncAdaptedQueuePool:
+        # read through the engine: dispose() swaps in a fresh pool
+        return self.engine.sync_engine.pool
+
+    def record_checkout(self, wait_seconds: float, timed_out: bool) -> None:
+        self.checkout_wait.observe(wait_seconds)
+        pool = self.pool
+        if timed_out:
+            self.timeouts += 1
+            logger.error(
+                f'DB pool {self.name}: checkout timed out after {wait_seconds * 1000:.0f}ms ({pool.status()})'
+            )
+            return
+        self.peak_checked_out = max(self.peak_checked_out, pool.checkedout())
+        if wait_seconds >= self.slow_checkout_seconds:
+            self.slow_checkouts += 1
+            logger.warning(f'DB pool {self.name}: slow checkout {wait_seconds * 1000:.0f}ms ({pool.status()})')
+
+    def record_connect(self, dbapi_connection) -> None:
+        self._opened_at[id(dbapi_connection)] = time.monotonic()
+
+    def record_close(self, dbapi_connection) -> None:
+        opened_at = self._opened_at.pop(id(dbapi_connection), None)
+        if opened_at is not None:
+            self.connection_age.observe(time.monotonic() - opened_at)
+
+    def stats(self) -> dict[str, Any]:
+        pool = self.pool
+        oldest = min(self._opened_at.values(), default=None)
+        return {
+            'size': pool.size(),
+            'max_overflow': pool._max_overflow,
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            # overflow() counts down from -size while the pool is filling up
+            'overflow_in_use': max(pool.overflow(), 0),
+            'peak_checked_out': self.peak_checked_out,
+            'oldest_connection_age_seconds': round(time.monotonic() - oldest, 3) if oldest else None,
+            'timeouts': self.timeouts,
+            'slow_checkouts': self.slow_checkouts,
+            'checkout_wait_seconds': self.checkout_wait.stats(),
+            'connection_age_seconds': self.connection_age.stats(),
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports checkout waits to its `PoolMetrics`"""
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_checkout(time.perf_counter() - start, timed_out)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_engine(engine: AsyncEngine, name: str, slow_checkout_seconds: float) -> PoolMetrics:
+    """`engine` must have been created with `poolclass=InstrumentedPool`"""
+    metrics = PoolMetrics(name, engine, slow_checkout_seconds)
+    pool = engine.sync_engine.pool
+    pool.metrics = metrics
+    # pool event listeners carry over to the pool recreated by dispose()
+    event.listen(pool, 'connect', lambda dbapi_connection, _record: metrics.record_connect(dbapi_connection))
+    for close_event in ('close', 'close_detached'):
+        event.listen(pool, close_event, lambda dbapi_connection, *_: metrics.record_close(dbapi_connection))
+    return metrics
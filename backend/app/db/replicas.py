@@ -0,0 +1,131 @@
+"""
+Read replica routing.
+
+Read-only routes take their session from `get_read_db`, which picks the next
+healthy replica round-robin and falls back to the primary when:
+
+    •	no replica is configured (DB_REPLICA_URLS) or none is healthy
+    •	the client wrote recently ("read your writes"): every successful
+    	write response sets a short-lived cookie that pins the client's reads
+    	to the primary for READ_YOUR_WRITES_SECONDS, outlasting replica lag
+
+A replica is healthy while it answers the periodic health check within
+DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS and lags at most
+DB_REPLICA_MAX_LAG_SECONDS behind the primary.
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+
+READ_YOUR_WRITES_COOKIE = 'read_primary_until'
+
+# seconds behind the primary; 0 when every received WAL record is replayed
+# (an idle replica is current even though its last replay is old), NULL when
+# the server isn't a replica at all
+REPLICATION_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    healthy: bool = False
+    lag_seconds: float | None = None
+    reads: int = 0
+    failed_checks: int = 0
+
+
+class ReplicaSet:
+    def __init__(self, engines: list[AsyncEngine], max_lag_seconds: float, check_timeout_seconds: float):
+        self.replicas = [
+            Replica(
+                # same name as its pool in `db_pool`; the URL (host, database) never leaves the config
+                name=f'replica_{index}',
+                engine=engine,
+                session_factory=async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession),
+            )
+            for index, engine in enumerate(engines)
+        ]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self._round_robin = itertools.count()
+        self.primary_fallbacks = 0
+        self.pinned_reads = 0
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self) -> async_sessionmaker[AsyncSession] | None:
+        """Next healthy replica's session factory, None → use the primary"""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            self.primary_fallbacks += 1
+            return None
+        replica = healthy[next(self._round_robin) % len(healthy)]
+        replica.reads += 1
+        return replica.session_factory
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.check_timeout_seconds):
+                async with replica.engine.connect() as conn:
+                    lag = (await conn.execute(REPLICATION_LAG_SQL)).scalar_one()
+        except (OSError, SQLAlchemyError, TimeoutError):
+            replica.healthy = False
+            replica.lag_seconds = None
+            replica.failed_checks += 1
+            return
+        replica.lag_seconds = float(lag) if lag is not None else None
+        replica.healthy = replica.lag_seconds is None or replica.lag_seconds <= self.max_lag_seconds
+
+    async def check_health(self) -> None:
+        await asyncio.gather(*[self._check(replica) for replica in self.replicas])
+
+    async def dispose(self) -> None:
+        await asyncio.gather(*[replica.engine.dispose() for replica in self.replicas])
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'replicas': {
+                replica.name: {
+                    'healthy': replica.healthy,
+                    'lag_seconds': replica.lag_seconds,
+                    'reads': replica.reads,
+                    'failed_checks': replica.failed_checks,
+                }
+                for replica in self.replicas
+            },
+            'primary_fallbacks': self.primary_fallbacks,
+            'pinned_reads': self.pinned_reads,
+        }
+
+
+def reads_pinned_to_primary(request: Request) -> bool:
+    """
+    True while the client's read-your-writes window (set by its last write) is
+    open. The cookie is client-controlled, so a deadline further out than one
+    window from now is ignored rather than pinning every read to the primary.
+    """
+    try:
+        read_primary_until = float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0))
+    except ValueError:
+        return False
+    now = time.time()
+    return now < read_primary_until <= now + settings.READ_YOUR_WRITES_SECONDS
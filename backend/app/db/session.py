@@ -1,21 +1,35 @@
 from typing import Any, AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.core.request_timing import instrument_query_timing
+from app.db.pool_metrics import InstrumentedPool, PoolMetrics, instrument_engine
+from app.db.replicas import ReplicaSet, reads_pinned_to_primary
+from app.db.statement_cache import statement_cache_connect_args
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.SHOW_SQL_LOG,
-    future=True,
-    pool_size=settings.POOL_SIZE,
-    max_overflow=settings.MAX_OVERFLOW,
-    pool_timeout=settings.POOL_TIMEOUT,
-    connect_args={
-        "prepared_statement_cache_size": 0,
-        "statement_cache_size": 0
-    }
-)
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def _create_engine(url: str, name: str):
+    engine = create_async_engine(
+        url,
+        echo=settings.SHOW_SQL_LOG,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.POOL_SIZE,
+        max_overflow=settings.MAX_OVERFLOW,
+        pool_timeout=settings.POOL_TIMEOUT,
+        connect_args=statement_cache_connect_args(settings.DB_STATEMENT_CACHE_MODE),
+    )
+    pool_metrics[name] = instrument_engine(engine, name, settings.DB_POOL_SLOW_CHECKOUT_MS / 1000)
+    instrument_query_timing(engine)
+    return engine
+
+
+engine = _create_engine(settings.DATABASE_URL, 'primary')
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -23,7 +37,28 @@ async_session_factory = async_sessionmaker(
     class_=AsyncSession
 )
 
+# optional read replicas, each with its own pool
+replicas = ReplicaSet(
+    [_create_engine(url, f'replica_{index}') for index, url in enumerate(settings.DB_REPLICA_URLS)],
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_timeout_seconds=settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS,
+)
+register_metrics_source('db_replicas', replicas.stats)
+register_metrics_source('db_pool', lambda: {name: metrics.stats() for name, metrics in pool_metrics.items()})
+
 
 async def get_db() -> AsyncGenerator[AsyncSession | Any, Any]:
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession | Any, Any]:
+    """Session for read-only work: a healthy replica when possible, else the primary"""
+    session_factory = None
+    if replicas.configured:
+        if reads_pinned_to_primary(request):
+            replicas.pinned_reads += 1
+        else:
+            session_factory = replicas.pick()
+    async with (session_factory or async_session_factory)() as session:
+        yield session
@@ -0,0 +1,48 @@
+"""
+asyncpg prepared statement settings per connection topology
+(DB_STATEMENT_CACHE_MODE), shared by the app engine and Alembic.
+
+    •	direct       → straight to Postgres (or a session-mode pooler): every
+    	               statement is prepared once per connection and reused, so
+    	               Postgres parses and plans it once, not on every execution
+    •	pooler_named → transaction-mode pooler that tracks prepared statements
+    	               (PgBouncer >= 1.21 with max_prepared_statements > 0): the
+    	               same caching, with globally unique statement names so two
+    	               clients sharing a server connection can't collide
+    •	pooler       → transaction-mode pooler without prepared statement
+    	               support: nothing is cached, statements use unique
+    	               names and are re-prepared on every execution
+"""
+
+from enum import Enum
+from typing import Any
+from uuid import uuid4
+
+# asyncpg's default per-connection LRU size
+STATEMENT_CACHE_SIZE = 100
+
+
+class StatementCacheMode(str, Enum):
+    DIRECT = 'direct'
+    POOLER_NAMED = 'pooler_named'
+    POOLER = 'pooler'
+
+
+def unique_statement_name() -> str:
+    return f'__asyncpg_{uuid4().hex}__'
+
+
+def statement_cache_connect_args(mode: StatementCacheMode | str) -> dict[str, Any]:
+    """`connect_args` for create_async_engine / async_engine_from_config"""
+    mode = StatementCacheMode(mode)
+    if mode == StatementCacheMode.DIRECT:
+        return {
+            'prepared_statement_cache_size': STATEMENT_CACHE_SIZE,
+            'statement_cache_size': STATEMENT_CACHE_SIZE,
+        }
+    cache_size = STATEMENT_CACHE_SIZE if mode == StatementCacheMode.POOLER_NAMED else 0
+    return {
+        'prepared_statement_cache_size': cache_size,
+        'statement_cache_size': cache_size,
+        'prepared_statement_name_func': unique_statement_name,
+    }
@@ -0,0 +1,85 @@
+"""
+cache.py (feature scoped)
+
+In-process cache of authenticated users, keyed by email (the token subject),
+so protected routes don't pay a `user` lookup — and a pooled connection —
+on every request. Populated on login, token refresh and cache misses.
+
+Any change to a `User` row made through the ORM (update or delete) bumps
+the cache version, dropping every cached user at once; users change rarely,
+so the next request per user simply reloads. Other workers converge within
+AUTH_USER_CACHE_TTL_SECONDS.
+
+Only ORM flushes fire those events: a Core `update(User)` / `delete(User)`
+statement (or a change made outside the app) is not seen, and cached users
+stay stale for up to AUTH_USER_CACHE_TTL_SECONDS unless the code issuing it
+calls `user_cache.bump_version()` itself.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.common.cache import VersionedTTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.features.auth.models import User
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """The authenticated user as seen by route handlers (no password hash, not bound to a session)"""
+    id: UUID
+    email: str
+    username: str
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(id=user.id, email=user.email, username=user.username)
+
+    @classmethod
+    def from_claims(cls, claims: Mapping[str, Any]) -> "CurrentUser | None":
+        """None for tokens issued without the user claims"""
+        if not claims.get('uid') or not claims.get('name'):
+            return None
+        return cls(id=UUID(claims['uid']), email=claims['sub'], username=claims['name'])
+
+
+user_cache = VersionedTTLCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+_claim_stats = {'trusted_claims': 0}
+
+
+def cache_user(user: User, version: int | None = None) -> CurrentUser:
+    """
+    Cache `user` and return its snapshot. Pass the `user_cache.version` read
+    before loading `user`, so a change racing with the load is never cached.
+    """
+    current_user = CurrentUser.from_user(user)
+    user_cache.set(current_user.email, current_user, version)
+    return current_user
+
+
+def record_trusted_claims() -> None:
+    _claim_stats['trusted_claims'] += 1
+
+
+def user_cache_stats() -> dict[str, Any]:
+    return {
+        **user_cache.stats(),
+        'trust_token_claims': settings.AUTH_TRUST_TOKEN_CLAIMS,
+        **_claim_stats,
+    }
+
+
+register_metrics_source('auth_user_cache', user_cache_stats)
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_cached_users(_mapper, _connection, _target) -> None:
+    user_cache.bump_version()
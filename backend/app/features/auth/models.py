@@ -1,4 +1,7 @@
-from sqlalchemy import String
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import String, DateTime, ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -26,3 +29,45 @@ class User(Base, BaseModelMixin):
 
     def __repr__(self):
         return f"<User {self.username}> {self.email}> is created."
+
+
+class RefreshToken(Base):
+    """
+    One row per issued refresh token (`jti`). Every token of a login session
+    shares its `family_id`; a refresh marks the presented token used and adds
+    its successor. Presenting a used token again means it leaked, and revokes
+    the whole family.
+    """
+    __tablename__ = "refresh_token"
+    __table_args__ = (
+        Index('ix_refresh_token_family_id', 'family_id'),
+        # ON DELETE CASCADE lookups
+        Index('ix_refresh_token_user_id', 'user_id'),
+        # incremental sync of the in-memory revoked family set
+        Index('ix_refresh_token_revoked_at', 'revoked_at', postgresql_where=text('revoked_at IS NOT NULL')),
+    )
+
+    jti: Mapped[UUID] = mapped_column(
+        primary_key=True
+    )
+    family_id: Mapped[UUID] = mapped_column(
+        nullable=False
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey('user.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+    used_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    revoked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now()
+    )
@@ -1,7 +1,10 @@
-from sqlalchemy import select
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, insert, update, delete, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.features.auth.models import User
+from app.features.auth.models import User, RefreshToken
 
 
 class AuthRepository:
@@ -17,3 +20,76 @@ class AuthRepository:
         self.session.add(user)
         await self.session.commit()
         return user
+
+    async def add_refresh_token(self, jti: UUID, family_id: UUID, user_id: UUID, expires_at: datetime) -> None:
+        stmt = insert(RefreshToken).values(jti=jti, family_id=family_id, user_id=user_id, expires_at=expires_at)
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def rotate_refresh_token(self, jti: UUID, new_jti: UUID, expires_at: datetime) -> UUID | None:
+        """
+        Mark `jti` used and record its successor in ONE statement. Returns the
+        family id, or None when `jti` is unknown, already used, revoked or expired.
+        The row lock taken by the UPDATE makes concurrent refreshes of the
+        same token race to exactly one winner.
+        """
+        used = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.jti == jti,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(used_at=func.now())
+            .returning(RefreshToken.family_id, RefreshToken.user_id)
+            .cte('used')
+        )
+        stmt = (
+            insert(RefreshToken)
+            .from_select(
+                ['jti', 'family_id', 'user_id', 'expires_at'],
+                select(
+                    literal(new_jti, RefreshToken.jti.type),
+                    used.c.family_id,
+                    used.c.user_id,
+                    literal(expires_at, RefreshToken.expires_at.type),
+                ),
+            )
+            .returning(RefreshToken.family_id)
+        )
+        family_id = (await self.session.execute(stmt)).scalar_one_or_none()
+        await self.session.commit()
+        return family_id
+
+    async def revoke_refresh_token_family(self, family_id: UUID) -> datetime | None:
+        """Revoke every token of the family; returns when its last token expires (None: unknown family)"""
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=func.now())
+            .returning(RefreshToken.expires_at)
+        )
+        expiries = (await self.session.execute(stmt)).scalars().all()
+        await self.session.commit()
+        if expiries:
+            return max(expiries)
+        stmt = select(func.max(RefreshToken.expires_at)).where(RefreshToken.family_id == family_id)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def get_revoked_refresh_token_families(self, since: datetime) -> tuple[list[tuple[UUID, datetime]], datetime]:
+        """Families revoked at or after `since` that still have unexpired tokens, and the DB time of the read"""
+        read_at = (await self.session.execute(select(func.now()))).scalar_one()
+        stmt = (
+            select(RefreshToken.family_id, func.max(RefreshToken.expires_at))
+            .where(RefreshToken.revoked_at >= since, RefreshToken.expires_at > func.now())
+            .group_by(RefreshToken.family_id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(family_id, expires_at) for family_id, expires_at in rows], read_at
+
+    async def delete_expired_refresh_tokens(self) -> int:
+        stmt = delete(RefreshToken).where(RefreshToken.expires_at < func.now())
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount
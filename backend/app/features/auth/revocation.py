@@ -0,0 +1,71 @@
+"""
+revocation.py (feature scoped)
+
+In-memory set of revoked refresh token families, so the revocation check on
+every refresh and every protected request is a dict lookup, never a query.
+
+The set is exact, not probabilistic: a family only matters until its last
+refresh token expires, so it holds the families revoked within the last
+REFRESH_TOKEN_EXPIRE_MINUTES — small enough that a Bloom filter in front of
+it would save nothing and add false positives to confirm.
+
+Revocations made by this worker land in it immediately; the ones made by
+other workers are pulled from Postgres every REFRESH_REVOCATION_SYNC_SECONDS
+(`revoked_at` index, incremental from the last sync).
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+from uuid import UUID
+
+from app.core.metrics import register_metrics_source
+
+# rows are stamped with their transaction's start time, so a sync also
+# re-reads a little before the previous one to catch late commits
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class RevokedFamilies:
+    def __init__(self):
+        # family id → expiry (epoch seconds) of its last refresh token
+        self._families: dict[str, float] = {}
+        self.synced_until: datetime | None = None
+        self.syncs = 0
+        self.rejections = 0
+
+    def is_revoked(self, family_id: str | None) -> bool:
+        if family_id is None or family_id not in self._families:
+            return False
+        self.rejections += 1
+        return True
+
+    def add(self, family_id: UUID | str, expires_at: datetime) -> None:
+        family_id = str(family_id)
+        self._families[family_id] = max(self._families.get(family_id, 0.0), expires_at.timestamp())
+
+    def apply_sync(self, rows: Iterable[tuple[UUID, datetime]], synced_at: datetime) -> None:
+        for family_id, expires_at in rows:
+            self.add(family_id, expires_at)
+        now = time.time()
+        self._families = {family: expiry for family, expiry in self._families.items() if expiry > now}
+        self.synced_until = synced_at
+        self.syncs += 1
+
+    def sync_since(self) -> datetime:
+        """Lower bound of `revoked_at` for the next sync (full load on the first one)"""
+        if self.synced_until is None:
+            return datetime.fromtimestamp(0, timezone.utc)
+        return self.synced_until - SYNC_OVERLAP
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            'families': len(self._families),
+            'syncs': self.syncs,
+            'synced_until': self.synced_until.isoformat() if self.synced_until else None,
+            'rejections': self.rejections,
+        }
+
+
+revoked_families = RevokedFamilies()
+register_metrics_source('refresh_token_revocations', revoked_families.stats)
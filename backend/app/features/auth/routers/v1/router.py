@@ -2,7 +2,9 @@ from typing import Annotated
 
 from fastapi import APIRouter, status, Depends
 from fastapi import Body
+from fastapi.responses import JSONResponse
 
+from app.common.responses import ApiJSONResponse
 from app.core.api_response_schema import ApiResponseSchema
 from app.features.auth.dependencies import get_auth_service
 from app.features.auth.schemas import (
@@ -14,6 +16,7 @@ from app.features.auth.schemas import (
     TokenRefreshRequestSchema,
 )
 from app.features.auth.service import AuthService
+from app.utils.jwt_keys import get_key_ring
 
 router = APIRouter(
     prefix="/v1/auth",
@@ -33,10 +36,11 @@ async def create_user(
 
 ):
     response = await auth_service.register_user(data)
-    return ApiResponseSchema(
-        success=True,
-        data=response,
+    return ApiJSONResponse.from_data(
+        response,
+        UserCreateResponseSchema,
         message='User created successfully',
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -51,9 +55,9 @@ async def login_user(
         auth_service: AuthService = Depends(get_auth_service)
 ):
     response = await auth_service.authenticate_user(data)
-    return ApiResponseSchema(
-        success=True,
-        data=response,
+    return ApiJSONResponse.from_data(
+        response,
+        LoginResponseSchema,
         message='Login successful',
     )
 
@@ -69,8 +73,35 @@ async def token_refresh(
         auth_service: AuthService = Depends(get_auth_service)
 ):
     response = await auth_service.refresh_token(data)
-    return ApiResponseSchema(
-        success=True,
-        data=response,
+    return ApiJSONResponse.from_data(
+        response,
+        TokenRefreshResponseSchema,
         message='Token refreshed successfully',
     )
+
+
+@router.post(
+    '/logout',
+    response_model=ApiResponseSchema[None],
+    summary='Revoke a session (its refresh token and every token rotated from it)',
+    status_code=status.HTTP_200_OK
+)
+async def logout(
+        data: Annotated[TokenRefreshRequestSchema, Body()],
+        auth_service: AuthService = Depends(get_auth_service)
+):
+    await auth_service.logout(data)
+    return ApiJSONResponse.from_json(
+        message='Logged out successfully',
+    )
+
+
+@router.get(
+    '/jwks',
+    summary='Public keys that verify access and refresh tokens (JWKS)',
+    status_code=status.HTTP_200_OK
+)
+async def get_jwks():
+    # plain JWKS document (no envelope) so standard JWT libraries can consume it;
+    # empty with HS256, whose secret is never published
+    return JSONResponse({'keys': get_key_ring().public_jwks})
@@ -10,9 +10,6 @@ class UserCreateResponseSchema(BaseModel):
 
     model_config = ConfigDict(
         from_attributes=True,
-        json_encoders={
-            UUID: lambda x: str(x)
-        }
     )
 
 
@@ -1,8 +1,12 @@
 import logging
+from datetime import datetime
+from uuid import UUID, uuid4
 
 from app.core.exceptions import ConflictException, UnauthorizedException
+from app.features.auth.cache import CurrentUser, user_cache, cache_user
 from app.features.auth.models import User
 from app.features.auth.repository import AuthRepository
+from app.features.auth.revocation import revoked_families
 from app.features.auth.schemas import (
     UserCreateRequestSchema,
     UserCreateResponseSchema,
@@ -31,27 +35,33 @@ class AuthService:
         return User(**values)
 
     @staticmethod
-    def __prepare_token(email: str, username:str) -> LoginResponseSchema:
-        access_token = JWTHelper.create_access_token(email)
-        refresh_token = JWTHelper.create_refresh_token(email)
-        data = {
+    def __prepare_token_data(user: User | CurrentUser, jti: UUID, family_id: UUID, expires_at: datetime) -> dict:
+        # uid / name let get_current_user skip the user lookup when AUTH_TRUST_TOKEN_CLAIMS is on,
+        # fam lets it reject access tokens of a revoked session
+        access_token = JWTHelper.create_access_token(
+            user.email, {'uid': str(user.id), 'name': user.username, 'fam': str(family_id)}
+        )
+        refresh_token = JWTHelper.create_refresh_token(
+            user.email, {'jti': str(jti), 'fam': str(family_id)}, expires_at
+        )
+        return {
             "access_token": access_token,
             "refresh_token": refresh_token,
-            "user_email": email,
-            "username": username,
+            "user_email": user.email,
+            "username": user.username,
         }
-        return LoginResponseSchema.model_validate(data)
 
     @staticmethod
-    def __prepare_refresh_token(email: str) -> TokenRefreshResponseSchema:
-        access_token = JWTHelper.create_access_token(email)
-        refresh_token = JWTHelper.create_refresh_token(email)
-        data = {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "user_email": email,
-        }
-        return TokenRefreshResponseSchema.model_validate(data)
+    def __refresh_token_claims(refresh_token: str) -> dict:
+        claims = JWTHelper.decode_token(refresh_token)
+        if claims.get('type') != 'refresh' or not claims.get('jti') or not claims.get('fam'):
+            raise UnauthorizedException(message='Invalid token, please login again')
+        return claims
+
+    async def __revoke_family(self, family_id: UUID) -> None:
+        expires_at = await self.repo.revoke_refresh_token_family(family_id)
+        if expires_at is not None:
+            revoked_families.add(family_id, expires_at)
 
     # ───────────────────────────────────────────────
     # API methods
@@ -65,29 +75,63 @@ class AuthService:
             logger.debug('User already exists')
             raise ConflictException(message='User already exists')
 
-        hashed_password = hash_password(payload.password)
+        hashed_password = await hash_password(payload.password)
         user = self.__prepare_user(payload, hashed_password)
         created_user = await self.repo.create_user(user)
         return UserCreateResponseSchema.model_validate(created_user)
 
     async def authenticate_user(self, payload: LoginRequestSchema) -> LoginResponseSchema:
         """User login api"""
+        version = user_cache.version
         user = await self.repo.get_user_by_email(payload.email)
-        if not user or not verify_password(payload.password, user.password):
+        if not user or not await verify_password(payload.password, user.password):
             raise UnauthorizedException()
 
-        return self.__prepare_token(user.email, user.username)
+        # the first protected request after login is then served from the cache
+        cache_user(user, version)
+        jti, family_id, expires_at = uuid4(), uuid4(), JWTHelper.refresh_token_expiry()
+        await self.repo.add_refresh_token(jti, family_id, user.id, expires_at)
+        return LoginResponseSchema.model_validate(self.__prepare_token_data(user, jti, family_id, expires_at))
 
     async def refresh_token(self, payload: TokenRefreshRequestSchema) -> TokenRefreshResponseSchema:
         """
         Validate old refresh token and issue new access + refresh tokens.
-        Uses token rotation (new refresh token each time).
+        Uses token rotation (new refresh token each time): presenting an
+        already rotated token revokes the whole session (token family).
         """
-        email = JWTHelper.verify_token(payload.refresh_token)
-        if not email:
-            raise UnauthorizedException()
-        user = await self.repo.get_user_by_email(email)
-        if not user:
-            raise UnauthorizedException()
+        claims = self.__refresh_token_claims(payload.refresh_token)
+        if revoked_families.is_revoked(claims['fam']):
+            raise UnauthorizedException(message='Session revoked, please login again')
+
+        email = claims['sub']
+        user = user_cache.get(email)
+        if user is None:
+            version = user_cache.version
+            db_user = await self.repo.get_user_by_email(email)
+            if not db_user:
+                raise UnauthorizedException()
+            user = cache_user(db_user, version)
+
+        jti, expires_at = uuid4(), JWTHelper.refresh_token_expiry()
+        family_id = await self.repo.rotate_refresh_token(UUID(claims['jti']), jti, expires_at)
+        if family_id is None:
+            # used, revoked or unknown: a used token coming back means it leaked
+            logger.warning(f"Refresh token reuse detected, revoking session {claims['fam']}")
+            await self.__revoke_family(UUID(claims['fam']))
+            raise UnauthorizedException(message='Session revoked, please login again')
+
+        return TokenRefreshResponseSchema.model_validate(self.__prepare_token_data(user, jti, family_id, expires_at))
+
+    async def logout(self, payload: TokenRefreshRequestSchema) -> None:
+        """Revoke the refresh token's session: its refresh and access tokens stop working"""
+        claims = self.__refresh_token_claims(payload.refresh_token)
+        await self.__revoke_family(UUID(claims['fam']))
+
+    async def sync_revoked_families(self) -> None:
+        """Pull revocations made by other workers into the in-memory set"""
+        rows, read_at = await self.repo.get_revoked_refresh_token_families(revoked_families.sync_since())
+        revoked_families.apply_sync(rows, read_at)
 
-        return self.__prepare_refresh_token(email)
+    async def delete_expired_refresh_tokens(self) -> None:
+        deleted = await self.repo.delete_expired_refresh_tokens()
+        logger.info(f'Deleted {deleted} expired refresh tokens')
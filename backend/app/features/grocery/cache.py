@@ -0,0 +1,62 @@
+"""
+cache.py (feature scoped)
+
+Read-through cache of serialized grocery list/detail payloads.
+
+Every grocery write bumps the cache version, so a worker never serves its
+own stale data; other workers converge within GROCERY_CACHE_TTL_SECONDS.
+
+List and detail entries carry the ETag they were served with, so a hit
+answers both the conditional check and the body without touching the DB.
+"""
+
+from dataclasses import astuple, dataclass
+from typing import Any, Hashable, Sequence
+from uuid import UUID
+
+from app.common.cache import VersionedTTLCache
+from app.common.pagination import CursorParams
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.features.grocery.filters import GroceryFilterParams
+
+grocery_response_cache = VersionedTTLCache(
+    max_entries=settings.GROCERY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.GROCERY_CACHE_TTL_SECONDS,
+)
+register_metrics_source('grocery_response_cache', grocery_response_cache.stats)
+
+
+@dataclass(frozen=True)
+class TaggedResponse:
+    """
+    A list page's or item's ETag, plus its serialized body when it came from the cache.
+    `version` is the cache version read *before* the ETag was computed, so a
+    body loaded after a racing write is never cached under the older ETag.
+    """
+    etag: str
+    version: int
+    body: Any = None
+
+
+def list_cache_key(
+        filters: GroceryFilterParams | None,
+        pagination: CursorParams | None,
+        fields: Sequence[str] | None,
+) -> Hashable:
+    filters = filters or GroceryFilterParams()
+    pagination = pagination or CursorParams()
+    # search is case-insensitive end to end, so 'Rice' and 'rice' share an entry
+    normalized_filters = GroceryFilterParams(**{
+        **vars(filters),
+        'search': filters.search.lower() if filters.search else None,
+    })
+    return 'list', astuple(normalized_filters), astuple(pagination), tuple(fields or ())
+
+
+SHOPPING_LIST_CACHE_KEY = ('shopping-list',)
+SUMMARY_CACHE_KEY = ('summary',)
+
+
+def detail_cache_key(grocery_id: UUID, fields: Sequence[str] | None) -> Hashable:
+    return 'detail', grocery_id, tuple(fields or ())
@@ -8,11 +8,15 @@ Feature-specific DI:
 
 from typing import Optional
 
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.enums import GroceryType, Seller, GroceryCategory
-from app.db.session import get_db
+from app.common.enums import GroceryType, Seller, GroceryCategory, GroceryStockStatus, GrocerySort
+from app.common.pagination import CursorParams, DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.core.exceptions import InvalidQueryParameterException
+from app.db.replicas import reads_pinned_to_primary
+from app.db.session import get_db, get_read_db
+from app.features.grocery.fieldsets import LIST_FIELDS, DETAIL_FIELDS, parse_fields
 from app.features.grocery.filters import GroceryFilterParams
 from app.features.grocery.repository import GroceryRepository  # adjust path
 from app.features.grocery.service import GroceryService
@@ -26,12 +30,27 @@ def get_grocery_service(repo: GroceryRepository = Depends(get_grocery_repository
     return GroceryService(repo)
 
 
+def get_grocery_read_repository(db: AsyncSession = Depends(get_read_db)):
+    """Repository on a read replica when one is available — read-only routes only"""
+    return GroceryRepository(db)
+
+
+def get_grocery_read_service(
+        request: Request,
+        repo: GroceryRepository = Depends(get_grocery_read_repository),
+):
+    # a client inside its read-your-writes window skips cached payloads, which
+    # may have been read from a replica that hasn't caught up with its write
+    return GroceryService(repo, read_cache=not reads_pinned_to_primary(request))
+
+
 def get_grocery_filters(
         type: Optional[GroceryType] = Query(default=None, description="Filter by grocery type"),
         current_seller: Optional[Seller] = Query(default=None, description="Filter by current seller"),
         best_seller: Optional[Seller] = Query(default=None, description="Filter by best seller"),
         category: Optional[GroceryCategory] = Query(default=None, description="Filter by category"),
         should_include: Optional[bool] = Query(default=None, description="Filter by should-include flag"),
+        stock_status: Optional[GroceryStockStatus] = Query(default=None, description="Filter by stock status"),
         search: Optional[str] = Query(default=None, min_length=1, description="Free text search across fields"),
 ) -> GroceryFilterParams:
     return GroceryFilterParams(
@@ -40,5 +59,44 @@ def get_grocery_filters(
         best_seller=best_seller,
         category=category,
         should_include=should_include,
+        stock_status=stock_status,
         search=search,
     )
+
+
+def get_grocery_pagination(
+        limit: int = Query(default=DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Page size"),
+        cursor: Optional[str] = Query(default=None, description="Opaque cursor from the previous page's next_cursor"),
+        sort: Optional[GrocerySort] = Query(
+            default=None,
+            description="Sort key, '-' prefix for descending. Default: name (relevance when searching)",
+        ),
+) -> CursorParams:
+    return CursorParams(limit=limit, cursor=cursor, sort=sort.value if sort else None)
+
+
+def get_grocery_list_fields(
+        fields: Optional[str] = Query(
+            default=None,
+            description=f"Comma-separated fields to return. One of: {', '.join(LIST_FIELDS)}",
+        ),
+) -> tuple[str, ...] | None:
+    return parse_fields(fields, LIST_FIELDS)
+
+
+def get_grocery_detail_fields(
+        fields: Optional[str] = Query(
+            default=None,
+            description=f"Comma-separated fields to return. One of: {', '.join(DETAIL_FIELDS)}",
+        ),
+) -> tuple[str, ...] | None:
+    return parse_fields(fields, DETAIL_FIELDS)
+
+
+def get_grocery_batch_ids(
+        ids: str = Query(description=f"Comma-separated grocery ids, at most {MAX_PAGE_LIMIT}"),
+) -> list[str]:
+    grocery_ids = [grocery_id.strip() for grocery_id in ids.split(',') if grocery_id.strip()]
+    if not grocery_ids or len(grocery_ids) > MAX_PAGE_LIMIT:
+        raise InvalidQueryParameterException(message=f'Provide between 1 and {MAX_PAGE_LIMIT} ids')
+    return grocery_ids
@@ -0,0 +1,60 @@
+"""
+fieldsets.py (feature scoped)
+
+Sparse fieldsets for the `?fields=` query param on the list/detail routes.
+
+The repository selects only the columns a fieldset needs (plain Core rows,
+no ORM identity map); this module maps the requested response fields to
+those columns and projects each row back into a response dict.
+"""
+
+from typing import Mapping, Any, Optional, Sequence
+
+from app.core.exceptions import InvalidQueryParameterException
+from app.features.grocery.schemas.response_schemas import (
+    GroceryListResponseSchema,
+    GroceryDetailResponseSchema,
+    compute_stock_status,
+)
+
+STOCK_STATUS_FIELD = 'stock_status'
+STOCK_STATUS_COLUMNS = ('quantity_in_stock', 'low_stock_threshold')
+
+# columns needed to build the full (non-sparse) response schemas
+LIST_COLUMNS = tuple(GroceryListResponseSchema.model_fields)
+DETAIL_COLUMNS = tuple(GroceryDetailResponseSchema.model_fields)
+
+LIST_FIELDS = LIST_COLUMNS + (STOCK_STATUS_FIELD,)
+DETAIL_FIELDS = DETAIL_COLUMNS + (STOCK_STATUS_FIELD,)
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str]) -> tuple[str, ...] | None:
+    """'name, brand,name' → ('name', 'brand'); None means the full schema"""
+    if raw is None:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in raw.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in allowed]
+    if not fields or unknown:
+        raise InvalidQueryParameterException(
+            message=f"Invalid fields: {', '.join(unknown) or 'none given'}. Allowed: {', '.join(allowed)}"
+        )
+    return fields
+
+
+def columns_for(fields: Sequence[str]) -> tuple[str, ...]:
+    """DB columns to select for a fieldset (stock_status is derived from two columns)"""
+    columns = [field for field in fields if field != STOCK_STATUS_FIELD]
+    if STOCK_STATUS_FIELD in fields:
+        columns.extend(STOCK_STATUS_COLUMNS)
+    return tuple(dict.fromkeys(columns))
+
+
+def project(row: Mapping[str, Any], fields: Sequence[str]) -> dict[str, Any]:
+    """Build the sparse response item, keeping the requested field order"""
+    return {
+        field: (
+            compute_stock_status(row['quantity_in_stock'], row['low_stock_threshold'])
+            if field == STOCK_STATUS_FIELD else row[field]
+        )
+        for field in fields
+    }
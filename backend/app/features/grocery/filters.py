@@ -9,7 +9,7 @@ without importing the HTTP or schema layers.
 from dataclasses import dataclass
 from typing import Optional
 
-from app.common.enums import GroceryType, Seller, GroceryCategory
+from app.common.enums import GroceryType, Seller, GroceryCategory, GroceryStockStatus
 
 
 @dataclass
@@ -19,10 +19,14 @@ class GroceryFilterParams:
     best_seller: Optional[Seller] = None
     category: Optional[GroceryCategory] = None
     should_include: Optional[bool] = None
+    stock_status: Optional[GroceryStockStatus] = None
     search: Optional[str] = None
 
     def has_conditions(self) -> bool:
         return any(
             value is not None
-            for value in [self.type, self.current_seller, self.best_seller, self.category, self.should_include]
+            for value in [
+                self.type, self.current_seller, self.best_seller, self.category,
+                self.should_include, self.stock_status,
+            ]
         )
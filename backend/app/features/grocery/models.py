@@ -2,10 +2,16 @@
 DB structure only
 """
 
+from datetime import date, datetime
+from uuid import UUID
+
 from sqlalchemy import (
-    String, Boolean, Integer,
+    String, Boolean, Integer, SmallInteger, BigInteger, Date, DateTime,
     Enum as SQLEnum,
+    Index, Computed, ForeignKey, Sequence, func, text, ColumnElement,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.common.enums import GroceryType, Seller, GroceryCategory
@@ -13,8 +19,43 @@ from app.db.base import Base
 from app.db.mixins import BaseModelMixin
 
 
+# best_price is NULL until a price has been seen; sorting uses the current price then,
+# so the keyset sort key is never NULL
+EFFECTIVE_BEST_PRICE_SQL = 'coalesce(best_price, current_price)'
+
+
 class Grocery(Base, BaseModelMixin):
     __tablename__ = "grocery"
+    __table_args__ = (
+        # keyset pagination orders for the list endpoint's `sort=` keys, each with
+        # `id` as tie-breaker; the category-prefixed copies serve `category=` + sort
+        # as one index range scan (other filters are applied on top of the ordered scan)
+        Index('ix_grocery_name_id', 'name', 'id'),
+        Index('ix_grocery_current_price_id', 'current_price', 'id'),
+        Index('ix_grocery_effective_best_price_id', text(EFFECTIVE_BEST_PRICE_SQL), 'id'),
+        Index('ix_grocery_updated_at_id', 'updated_at', 'id'),
+        Index('ix_grocery_category_name_id', 'category', 'name', 'id'),
+        Index('ix_grocery_category_current_price_id', 'category', 'current_price', 'id'),
+        Index('ix_grocery_category_effective_best_price_id', 'category', text(EFFECTIVE_BEST_PRICE_SQL), 'id'),
+        Index('ix_grocery_category_updated_at_id', 'category', 'updated_at', 'id'),
+        # `?search=` indexes: substring (pg_trgm) and full-text
+        Index('ix_grocery_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_grocery_brand_trgm', 'brand', postgresql_using='gin', postgresql_ops={'brand': 'gin_trgm_ops'}),
+        Index('ix_grocery_search_vector', 'search_vector', postgresql_using='gin'),
+        # `stock_status=below_stock` filter and the shopping list: partial indexes in
+        # keyset order, covering only the (few) rows that need restocking / buying
+        Index(
+            'ix_grocery_below_stock_name_id', 'name', 'id',
+            postgresql_where=text('quantity_in_stock <= low_stock_threshold'),
+        ),
+        Index(
+            'ix_grocery_shopping_list_name_id', 'name', 'id',
+            postgresql_where=text('quantity_in_stock <= low_stock_threshold OR should_include'),
+        ),
+    )
+    # fetch server-generated values (created_at, updated_at) with INSERT ... RETURNING
+    # instead of a refresh SELECT after commit
+    __mapper_args__ = {'eager_defaults': True}
 
     name: Mapped[str] = mapped_column(
         String(100),
@@ -65,10 +106,150 @@ class Grocery(Base, BaseModelMixin):
     best_seller: Mapped[Seller] = mapped_column(
         SQLEnum(Seller),
         nullable=False,
-        default=Seller.DEFAULT
+        default=Seller.DEFAULT,
+        # `?search=` matches seller names against it
+        index=True
     )
     best_price: Mapped[int] = mapped_column(
         Integer,
         nullable=True,
         default=0.0
     )
+
+    # search only
+    # generated by postgres from name + brand, never written by the app
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(brand, ''))", persisted=True),
+        deferred=True
+    )
+
+    @hybrid_property
+    def effective_best_price(self) -> int:
+        return self.best_price if self.best_price is not None else self.current_price
+
+    @effective_best_price.inplace.expression
+    @classmethod
+    def _effective_best_price_expression(cls) -> ColumnElement[int]:
+        return func.coalesce(cls.best_price, cls.current_price)
+
+    # same rule as `compute_stock_status`, usable in SQL (filters, partial indexes)
+    @hybrid_property
+    def is_below_stock(self) -> bool:
+        return self.quantity_in_stock <= self.low_stock_threshold
+
+
+# Monthly partitions are named `<table>_pYYYY_MM`, plus one `<table>_default`.
+# They are created by `grocery_price_history_ensure_partition()` (see the
+# migration), not by the metadata, so alembic's env.py skips them.
+PRICE_HISTORY_PARTITION_PREFIX = 'grocery_price_history_'
+
+price_history_id_seq = Sequence('grocery_price_history_id_seq')
+
+
+class GroceryPriceHistory(Base):
+    """
+    One row per observed price, appended by triggers on `grocery` (insert, or
+    update of current_price / current_seller) — never written by the app.
+    Range-partitioned by month on `recorded_at`.
+    """
+    __tablename__ = "grocery_price_history"
+    __table_args__ = (
+        # append-only, physically ordered by time → a tiny BRIN beats a btree
+        Index('ix_grocery_price_history_recorded_at', 'recorded_at', postgresql_using='brin'),
+        # ON DELETE CASCADE lookups
+        Index('ix_grocery_price_history_grocery_id', 'grocery_id'),
+        {'postgresql_partition_by': 'RANGE (recorded_at)'},
+    )
+
+    # the partition key must be part of the primary key
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        price_history_id_seq,
+        server_default=price_history_id_seq.next_value(),
+        primary_key=True
+    )
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True
+    )
+    grocery_id: Mapped[UUID] = mapped_column(
+        ForeignKey('grocery.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    seller: Mapped[Seller] = mapped_column(
+        SQLEnum(Seller),
+        nullable=False
+    )
+    price: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+
+
+class GroceryPriceRollup(Base):
+    """
+    Per grocery / seller / month aggregates of `grocery_price_history`, upserted
+    by the same triggers that append history, so reads never scan history.
+    """
+    __tablename__ = "grocery_price_rollup"
+
+    grocery_id: Mapped[UUID] = mapped_column(
+        ForeignKey('grocery.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    seller: Mapped[Seller] = mapped_column(
+        SQLEnum(Seller),
+        primary_key=True
+    )
+    # first day of the (UTC) month
+    month: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True
+    )
+    min_price: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    max_price: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    price_sum: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False
+    )
+    price_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    last_price: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
+    last_recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+
+class GroceryVersion(Base):
+    """
+    Single-row change counter of the `grocery` table, bumped by a statement
+    trigger on every insert / update / delete / truncate. The increment locks
+    the row until commit, so versions follow commit order and every committed
+    write is visible as a new version — unlike max(updated_at), which is the
+    writing transaction's start time.
+    """
+    __tablename__ = "grocery_version"
+
+    id: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=text('0')
+    )
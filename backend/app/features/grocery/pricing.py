@@ -0,0 +1,53 @@
+"""
+pricing.py (feature scoped)
+
+SQL expressions for the "cheapest seller wins" rule, evaluated by Postgres
+inside the UPDATE itself so concurrent price updates can't lose a best price:
+
+    •	no best price yet      → best_price = new price, best_seller = MEENA
+    •	new price is cheaper   → best_price = new price, best_seller = new seller
+    •	otherwise              → unchanged
+
+Column references on the right-hand side of `SET` read the row's values from
+before the update, which is exactly the "old best price" the rule compares to.
+"""
+
+from sqlalchemy import ColumnElement, case, func, literal
+
+from app.common.enums import Seller
+from app.features.grocery.models import Grocery
+
+
+def _as_expression(value, column) -> ColumnElement:
+    if value is None:
+        return column
+    if isinstance(value, ColumnElement):
+        return value
+    return literal(value, column.type)
+
+
+def best_price_values(
+        new_price=None,
+        new_seller=None,
+        changed: ColumnElement[bool] | None = None,
+) -> dict[str, ColumnElement]:
+    """
+    `SET` values for best_price / best_seller after a price or seller change.
+    `new_price` / `new_seller` may be python values, SQL expressions (e.g. a
+    VALUES column) or None for "unchanged". When the change is only known per
+    row (bulk updates), `changed` guards the rule so untouched rows keep theirs.
+    """
+    new_price = _as_expression(new_price, Grocery.current_price)
+    new_seller = _as_expression(new_seller, Grocery.current_seller)
+    values = {
+        # LEAST skips NULLs, so a missing best price simply becomes the new one
+        'best_price': func.least(Grocery.best_price, new_price),
+        'best_seller': case(
+            (Grocery.best_price.is_(None), literal(Seller.MEENA, Grocery.best_seller.type)),
+            (new_price < Grocery.best_price, new_seller),
+            else_=Grocery.best_seller,
+        ),
+    }
+    if changed is not None:
+        values = {key: case((changed, value), else_=getattr(Grocery, key)) for key, value in values.items()}
+    return values
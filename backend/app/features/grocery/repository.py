@@ -3,37 +3,170 @@ TALKS TO DB ONLY
 No FASTAPI no HTTP concepts
 """
 
+from datetime import date, datetime
+from typing import NamedTuple, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select, update, Sequence, and_, or_, cast, String
+from sqlalchemy import (
+    select, insert, update, delete, func, any_, bindparam, values, column, cast, or_,
+    Sequence, and_, tuple_, literal, Select, ColumnElement, Numeric,
+)
+from sqlalchemy.dialects.postgresql import array_agg, aggregate_order_by, ARRAY
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import DatabaseException
+from app.common.enums import GroceryStockStatus
+from app.common.pagination import CursorParams, CursorPage, encode_cursor, decode_cursor
+from app.common.constants import GROCERY_NOT_FOUND
+from app.core.exceptions import DatabaseException, ResourceNotFoundException
 from app.features.grocery.filters import GroceryFilterParams
-from app.features.grocery.models import Grocery
+from app.features.grocery.models import Grocery, GroceryPriceRollup, GroceryVersion
+from app.features.grocery.pricing import best_price_values
+from app.features.grocery.search import build_search_condition, build_search_rank
+
+
+class _SortKey(NamedTuple):
+    expression: ColumnElement
+    python_type: type
+    descending: bool = False
 
 
 class GroceryRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_groceries(self, filters: GroceryFilterParams | None = None) -> Sequence[Grocery]:
-        """Get all groceries, optionally filtered/searched — no pagination for now"""
-        stmt = select(Grocery)
+    _READ_COLUMNS = tuple(
+        attribute.key for attribute in Grocery.__mapper__.column_attrs if not attribute.deferred
+    )
+
+    # Keyset order for the list endpoint, backed by `ix_grocery_name_id`.
+    # `id` is the tie-breaker that makes the order total, so cursors are stable.
+    _DEFAULT_ORDER = (
+        _SortKey(Grocery.name, str),
+        _SortKey(Grocery.id, UUID),
+    )
+    # `sort=` keys (see `GrocerySort`), each backed by a `(key, id)` and a `(category, key, id)` index
+    _SORT_KEYS = {
+        'name': _SortKey(Grocery.name, str),
+        'current_price': _SortKey(Grocery.current_price, int),
+        'best_price': _SortKey(Grocery.effective_best_price, int),
+        'updated_at': _SortKey(Grocery.updated_at, datetime),
+    }
 
+    async def get_groceries(
+            self,
+            filters: GroceryFilterParams | None = None,
+            pagination: CursorParams | None = None,
+            columns: Sequence[str] = (),
+    ) -> CursorPage[dict]:
+        """
+        Get one keyset page of groceries, optionally filtered/searched/sorted.
+
+        Selects only `columns` (all mapped columns when empty) as plain rows,
+        so nothing is loaded into the session identity map.
+        """
+        pagination = pagination or CursorParams()
+        columns = columns or self._READ_COLUMNS
+        stmt = self.build_list_statement(filters, pagination, columns)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        page_rows = rows[:pagination.limit]
+        next_cursor = None
+        if len(rows) > pagination.limit:
+            next_cursor = encode_cursor(page_rows[-1][len(columns):])
+        return CursorPage(
+            items=[dict(zip(columns, row)) for row in page_rows],
+            limit=pagination.limit,
+            next_cursor=next_cursor,
+        )
+
+    def build_list_statement(
+            self,
+            filters: GroceryFilterParams | None,
+            pagination: CursorParams,
+            columns: Sequence[str],
+    ) -> Select:
+        """
+        The keyset page query: `columns` followed by the sort key values
+        (`sort_key_i`), which become the next cursor. Fetches one extra row
+        to know whether another page exists.
+        """
+        order = self._list_order(filters, pagination.sort)
+        sort_columns = [key.expression.label(f'sort_key_{index}') for index, key in enumerate(order)]
+        stmt = self._apply_filters(
+            select(*[getattr(Grocery, column) for column in columns], *sort_columns),
+            filters,
+        )
+
+        if pagination.cursor:
+            last_key = decode_cursor(pagination.cursor, [key.python_type for key in order])
+            stmt = stmt.where(self._build_keyset_condition(order, last_key))
+
+        return stmt.order_by(
+            *[column.desc() if key.descending else column for key, column in zip(order, sort_columns)]
+        ).limit(pagination.limit + 1)
+
+    async def get_version(self) -> int:
+        """The `grocery` table's change counter — one primary-key lookup, bumped on every committed write"""
+        return await self.session.scalar(select(GroceryVersion.version).where(GroceryVersion.id == 1))
+
+    async def stream_groceries(
+            self,
+            filters: GroceryFilterParams | None = None,
+            columns: Sequence[str] = (),
+            batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Yield every matching grocery in batches of `batch_size` plain rows.
+
+        Runs on a server-side cursor (`AsyncSession.stream` + `yield_per`), so
+        memory stays flat however large the table is.
+        """
+        columns = columns or self._READ_COLUMNS
+        stmt = (
+            self._apply_filters(select(*[getattr(Grocery, column) for column in columns]), filters)
+            .order_by(*[key.expression for key in self._DEFAULT_ORDER])
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            yield [dict(zip(columns, row)) for row in partition]
+
+    def _list_order(self, filters: GroceryFilterParams | None, sort: str | None = None) -> tuple[_SortKey, ...]:
+        if sort:
+            # every key shares the direction, so one btree (scanned backwards for '-') serves it
+            descending = sort.startswith('-')
+            key = self._SORT_KEYS[sort.lstrip('-')]
+            return key._replace(descending=descending), _SortKey(Grocery.id, UUID, descending=descending)
+        if filters and filters.search:
+            # ranked results: best match first
+            return (
+                _SortKey(build_search_rank(filters.search), float, descending=True),
+                _SortKey(Grocery.id, UUID, descending=True),
+            )
+        return self._DEFAULT_ORDER
+
+    @staticmethod
+    def _build_keyset_condition(order: tuple[_SortKey, ...], last_key: tuple):
+        """Row-value comparison `(k1, k2) > (:v1, :v2)`; every key shares one direction."""
+        row_key = tuple_(*[key.expression for key in order])
+        last_row_key = tuple_(*[literal(value, key.expression.type) for key, value in zip(order, last_key)])
+        if order[0].descending:
+            return row_key < last_row_key
+        return row_key > last_row_key
+
+    def _apply_filters(self, stmt: Select, filters: GroceryFilterParams | None) -> Select:
         if not filters:
-            result = await self.session.execute(stmt)
-            return result.scalars().all()
+            return stmt
 
         if filters.has_conditions():
             stmt = stmt.where(self._build_filter_conditions(filters))
 
         if filters.search:
-            stmt = stmt.where(self._build_search_conditions(filters.search))
+            stmt = stmt.where(build_search_condition(filters.search))
 
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return stmt
 
     @staticmethod
     def _build_filter_conditions(filters: GroceryFilterParams):
@@ -43,54 +176,168 @@ class GroceryRepository:
             for field in filter_fields
             if (value := getattr(filters, field)) is not None
         ]
+        if filters.stock_status == GroceryStockStatus.BELOW_STOCK:
+            conditions.append(Grocery.is_below_stock)
+        elif filters.stock_status == GroceryStockStatus.IN_STOCK:
+            conditions.append(~Grocery.is_below_stock)
         return and_(*conditions)
 
-    @staticmethod
-    def _build_search_conditions(search: str):
-        term = f"%{search}%"
-        text_fields = [Grocery.name, Grocery.brand]
-        cast_fields = [
-            Grocery.type, Grocery.current_seller, Grocery.best_seller, Grocery.category,
-            Grocery.current_price, Grocery.quantity_in_stock, Grocery.low_stock_threshold, Grocery.best_price,
-        ]
-        search_conditions = (
-                [field.ilike(term) for field in text_fields]
-                + [cast(field, String).ilike(term) for field in cast_fields]
+    async def get_shopping_list(self, columns: Sequence[str] = ()) -> tuple[list[dict], int]:
+        """
+        Below-stock or should_include groceries plus their estimated total at
+        best price (current price when there is none) — one query, the total
+        rides along on every row as a window aggregate.
+        """
+        columns = columns or self._READ_COLUMNS
+        unit_cost = func.coalesce(Grocery.best_price, Grocery.current_price)
+        stmt = (
+            select(
+                *[getattr(Grocery, column) for column in columns],
+                func.coalesce(func.sum(unit_cost).over(), 0).label('estimated_total'),
+            )
+            .where(or_(Grocery.is_below_stock, Grocery.should_include))
+            .order_by(Grocery.name, Grocery.id)
         )
-        return or_(*search_conditions)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        estimated_total = rows[0][-1] if rows else 0
+        return [dict(zip(columns, row)) for row in rows], estimated_total
+
+    async def get_summary_rows(self) -> list[dict]:
+        """
+        Counts per type / category / current seller / stock status plus the grand
+        total, in ONE scan via `GROUP BY GROUPING SETS`. Each row comes back as
+        `{dimension, value, item_count, monthly_spend}`; the grand total row has
+        `dimension=None`.
+        """
+        dimensions = {
+            'type': Grocery.type,
+            'category': Grocery.category,
+            'current_seller': Grocery.current_seller,
+            'is_below_stock': Grocery.is_below_stock.label('is_below_stock'),
+        }
+        stmt = (
+            select(
+                *dimensions.values(),
+                func.grouping(*dimensions.values()).label('grouping_id'),
+                func.count().label('item_count'),
+                func.coalesce(
+                    func.sum(Grocery.current_price).filter(Grocery.should_include.is_(True)), 0
+                ).label('monthly_spend'),
+            )
+            .group_by(func.grouping_sets(*[tuple_(expression) for expression in dimensions.values()], tuple_()))
+        )
+        # GROUPING() sets one bit per column *left out* of the row's set, first column = highest bit
+        all_bits = (1 << len(dimensions)) - 1
+        dimension_by_grouping_id = {
+            all_bits ^ (1 << (len(dimensions) - 1 - position)): name
+            for position, name in enumerate(dimensions)
+        }
+        result = await self.session.execute(stmt)
+        return [
+            {
+                'dimension': (dimension := dimension_by_grouping_id.get(row['grouping_id'])),
+                'value': row[dimension] if dimension else None,
+                'item_count': row['item_count'],
+                'monthly_spend': row['monthly_spend'],
+            }
+            for row in result.mappings()
+        ]
+
+    async def get_row_by_id(self, grocery_id: UUID, columns: Sequence[str] = ()) -> dict | None:
+        """Fetch selected columns of one grocery as a plain row. Returns None if not found."""
+        columns = columns or self._READ_COLUMNS
+        stmt = select(*[getattr(Grocery, column) for column in columns]).where(Grocery.id == grocery_id)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return dict(zip(columns, row)) if row is not None else None
 
-    async def get_by_id(self, grocery_id: str) -> Grocery | None:
-        """Fetch a single grocery item by ID. Returns None if not found."""
-        stmt = select(Grocery).where(Grocery.id == grocery_id)
+    async def get_rows_by_ids(self, grocery_ids: Sequence[UUID], columns: Sequence[str] = ()) -> dict[UUID, dict]:
+        """
+        Fetch selected columns of many groceries, keyed by id; missing ids are absent.
+        `id = ANY(:ids)` binds ONE array parameter, so the statement text (and its
+        plan) is the same for any number of ids, unlike an expanding IN list.
+        """
+        columns = tuple(dict.fromkeys(('id', *(columns or self._READ_COLUMNS))))
+        ids = bindparam('grocery_ids', list(grocery_ids), type_=ARRAY(Grocery.id.type))
+        stmt = select(*[getattr(Grocery, column) for column in columns]).where(Grocery.id == any_(ids))
+        result = await self.session.execute(stmt)
+        rows = [dict(zip(columns, row)) for row in result]
+        return {row['id']: row for row in rows}
+
+    async def get_updated_at(self, grocery_id: UUID) -> datetime | None:
+        """Primary-key lookup of a grocery's updated_at. Returns None if not found."""
+        stmt = select(Grocery.updated_at).where(Grocery.id == grocery_id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def add_grocery(self, grocery: Grocery) -> Grocery:
-        """Add a new grocery item with explicit transaction rollback on error."""
+        """
+        Add a new grocery item with explicit transaction rollback on error.
+        One `INSERT ... RETURNING` (eager_defaults) + commit, no refresh needed.
+        """
         try:
             self.session.add(grocery)
             await self.session.commit()
-            await self.session.refresh(grocery)
             return grocery
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException('Failed to add grocery from database') from e
 
-    async def update_grocery(self, grocery: Grocery) -> Grocery:
-        """Update an existing grocery item with explicit transaction rollback on error."""
+    async def bulk_add_groceries(self, values: Sequence[dict]) -> list[dict]:
+        """
+        Insert many groceries in one transaction; rows come back in input order.
+        SQLAlchemy pages the parameter sets into multi-row `INSERT ... VALUES
+        (...), (...) RETURNING` statements (`insertmanyvalues`), so 10k items
+        cost ~10 round trips instead of 30k.
+        """
         try:
+            stmt = insert(Grocery).returning(
+                *[getattr(Grocery, column) for column in self._READ_COLUMNS],
+                sort_by_parameter_order=True,
+            )
+            result = await self.session.execute(stmt, values)
+            rows = [dict(zip(self._READ_COLUMNS, row)) for row in result]
             await self.session.commit()
-            await self.session.refresh(grocery)
-            return grocery
+            return rows
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException('Failed to bulk add groceries to database') from e
+
+    async def update_grocery(self, grocery_id: UUID, values: dict) -> dict | None:
+        """
+        Single `UPDATE ... RETURNING` with explicit transaction rollback on error.
+        `values` may hold SQL expressions (see `pricing.best_price_values`).
+        Returns None if the grocery doesn't exist.
+        """
+        if not values:
+            return await self.get_row_by_id(grocery_id)
+        try:
+            stmt = (
+                update(Grocery)
+                .where(Grocery.id == grocery_id)
+                .values(**values)
+                .returning(*[getattr(Grocery, column) for column in self._READ_COLUMNS])
+            )
+            result = await self.session.execute(stmt)
+            row = result.one_or_none()
+            await self.session.commit()
+            return dict(zip(self._READ_COLUMNS, row)) if row is not None else None
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException('Failed to update grocery from database') from e
 
-    async def delete_grocery(self, grocery: Grocery) -> None:
-        """Delete a grocery item with explicit transaction rollback on error."""
+    async def delete_grocery(self, grocery_id: UUID) -> UUID | None:
+        """
+        Single `DELETE ... RETURNING id` with explicit transaction rollback on error.
+        Returns None if the grocery doesn't exist.
+        """
         try:
-            await self.session.delete(grocery)
+            stmt = delete(Grocery).where(Grocery.id == grocery_id).returning(Grocery.id)
+            result = await self.session.execute(stmt)
+            deleted_id = result.scalar_one_or_none()
             await self.session.commit()
+            return deleted_id
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException('Failed to delete grocery from database') from e
@@ -113,3 +360,76 @@ class GroceryRepository:
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise DatabaseException('Failed to bulk update should_include from database') from e
+
+    async def bulk_patch_groceries(self, changes: Sequence[dict]) -> list[dict]:
+        """
+        Apply heterogeneous per-item changes in one `UPDATE ... FROM (VALUES ...)`
+        with explicit transaction rollback on error. A NULL in VALUES means
+        "unchanged"; best price/seller are recomputed in the same statement.
+        The batch is all-or-nothing: if any id doesn't exist the transaction is
+        rolled back and ResourceNotFoundException names the missing ids.
+        """
+        patch_columns = ('id', 'current_price', 'current_seller', 'quantity_in_stock')
+        changes_table = values(
+            *[column(name, getattr(Grocery, name).type) for name in patch_columns],
+            name='changes',
+        ).data([tuple(change.get(name) for name in patch_columns) for change in changes])
+        # NULLs are rendered untyped, so a column that is NULL in every row would come back as text
+        patched = {name: cast(changes_table.c[name], getattr(Grocery, name).type) for name in patch_columns[1:]}
+        new_price = func.coalesce(patched['current_price'], Grocery.current_price)
+        new_seller = func.coalesce(patched['current_seller'], Grocery.current_seller)
+        price_changed = or_(patched['current_price'].is_not(None), patched['current_seller'].is_not(None))
+        try:
+            stmt = (
+                update(Grocery)
+                .where(Grocery.id == changes_table.c.id)
+                .values(
+                    current_price=new_price,
+                    current_seller=new_seller,
+                    quantity_in_stock=func.coalesce(patched['quantity_in_stock'], Grocery.quantity_in_stock),
+                    **best_price_values(new_price, new_seller, changed=price_changed),
+                )
+                .returning(*[getattr(Grocery, name) for name in self._READ_COLUMNS])
+            )
+            result = await self.session.execute(stmt)
+            rows = [dict(zip(self._READ_COLUMNS, row)) for row in result]
+            if len(rows) == len(changes):
+                await self.session.commit()
+                return rows
+            await self.session.rollback()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException('Failed to bulk update groceries from database') from e
+        found_ids = {row['id'] for row in rows}
+        missing_ids = [str(change['id']) for change in changes if change['id'] not in found_ids]
+        raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=", ".join(missing_ids)))
+
+    async def get_price_stats(self, grocery_id: UUID, since_month: date) -> list[dict]:
+        """Min / avg / last price per seller since `since_month`, read from the monthly rollup only"""
+        rollup = GroceryPriceRollup
+        stmt = (
+            select(
+                rollup.seller,
+                func.min(rollup.min_price).label('min_price'),
+                func.max(rollup.max_price).label('max_price'),
+                (func.sum(rollup.price_sum).cast(Numeric) / func.sum(rollup.price_count)).label('avg_price'),
+                array_agg(aggregate_order_by(rollup.last_price, rollup.last_recorded_at.desc()))[1].label('last_price'),
+                func.max(rollup.last_recorded_at).label('last_recorded_at'),
+                func.sum(rollup.price_count).label('samples'),
+            )
+            .where(rollup.grocery_id == grocery_id, rollup.month >= since_month)
+            .group_by(rollup.seller)
+            .order_by(rollup.seller)
+        )
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def ensure_price_history_partitions(self, months: Sequence[date]) -> None:
+        """Create the monthly `grocery_price_history` partitions that don't exist yet"""
+        try:
+            for month in months:
+                await self.session.execute(select(func.grocery_price_history_ensure_partition(month)))
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise DatabaseException('Failed to create price history partitions') from e
@@ -6,31 +6,55 @@ Only HTTP concerns:
 
 Router should be thin.
 """
-from typing import Annotated, List
+from typing import Annotated, List, Union, Optional
 
 from fastapi import APIRouter, status, Depends
-from fastapi import Body
+from fastapi import Body, Query, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.dependencies import get_current_user
 from app.db.session import get_db
-from app.features.auth.models import User
+from app.features.auth.cache import CurrentUser
+from app.common.enums import ExportFormat
+from app.common.export import EXPORT_MEDIA_TYPES
+from app.common.http_cache import etag_matches, cache_headers, not_modified_response
+from app.common.pagination import CursorParams
+from app.common.responses import ApiJSONResponse
 from app.features.grocery.dependencies import (
     get_grocery_service,
+    get_grocery_read_service,
     get_grocery_filters,
+    get_grocery_pagination,
+    get_grocery_list_fields,
+    get_grocery_detail_fields,
+    get_grocery_batch_ids,
 )
 from app.features.grocery.filters import GroceryFilterParams
-from app.core.api_response_schema import ApiResponseSchema
+from app.core.api_response_schema import (
+    ApiResponseSchema,
+    PaginatedApiResponseSchema,
+    CursorPaginationSchema,
+)
 from app.features.grocery.schemas.request_schemas import (
     GroceryCreateSchema,
+    GroceryBulkCreateSchema,
     GroceryUpdateSchema,
     GroceryBulkUpdateSchema,
+    GroceryBulkPatchSchema,
 )
 from app.features.grocery.schemas.response_schemas import (
     GroceryListResponseSchema,
     GroceryDetailResponseSchema,
     GroceryCreateResponseSchema,
-    GroceryUpdateResponseSchema
+    GroceryBulkCreateResponseSchema,
+    GroceryUpdateResponseSchema,
+    GroceryPriceStatsResponseSchema,
+    GroceryShoppingListResponseSchema,
+    GrocerySummaryResponseSchema,
+    GroceryBatchResponseSchema,
+    GrocerySparseResponseSchema,
 )
 from app.features.grocery.service import GroceryService
 
@@ -40,23 +64,129 @@ router = APIRouter(
 )
 
 DbDep = Annotated[AsyncSession, Depends(get_db)]
+IfNoneMatchHeader = Annotated[Optional[str], Header(description="ETag(s) from a previous response")]
 
 
 @router.get(
     "/",
-    response_model=ApiResponseSchema[List[GroceryListResponseSchema]],
+    response_model=PaginatedApiResponseSchema[Union[GroceryListResponseSchema, GrocerySparseResponseSchema]],
     status_code=status.HTTP_200_OK,
     summary="Get all groceries",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Unchanged since the given ETag"}},
 )
 async def list_groceries(
+        if_none_match: IfNoneMatchHeader = None,
         filters: GroceryFilterParams = Depends(get_grocery_filters),
-        grocery_service: GroceryService = Depends(get_grocery_service)
+        pagination: CursorParams = Depends(get_grocery_pagination),
+        fields: tuple[str, ...] | None = Depends(get_grocery_list_fields),
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
 ):
-    items = await grocery_service.list_all_groceries(filters)
-    return ApiResponseSchema(
-        success=True,
-        data=items,
+    tagged = await grocery_service.get_groceries_etag(filters, pagination, fields)
+    headers = cache_headers(tagged.etag, settings.GROCERY_HTTP_MAX_AGE)
+    if etag_matches(if_none_match, tagged.etag):
+        return not_modified_response(headers)
+
+    page = await grocery_service.list_all_groceries_json(filters, pagination, fields, tagged)
+    return ApiJSONResponse.from_json(
+        page.data_json,
+        headers=headers,
         message='Grocery list fetched successfully',
+        pagination=CursorPaginationSchema(
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            has_more=page.has_more,
+        ),
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream the grocery catalog as NDJSON or CSV",
+)
+async def export_groceries(
+        export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+        filters: GroceryFilterParams = Depends(get_grocery_filters),
+        fields: tuple[str, ...] | None = Depends(get_grocery_detail_fields),
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
+):
+    chunks = grocery_service.export_groceries(filters, export_format, fields)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="groceries.{export_format.value}"'},
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=ApiResponseSchema[List[GroceryBulkCreateResponseSchema]],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many grocery items in one transaction",
+)
+async def bulk_create_groceries(
+        data: Annotated[GroceryBulkCreateSchema, Body()],
+        _current_user: CurrentUser = Depends(get_current_user),
+        grocery_service: GroceryService = Depends(get_grocery_service)
+):
+    items = await grocery_service.bulk_create_groceries(data)
+    return ApiJSONResponse.from_data(
+        items,
+        List[GroceryBulkCreateResponseSchema],
+        message=f'{len(items)} grocery items created successfully',
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.get(
+    "/batch",
+    response_model=ApiResponseSchema[GroceryBatchResponseSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Get many grocery items by id in one request",
+)
+async def get_groceries_by_ids(
+        grocery_ids: list[str] = Depends(get_grocery_batch_ids),
+        fields: tuple[str, ...] | None = Depends(get_grocery_detail_fields),
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
+):
+    batch = await grocery_service.get_groceries_by_ids(grocery_ids, fields)
+    return ApiJSONResponse.from_data(
+        batch,
+        GroceryBatchResponseSchema,
+        message='Grocery items fetched successfully',
+    )
+
+
+@router.get(
+    "/summary",
+    response_model=ApiResponseSchema[GrocerySummaryResponseSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Counts per type, category, seller and stock status, plus monthly spend",
+)
+async def get_summary(
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
+):
+    data_json = await grocery_service.get_summary_json()
+    return ApiJSONResponse.from_json(
+        data_json,
+        message='Grocery summary fetched successfully',
+    )
+
+
+@router.get(
+    "/shopping-list",
+    response_model=ApiResponseSchema[GroceryShoppingListResponseSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Below-stock or should_include items with their estimated total cost",
+)
+async def get_shopping_list(
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
+):
+    data_json = await grocery_service.get_shopping_list_json()
+    return ApiJSONResponse.from_json(
+        data_json,
+        message='Shopping list fetched successfully',
     )
 
 
@@ -68,35 +198,81 @@ async def list_groceries(
 )
 async def bulk_update_should_include(
         data: Annotated[GroceryBulkUpdateSchema, Body()],
-        _current_user: User = Depends(get_current_user),
+        _current_user: CurrentUser = Depends(get_current_user),
         grocery_service: GroceryService = Depends(get_grocery_service)
 ):
     item = await grocery_service.bulk_update_should_include(data)
-    return ApiResponseSchema(
-        success=True,
-        data=item,
+    return ApiJSONResponse.from_data(
+        item,
+        List[GroceryUpdateResponseSchema],
         message='Bulk update should_include fetched successfully',
     )
 
 
+@router.patch(
+    "/bulk",
+    response_model=ApiResponseSchema[List[GroceryUpdateResponseSchema]],
+    status_code=status.HTTP_200_OK,
+    summary="Bulk update price, seller and stock of multiple grocery items",
+)
+async def bulk_patch_groceries(
+        data: Annotated[GroceryBulkPatchSchema, Body()],
+        _current_user: CurrentUser = Depends(get_current_user),
+        grocery_service: GroceryService = Depends(get_grocery_service)
+):
+    items = await grocery_service.bulk_patch_groceries(data)
+    return ApiJSONResponse.from_data(
+        items,
+        List[GroceryUpdateResponseSchema],
+        message='Grocery items updated successfully',
+    )
+
+
 @router.get(
     "/{grocery_id}",
-    response_model=ApiResponseSchema[GroceryDetailResponseSchema],
+    response_model=ApiResponseSchema[Union[GroceryDetailResponseSchema, GrocerySparseResponseSchema]],
     status_code=status.HTTP_200_OK,
     summary="Get grocery details",
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Unchanged since the given ETag"}},
 )
 async def get_grocery_by_id(
         grocery_id: str,
-        grocery_service: GroceryService = Depends(get_grocery_service)
+        if_none_match: IfNoneMatchHeader = None,
+        fields: tuple[str, ...] | None = Depends(get_grocery_detail_fields),
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
 ):
-    item = await grocery_service.get_grocery_by_id(grocery_id)
-    return ApiResponseSchema(
-        success=True,
-        data=item,
+    tagged = await grocery_service.get_grocery_etag(grocery_id, fields)
+    headers = cache_headers(tagged.etag, settings.GROCERY_HTTP_MAX_AGE)
+    if etag_matches(if_none_match, tagged.etag):
+        return not_modified_response(headers)
+
+    data_json = await grocery_service.get_grocery_by_id_json(grocery_id, fields, tagged)
+    return ApiJSONResponse.from_json(
+        data_json,
+        headers=headers,
         message='Grocery details fetched successfully',
     )
 
 
+@router.get(
+    "/{grocery_id}/price-stats",
+    response_model=ApiResponseSchema[List[GroceryPriceStatsResponseSchema]],
+    status_code=status.HTTP_200_OK,
+    summary="Min, max, average and last price per seller over recent months",
+)
+async def get_price_stats(
+        grocery_id: str,
+        months: int = Query(default=3, ge=1, le=24, description="Window in calendar months, including the current one"),
+        grocery_service: GroceryService = Depends(get_grocery_read_service)
+):
+    items = await grocery_service.get_price_stats(grocery_id, months)
+    return ApiJSONResponse.from_data(
+        items,
+        List[GroceryPriceStatsResponseSchema],
+        message='Grocery price stats fetched successfully',
+    )
+
+
 @router.post(
     "/",
     response_model=ApiResponseSchema[GroceryCreateResponseSchema],
@@ -105,14 +281,15 @@ async def get_grocery_by_id(
 )
 async def create_grocery(
         data: Annotated[GroceryCreateSchema, Body()],
-        _current_user: User = Depends(get_current_user),
+        _current_user: CurrentUser = Depends(get_current_user),
         grocery_service: GroceryService = Depends(get_grocery_service)
 ):
     item = await grocery_service.create_grocery(data)
-    return ApiResponseSchema(
-        success=True,
-        data=item,
+    return ApiJSONResponse.from_data(
+        item,
+        GroceryCreateResponseSchema,
         message='Grocery item created successfully',
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -125,13 +302,13 @@ async def create_grocery(
 async def update_grocery(
         grocery_id: str,
         data: Annotated[GroceryUpdateSchema, Body()],
-        _current_user: User = Depends(get_current_user),
+        _current_user: CurrentUser = Depends(get_current_user),
         grocery_service: GroceryService = Depends(get_grocery_service)
 ):
     item = await grocery_service.update_grocery(grocery_id, data)
-    return ApiResponseSchema(
-        success=True,
-        data=item,
+    return ApiJSONResponse.from_data(
+        item,
+        GroceryUpdateResponseSchema,
         message='Grocery item updated successfully',
     )
 
@@ -144,12 +321,10 @@ async def update_grocery(
 )
 async def delete_grocery(
         grocery_id: str,
-        _current_user: User = Depends(get_current_user),
+        _current_user: CurrentUser = Depends(get_current_user),
         grocery_service: GroceryService = Depends(get_grocery_service)
 ):
-    item = await grocery_service.delete_grocery(grocery_id)
-    return ApiResponseSchema(
-        success=True,
-        data=item,
+    await grocery_service.delete_grocery(grocery_id)
+    return ApiJSONResponse.from_json(
         message='Grocery item deleted successfully',
     )
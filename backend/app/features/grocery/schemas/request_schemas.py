@@ -1,10 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, Field, PositiveInt, field_validator
 
 from app.common.enums import GroceryType, Seller, GroceryCategory
 
+MAX_BULK_ITEMS = 10_000
+# 4 bind parameters per item; keeps one UPDATE well under the 32767 limit
+MAX_BULK_PATCH_ITEMS = 1_000
+
 
 class GroceryCreateSchema(BaseModel):
     name: str = Field(
@@ -42,6 +46,14 @@ class GroceryCreateSchema(BaseModel):
     )
 
 
+class GroceryBulkCreateSchema(BaseModel):
+    items: List[GroceryCreateSchema] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ITEMS,
+        description="Grocery items to create in one transaction"
+    )
+
+
 class GroceryUpdateSchema(BaseModel):
     name: Optional[str] = Field(
         default=None,
@@ -97,3 +109,37 @@ class GroceryBulkUpdateSchema(BaseModel):
     should_include: bool = Field(
         description="New should_include value to apply to all selected items"
     )
+
+
+class GroceryBulkPatchItemSchema(BaseModel):
+    id: UUID = Field(
+        description="Id of the grocery item to update"
+    )
+    current_price: Optional[PositiveInt] = Field(
+        default=None,
+        le=100000,
+        description="Updated current price"
+    )
+    current_seller: Optional[Seller] = Field(
+        default=None,
+        description="Seller of grocery item"
+    )
+    quantity_in_stock: Optional[PositiveInt] = Field(
+        default=None,
+        description="Updated stock quantity"
+    )
+
+
+class GroceryBulkPatchSchema(BaseModel):
+    items: List[GroceryBulkPatchItemSchema] = Field(
+        min_length=1,
+        max_length=MAX_BULK_PATCH_ITEMS,
+        description="Per-item price/seller/stock changes; omitted fields are left unchanged"
+    )
+
+    @field_validator('items')
+    @classmethod
+    def unique_ids(cls, items: List[GroceryBulkPatchItemSchema]) -> List[GroceryBulkPatchItemSchema]:
+        if len({item.id for item in items}) != len(items):
+            raise ValueError('Each grocery id may appear only once')
+        return items
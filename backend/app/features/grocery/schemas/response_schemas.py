@@ -1,3 +1,4 @@
+from typing import Any, Dict, List, Union
 from uuid import UUID
 from datetime import datetime
 
@@ -6,6 +7,12 @@ from pydantic import BaseModel, ConfigDict, computed_field
 from app.common.enums import GroceryType, Seller, GroceryStockStatus, GroceryCategory
 
 
+def compute_stock_status(quantity_in_stock: int, low_stock_threshold: int) -> GroceryStockStatus:
+    if quantity_in_stock <= low_stock_threshold:
+        return GroceryStockStatus.BELOW_STOCK
+    return GroceryStockStatus.IN_STOCK
+
+
 class GroceryBaseResponseSchema(BaseModel):
     id: UUID
     name: str
@@ -22,21 +29,13 @@ class GroceryBaseResponseSchema(BaseModel):
 
     model_config = ConfigDict(
         from_attributes=True,
-        json_encoders={
-            GroceryType: lambda v: v.value,
-            Seller: lambda v: v.value,
-            GroceryCategory: lambda v: v.value,
-            UUID: lambda v: str(v)
-        }
     )
 
     @computed_field(return_type=GroceryStockStatus)
     @property
     def stock_status(self) -> GroceryStockStatus:
         """Computed stock status based on quantity and threshold"""
-        if self.quantity_in_stock <= self.low_stock_threshold:
-            return GroceryStockStatus.BELOW_STOCK
-        return GroceryStockStatus.IN_STOCK
+        return compute_stock_status(self.quantity_in_stock, self.low_stock_threshold)
 
 
 class GroceryListResponseSchema(GroceryBaseResponseSchema):
@@ -52,5 +51,46 @@ class GroceryCreateResponseSchema(GroceryBaseResponseSchema):
     created_at: datetime
 
 
+class GroceryBulkCreateResponseSchema(GroceryCreateResponseSchema):
+    index: int  # position of the item in the request
+
+
 class GroceryUpdateResponseSchema(GroceryBaseResponseSchema):
     updated_at: datetime
+
+
+class GroceryShoppingListResponseSchema(BaseModel):
+    items: List[GroceryListResponseSchema]
+    item_count: int
+    # one unit of each item at its best price (current price when there is none)
+    estimated_total: int
+
+
+class GrocerySummaryResponseSchema(BaseModel):
+    total_items: int
+    # current price of every should_include item
+    monthly_spend: int
+    by_type: Dict[GroceryType, int]
+    by_category: Dict[GroceryCategory, int]
+    by_seller: Dict[Seller, int]
+    by_stock_status: Dict[GroceryStockStatus, int]
+
+
+class GroceryPriceStatsResponseSchema(BaseModel):
+    seller: Seller
+    min_price: int
+    max_price: int
+    avg_price: float
+    last_price: int
+    last_recorded_at: datetime
+    samples: int
+
+
+# `?fields=` responses: only the requested keys, so no fixed schema
+GrocerySparseResponseSchema = Dict[str, Any]
+
+
+class GroceryBatchResponseSchema(BaseModel):
+    # in request order
+    items: List[Union[GroceryDetailResponseSchema, GrocerySparseResponseSchema]]
+    missing_ids: List[UUID]
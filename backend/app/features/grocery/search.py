@@ -0,0 +1,80 @@
+"""
+search.py (feature scoped)
+
+SQL expressions behind the list endpoint's `?search=` parameter.
+
+Every predicate built here has an index of its own, so the planner can combine
+the ORed arms into a BitmapOr:
+    •	name / brand     → trigram GIN indexes (`ILIKE '%term%'`)
+    •	search_vector    → GIN index on the generated tsvector (prefix match)
+    •	enum columns     → typed `IN (...)` over the matching enum members
+    	(`ix_grocery_type` / `_category` / `_current_seller` / `_best_seller`)
+    •	prices           → typed equality, only when the term is a number
+    	(`ix_grocery_current_price_id`, `ix_grocery_effective_best_price_id`)
+
+A column without an index must never be added here: one unindexed arm turns
+the whole OR into a sequential scan. Broad terms (a seller name matches a
+sixth of the table) may still get one, when the planner finds it cheaper.
+"""
+
+import re
+
+from sqlalchemy import func, or_, ColumnElement, Float
+
+from app.common.enums import GroceryType, Seller, GroceryCategory
+from app.features.grocery.models import Grocery
+
+# must match the regconfig used by the `search_vector` generated column
+SEARCH_CONFIG = 'simple'
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+_ENUM_FIELDS = (
+    (Grocery.type, GroceryType),
+    (Grocery.current_seller, Seller),
+    (Grocery.best_seller, Seller),
+    (Grocery.category, GroceryCategory),
+)
+# `effective_best_price` is the expression `ix_grocery_effective_best_price_id` is built on
+_INTEGER_FIELDS = (
+    Grocery.current_price,
+    Grocery.effective_best_price,
+)
+
+
+def _build_tsquery(search: str) -> ColumnElement | None:
+    """Prefix query, e.g. 'red lent' → to_tsquery('red:* & lent:*')"""
+    tokens = _TOKEN_PATTERN.findall(search.lower())
+    if not tokens:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, ' & '.join(f'{token}:*' for token in tokens))
+
+
+def build_search_condition(search: str) -> ColumnElement:
+    term = f"%{search}%"
+    conditions = [Grocery.name.ilike(term), Grocery.brand.ilike(term)]
+
+    ts_query = _build_tsquery(search)
+    if ts_query is not None:
+        conditions.append(Grocery.search_vector.op('@@')(ts_query))
+
+    needle = search.strip().lower()
+    for column, enum_cls in _ENUM_FIELDS:
+        matches = [member for member in enum_cls if needle and needle in member.value]
+        if matches:
+            conditions.append(column.in_(matches))
+
+    # integer columns are int4 → anything longer can't match and would overflow the bind
+    if needle.isdigit() and len(needle) <= 9:
+        conditions.extend(column == int(needle) for column in _INTEGER_FIELDS)
+
+    return or_(*conditions)
+
+
+def build_search_rank(search: str) -> ColumnElement:
+    """Relevance score: full-text rank plus trigram similarity of the name."""
+    rank = func.similarity(Grocery.name, search, type_=Float)
+    ts_query = _build_tsquery(search)
+    if ts_query is not None:
+        rank = func.ts_rank(Grocery.search_vector, ts_query, type_=Float) + rank
+    return rank
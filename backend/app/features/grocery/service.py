@@ -16,114 +16,333 @@ Router calls service.
 Never skip this layer in large apps.
 """
 
-from typing import Tuple, List
+from dataclasses import replace
+from typing import List, Sequence, AsyncIterator
+from uuid import UUID
 import logging
-from app.common.enums import Seller
+from app.common.dataloader import DataLoader
+from app.common.enums import ExportFormat, GroceryType, GroceryCategory, Seller, GroceryStockStatus
+from app.common.export import CsvEncoder, encode_ndjson
+from app.common.http_cache import make_etag
+from app.common.pagination import CursorParams, CursorPage, SerializedCursorPage
+from app.common.responses import dump_json
+from .cache import (
+    grocery_response_cache,
+    list_cache_key,
+    detail_cache_key,
+    TaggedResponse,
+    SHOPPING_LIST_CACHE_KEY,
+    SUMMARY_CACHE_KEY,
+)
+from .fieldsets import LIST_COLUMNS, DETAIL_COLUMNS, DETAIL_FIELDS, columns_for, project
 from .filters import GroceryFilterParams
 from .models import Grocery
+from .pricing import best_price_values
 from .repository import GroceryRepository
-from .schemas.request_schemas import GroceryCreateSchema, GroceryUpdateSchema, GroceryBulkUpdateSchema
+from .schemas.request_schemas import (
+    GroceryCreateSchema,
+    GroceryBulkCreateSchema,
+    GroceryUpdateSchema,
+    GroceryBulkUpdateSchema,
+    GroceryBulkPatchSchema,
+)
 from .schemas.response_schemas import (
     GroceryListResponseSchema,
     GroceryDetailResponseSchema,
-    GroceryCreateResponseSchema, GroceryUpdateResponseSchema
+    GroceryCreateResponseSchema, GroceryUpdateResponseSchema,
+    GroceryBulkCreateResponseSchema,
+    GroceryPriceStatsResponseSchema,
+    GroceryShoppingListResponseSchema,
+    GrocerySummaryResponseSchema,
+    GroceryBatchResponseSchema,
+    GrocerySparseResponseSchema,
 )
 from ...common.constants import GROCERY_NOT_FOUND
 from ...core.exceptions import ResourceNotFoundException
+from ...utils.month_helper import month_start
 from ...utils.uuid_validation_helper import validate_uuid
 
 logger = logging.getLogger(__name__)
 
 
 class GroceryService:
-    def __init__(self, repo: GroceryRepository):
+    def __init__(self, repo: GroceryRepository, read_cache: bool = True):
         self.repo = repo
+        # False → always read from the DB (responses are still cached for others)
+        self.read_cache = read_cache
+        # per-id detail lookups made in the same event-loop tick share one query
+        self.grocery_loader: DataLoader[UUID, dict] = DataLoader(self.__load_groceries)
 
-    # ───────────────────────────────────────────────
-    # Business rule helpers
-    # ───────────────────────────────────────────────
-    @staticmethod
-    def __update_best_price_and_best_seller(
-            new_price: int,
-            best_price: int,
-            new_seller: Seller,
-            best_seller: Seller,
-    ) -> Tuple[int, Seller]:
-        if best_price is None:
-            best_price = new_price
-            best_seller = Seller.MEENA
-            return best_price, best_seller
-        if new_price < best_price:
-            best_price = new_price
-            best_seller = new_seller
-
-        return best_price, best_seller
+    async def __load_groceries(self, grocery_ids: list[UUID]) -> dict[UUID, dict]:
+        return await self.repo.get_rows_by_ids(grocery_ids, DETAIL_COLUMNS)
 
     # ───────────────────────────────────────────────
     # Prepare / mapping methods
     # ───────────────────────────────────────────────
     @staticmethod
-    def __prepare_grocery(data: GroceryCreateSchema) -> Grocery:
-        """Map create schema → ORM model + apply business defaults/rules"""
+    def __prepare_grocery_values(data: GroceryCreateSchema) -> dict:
+        """Map create schema → column values + apply business defaults/rules"""
         values = data.model_dump()
         values["current_price"] = data.current_price
         values["best_seller"] = values["current_seller"]
         values["best_price"] = values["current_price"]
-        return Grocery(**values)
+        return values
 
-    def __prepare_grocery_for_update(self, grocery: Grocery, data: GroceryUpdateSchema) -> Grocery:
-        update_values = data.model_dump(exclude_unset=True)
-        for key, value in update_values.items():
-            if hasattr(grocery, key):
-                setattr(grocery, key, value)
+    @staticmethod
+    def __prepare_grocery(data: GroceryCreateSchema) -> Grocery:
+        """Map create schema → ORM model + apply business defaults/rules"""
+        return Grocery(**GroceryService.__prepare_grocery_values(data))
 
+    @staticmethod
+    def __prepare_grocery_for_update(data: GroceryUpdateSchema) -> dict:
+        """Map update schema → `SET` values; best price/seller are recomputed by the database"""
+        update_values = data.model_dump(exclude_unset=True)
         if "current_price" in update_values or "current_seller" in update_values:
-            best_price, best_seller = self.__update_best_price_and_best_seller(
-                update_values.get("current_price", grocery.current_price),
-                grocery.best_price,
-                update_values.get("current_seller", grocery.current_seller),
-                grocery.best_seller
-            )
-            grocery.best_price = best_price
-            grocery.best_seller = best_seller
-
-        return grocery
+            update_values.update(best_price_values(
+                update_values.get("current_price"),
+                update_values.get("current_seller"),
+            ))
+        return update_values
 
     # ───────────────────────────────────────────────
     # Public API methods
     # ───────────────────────────────────────────────
 
-    async def list_all_groceries(self, filters: GroceryFilterParams | None = None) -> List[GroceryListResponseSchema]:
-        groceries = await self.repo.get_groceries(filters)
+    async def list_all_groceries(
+            self,
+            filters: GroceryFilterParams | None = None,
+            pagination: CursorParams | None = None,
+            fields: Sequence[str] | None = None,
+    ) -> CursorPage[GroceryListResponseSchema | GrocerySparseResponseSchema]:
+        columns = columns_for(fields) if fields else LIST_COLUMNS
+        page = await self.repo.get_groceries(filters, pagination, columns)
         logger.info('Get groceries')
-        return [GroceryListResponseSchema.model_validate(item) for item in groceries]
+        if fields:
+            items = [project(row, fields) for row in page.items]
+        else:
+            items = [GroceryListResponseSchema.model_validate(row) for row in page.items]
+        return CursorPage(items=items, limit=page.limit, next_cursor=page.next_cursor)
 
-    async def get_grocery_by_id(self, grocery_id) -> GroceryDetailResponseSchema:
+    async def get_grocery_by_id(
+            self, grocery_id, fields: Sequence[str] | None = None
+    ) -> GroceryDetailResponseSchema | GrocerySparseResponseSchema:
         validated_id = validate_uuid(grocery_id)
-        grocery = await self.repo.get_by_id(validated_id)
-        if grocery is None:
+        columns = columns_for(fields) if fields else DETAIL_COLUMNS
+        row = await self.repo.get_row_by_id(validated_id, columns)
+        if row is None:
             raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=validated_id))
-        return GroceryDetailResponseSchema.model_validate(grocery)
+        if fields:
+            return project(row, fields)
+        return GroceryDetailResponseSchema.model_validate(row)
+
+    async def get_groceries_by_ids(
+            self, grocery_ids: Sequence[str], fields: Sequence[str] | None = None
+    ) -> GroceryBatchResponseSchema:
+        """Multi-get in request order; every id is validated before anything is fetched"""
+        validated_ids = list(dict.fromkeys(validate_uuid(grocery_id) for grocery_id in grocery_ids))
+        rows = await self.grocery_loader.load_many(validated_ids)
+        items = [
+            project(row, fields) if fields else GroceryDetailResponseSchema.model_validate(row)
+            for row in rows if row is not None
+        ]
+        missing_ids = [grocery_id for grocery_id, row in zip(validated_ids, rows) if row is None]
+        return GroceryBatchResponseSchema(items=items, missing_ids=missing_ids)
+
+    async def get_groceries_etag(
+            self,
+            filters: GroceryFilterParams | None = None,
+            pagination: CursorParams | None = None,
+            fields: Sequence[str] | None = None,
+    ) -> TaggedResponse:
+        """
+        ETag of one list page. A cached page comes with its ETag and costs no query;
+        otherwise the ETag is built from the table's commit-ordered change counter.
+        """
+        cache_key = list_cache_key(filters, pagination, fields)
+        cached = grocery_response_cache.get(cache_key) if self.read_cache else None
+        if cached is not None:
+            return cached
+
+        version = grocery_response_cache.version
+        table_version = await self.repo.get_version()
+        return TaggedResponse(make_etag(cache_key, table_version), version)
+
+    async def get_grocery_etag(self, grocery_id, fields: Sequence[str] | None = None) -> TaggedResponse:
+        """ETag of one item, from the cache like `get_groceries_etag` or from its updated_at"""
+        validated_id = validate_uuid(grocery_id)
+        cache_key = detail_cache_key(validated_id, fields)
+        cached = grocery_response_cache.get(cache_key) if self.read_cache else None
+        if cached is not None:
+            return cached
+
+        version = grocery_response_cache.version
+        updated_at = await self.repo.get_updated_at(validated_id)
+        if updated_at is None:
+            raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=validated_id))
+        return TaggedResponse(make_etag(cache_key, updated_at), version)
+
+    async def list_all_groceries_json(
+            self,
+            filters: GroceryFilterParams | None = None,
+            pagination: CursorParams | None = None,
+            fields: Sequence[str] | None = None,
+            tagged: TaggedResponse | None = None,
+    ) -> SerializedCursorPage:
+        """
+        `list_all_groceries`, serialized. Given the `get_groceries_etag` result,
+        returns its cached body, or caches the loaded one under its ETag.
+        """
+        if tagged is not None and tagged.body is not None:
+            return tagged.body
+
+        page = await self.list_all_groceries(filters, pagination, fields)
+        data_type = List[GrocerySparseResponseSchema] if fields else List[GroceryListResponseSchema]
+        serialized = SerializedCursorPage(
+            data_json=dump_json(page.items, data_type),
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+        )
+        if tagged is not None:
+            grocery_response_cache.set(
+                list_cache_key(filters, pagination, fields), replace(tagged, body=serialized), tagged.version
+            )
+        return serialized
+
+    async def get_grocery_by_id_json(
+            self, grocery_id, fields: Sequence[str] | None = None, tagged: TaggedResponse | None = None
+    ) -> bytes:
+        """`get_grocery_by_id`, serialized; cached like `list_all_groceries_json`"""
+        if tagged is not None and tagged.body is not None:
+            return tagged.body
+
+        item = await self.get_grocery_by_id(grocery_id, fields)
+        data_json = dump_json(item, GrocerySparseResponseSchema if fields else GroceryDetailResponseSchema)
+        if tagged is not None:
+            grocery_response_cache.set(
+                detail_cache_key(validate_uuid(grocery_id), fields), replace(tagged, body=data_json), tagged.version
+            )
+        return data_json
+
+    async def get_shopping_list_json(self) -> bytes:
+        """Below-stock or should_include items with their estimated total, cached until the next write"""
+        cached = grocery_response_cache.get(SHOPPING_LIST_CACHE_KEY) if self.read_cache else None
+        if cached is not None:
+            return cached
+
+        version = grocery_response_cache.version
+        rows, estimated_total = await self.repo.get_shopping_list(LIST_COLUMNS)
+        shopping_list = GroceryShoppingListResponseSchema(
+            items=[GroceryListResponseSchema.model_validate(row) for row in rows],
+            item_count=len(rows),
+            estimated_total=estimated_total,
+        )
+        data_json = dump_json(shopping_list, GroceryShoppingListResponseSchema)
+        grocery_response_cache.set(SHOPPING_LIST_CACHE_KEY, data_json, version)
+        return data_json
+
+    async def get_summary_json(self) -> bytes:
+        """Dashboard counts and monthly spend, cached until the next write"""
+        cached = grocery_response_cache.get(SUMMARY_CACHE_KEY) if self.read_cache else None
+        if cached is not None:
+            return cached
+
+        version = grocery_response_cache.version
+        rows = await self.repo.get_summary_rows()
+        # every enum member is present (0 when empty), so the payload shape never depends on the data
+        counts = {
+            'type': dict.fromkeys(GroceryType, 0),
+            'category': dict.fromkeys(GroceryCategory, 0),
+            'current_seller': dict.fromkeys(Seller, 0),
+            'is_below_stock': dict.fromkeys(GroceryStockStatus, 0),
+        }
+        total_items, monthly_spend = 0, 0
+        for row in rows:
+            if row['dimension'] is None:
+                total_items, monthly_spend = row['item_count'], row['monthly_spend']
+            elif row['dimension'] == 'is_below_stock':
+                status = GroceryStockStatus.BELOW_STOCK if row['value'] else GroceryStockStatus.IN_STOCK
+                counts['is_below_stock'][status] = row['item_count']
+            else:
+                counts[row['dimension']][row['value']] = row['item_count']
+
+        summary = GrocerySummaryResponseSchema(
+            total_items=total_items,
+            monthly_spend=monthly_spend,
+            by_type=counts['type'],
+            by_category=counts['category'],
+            by_seller=counts['current_seller'],
+            by_stock_status=counts['is_below_stock'],
+        )
+        data_json = dump_json(summary, GrocerySummaryResponseSchema)
+        grocery_response_cache.set(SUMMARY_CACHE_KEY, data_json, version)
+        return data_json
+
+    async def get_price_stats(self, grocery_id, months: int) -> List[GroceryPriceStatsResponseSchema]:
+        """Per-seller price stats over the current month and the `months - 1` before it"""
+        validated_id = validate_uuid(grocery_id)
+        rows = await self.repo.get_price_stats(validated_id, month_start(-(months - 1)))
+        # only an empty result needs the extra existence check
+        if not rows and await self.repo.get_updated_at(validated_id) is None:
+            raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=validated_id))
+        return [GroceryPriceStatsResponseSchema.model_validate(row) for row in rows]
+
+    async def ensure_price_history_partitions(self, months_ahead: int) -> None:
+        await self.repo.ensure_price_history_partitions([month_start(offset) for offset in range(months_ahead + 1)])
+
+    async def export_groceries(
+            self,
+            filters: GroceryFilterParams | None = None,
+            export_format: ExportFormat = ExportFormat.NDJSON,
+            fields: Sequence[str] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream the (filtered) catalog as NDJSON or CSV chunks, one DB batch per chunk"""
+        fields = fields or DETAIL_FIELDS
+        csv_encoder = CsvEncoder(fields)
+        if export_format == ExportFormat.CSV:
+            yield csv_encoder.header()
+
+        exported = 0
+        async for rows in self.repo.stream_groceries(filters, columns_for(fields)):
+            items = [project(row, fields) for row in rows]
+            exported += len(items)
+            if export_format == ExportFormat.CSV:
+                yield csv_encoder.encode(items)
+            else:
+                yield encode_ndjson(items)
+        logger.info(f'Exported {exported} groceries as {export_format.value}')
 
     async def create_grocery(self, data: GroceryCreateSchema) -> GroceryCreateResponseSchema:
         grocery = self.__prepare_grocery(data)
         created_grocery = await self.repo.add_grocery(grocery)
+        grocery_response_cache.bump_version()
         return GroceryCreateResponseSchema.model_validate(created_grocery)
 
+    async def bulk_create_groceries(self, data: GroceryBulkCreateSchema) -> List[GroceryBulkCreateResponseSchema]:
+        """All-or-nothing: either every item is created or the whole batch is rolled back"""
+        values = [self.__prepare_grocery_values(item) for item in data.items]
+        created_rows = await self.repo.bulk_add_groceries(values)
+        grocery_response_cache.bump_version()
+        logger.info(f'Bulk created {len(created_rows)} groceries')
+        return [
+            GroceryBulkCreateResponseSchema.model_validate({**row, 'index': index})
+            for index, row in enumerate(created_rows)
+        ]
+
     async def update_grocery(self, grocery_id: str, data: GroceryUpdateSchema) -> GroceryUpdateResponseSchema:
-        grocery = await self.repo.get_by_id(grocery_id)
-        if grocery is None:
+        validated_id = validate_uuid(grocery_id)
+        update_values = self.__prepare_grocery_for_update(data)
+        updated_grocery = await self.repo.update_grocery(validated_id, update_values)
+        if updated_grocery is None:
             logger.error(GROCERY_NOT_FOUND.format(grocery_id=grocery_id))
             raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=grocery_id))
-        updated_grocery_data = self.__prepare_grocery_for_update(grocery, data)
-        updated_grocery = await self.repo.update_grocery(updated_grocery_data)
+        grocery_response_cache.bump_version()
         return GroceryUpdateResponseSchema.model_validate(updated_grocery)
 
     async def delete_grocery(self, grocery_id: str) -> None:
-        grocery = await self.repo.get_by_id(grocery_id)
-        if grocery is None:
+        deleted_id = await self.repo.delete_grocery(validate_uuid(grocery_id))
+        if deleted_id is None:
             raise ResourceNotFoundException(message=GROCERY_NOT_FOUND.format(grocery_id=grocery_id))
-        await self.repo.delete_grocery(grocery)
+        grocery_response_cache.bump_version()
 
     async def bulk_update_should_include(
             self, data: GroceryBulkUpdateSchema
@@ -131,6 +350,7 @@ class GroceryService:
         updated_groceries = await self.repo.bulk_update_should_include(
             data.grocery_ids, data.should_include
         )
+        grocery_response_cache.bump_version()
         found_ids = {grocery.id for grocery in updated_groceries}
         missing_ids = [str(gid) for gid in data.grocery_ids if gid not in found_ids]
         if missing_ids:
@@ -139,3 +359,12 @@ class GroceryService:
                 message=GROCERY_NOT_FOUND.format(grocery_id=", ".join(missing_ids))
             )
         return [GroceryUpdateResponseSchema.model_validate(grocery) for grocery in updated_groceries]
+
+    async def bulk_patch_groceries(self, data: GroceryBulkPatchSchema) -> List[GroceryUpdateResponseSchema]:
+        """Price/seller/stock changes for many items at once (e.g. after a shopping trip)"""
+        changes = [item.model_dump(exclude_unset=True) for item in data.items]
+        # all-or-nothing: missing ids roll the batch back and raise in the repository
+        updated_rows = await self.repo.bulk_patch_groceries(changes)
+        grocery_response_cache.bump_version()
+        rows_by_id = {row['id']: row for row in updated_rows}
+        return [GroceryUpdateResponseSchema.model_validate(rows_by_id[item.id]) for item in data.items]
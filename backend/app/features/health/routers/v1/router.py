@@ -0,0 +1,46 @@
+"""
+Only HTTP concerns:
+	•	request/response
+	•	status codes
+
+Liveness / readiness probes for load balancers and orchestrators.
+"""
+from typing import Any, Dict
+
+from fastapi import APIRouter, status
+
+from app.common.responses import ApiJSONResponse
+from app.core.api_response_schema import ApiResponseSchema
+from app.core.readiness import readiness
+
+router = APIRouter(
+    prefix="/v1/health",
+    tags=["health"],
+)
+
+
+@router.get(
+    "/live",
+    response_model=ApiResponseSchema[None],
+    status_code=status.HTTP_200_OK,
+    summary="The process is up",
+)
+async def live():
+    return ApiJSONResponse.from_json(message='Alive')
+
+
+@router.get(
+    "/ready",
+    response_model=ApiResponseSchema[Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Warming up or draining"}},
+    summary="Warm-up finished and not shutting down",
+)
+async def ready():
+    return ApiJSONResponse.from_data(
+        readiness.stats(),
+        Dict[str, Any],
+        message='Ready' if readiness.ready else f'Not ready: {readiness.phase.value}',
+        success=readiness.ready,
+        status_code=status.HTTP_200_OK if readiness.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
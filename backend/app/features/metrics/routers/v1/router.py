@@ -0,0 +1,37 @@
+"""
+Only HTTP concerns:
+	•	request/response
+	•	status codes
+
+Per-worker runtime metrics (caches, pools, ...) for sizing and debugging.
+"""
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, status
+
+from app.common.responses import ApiJSONResponse
+from app.core.api_response_schema import ApiResponseSchema
+from app.core.dependencies import get_current_user
+from app.core.metrics import collect_metrics
+from app.features.auth.cache import CurrentUser
+
+router = APIRouter(
+    prefix="/v1/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get(
+    "/",
+    response_model=ApiResponseSchema[Dict[str, Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary="Runtime metrics of this worker process",
+)
+async def get_metrics(
+        _current_user: CurrentUser = Depends(get_current_user),
+):
+    return ApiJSONResponse.from_data(
+        collect_metrics(),
+        Dict[str, Dict[str, Any]],
+        message='Metrics fetched successfully',
+    )
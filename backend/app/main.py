@@ -1,26 +1,98 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 from app.core.config import settings
 from app.api.router import api_router
 from app.core.exception_handlers import register_exception_handlers
+from app.core.exceptions import AppBaseException
 from app.core.log_config import configure_logging
 from app.core.openapi_config import custom_openapi
+from app.core.readiness import readiness
+from app.core.warmup import warm_up
+from app.db.session import async_session_factory, engine, replicas
+from app.features.auth.repository import AuthRepository
+from app.features.auth.service import AuthService
+from app.features.grocery.repository import GroceryRepository
+from app.features.grocery.service import GroceryService
+from app.middleware.in_flight import InFlightRequestMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 from app.middleware.request_logger import RequestLoggerMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from app.utils.hashing import password_hash_executor
+from app.utils.jwt_keys import get_key_ring
 
 # ── Logging ────────────────────────────────────────────────────────────────
 # step logger
 configure_logging(level=settings.LOG_LEVEL, environment=settings.ENVIRONMENT)
+logger = logging.getLogger(__name__)
+
+
+async def ensure_price_history_partitions() -> None:
+    """Upcoming months' price history partitions; rows still land in the default partition without them"""
+    try:
+        async with async_session_factory() as session:
+            await GroceryService(GroceryRepository(session)).ensure_price_history_partitions(
+                settings.PRICE_HISTORY_PARTITIONS_AHEAD
+            )
+    except (AppBaseException, OSError):
+        logger.exception('Could not create price history partitions')
+
+
+async def sync_revoked_token_families(purge_expired: bool = False) -> None:
+    try:
+        async with async_session_factory() as session:
+            auth_service = AuthService(AuthRepository(session))
+            if purge_expired:
+                await auth_service.delete_expired_refresh_tokens()
+            await auth_service.sync_revoked_families()
+    except (AppBaseException, OSError, SQLAlchemyError):
+        logger.exception('Could not sync revoked refresh token families')
+
+
+async def keep_revoked_token_families_synced() -> None:
+    while True:
+        await asyncio.sleep(settings.REFRESH_REVOCATION_SYNC_SECONDS)
+        await sync_revoked_token_families()
+
+
+async def keep_replica_health_checked() -> None:
+    while True:
+        await asyncio.sleep(settings.DB_REPLICA_HEALTH_CHECK_SECONDS)
+        await replicas.check_health()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # startup code here if needed
+    # parse JWT keys once; a bad key configuration stops the app here
+    get_key_ring()
+    await ensure_price_history_partitions()
+    await sync_revoked_token_families(purge_expired=True)
+    # replicas serve reads only once a health check has passed
+    await replicas.check_health()
+    background_tasks = [asyncio.create_task(keep_revoked_token_families_synced())]
+    if replicas.configured:
+        background_tasks.append(asyncio.create_task(keep_replica_health_checked()))
+    if settings.STARTUP_WARM_UP:
+        await warm_up(app)
+    readiness.mark_ready()
     print("Application startup complete ✓")
     yield
+    # requests still running keep their pools until they finish (or the drain times out)
+    still_running = await readiness.drain(settings.SHUTDOWN_DRAIN_SECONDS)
+    if still_running:
+        logger.warning(f'Shutting down with {still_running} request(s) still in flight')
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hash_executor.shutdown()
+    await replicas.dispose()
+    await engine.dispose()
     print("Application shutdown complete ✓")
-    # shutdown code here if needed
 
 
 app = FastAPI(
@@ -39,6 +111,18 @@ app.openapi = lambda: custom_openapi(app=app)
 # request logger middleware
 app.add_middleware(RequestLoggerMiddleware, env_name=settings.ENVIRONMENT)
 
+# per-request DB / serialization timing (Server-Timing header, request log fields);
+# added after the request logger so the logger runs inside it and sees the totals
+app.add_middleware(ServerTimingMiddleware, send_header=settings.SERVER_TIMING_HEADER)
+
+# read-your-writes pinning, only meaningful with replicas (only grocery routes read from them)
+if settings.DB_REPLICA_URLS and settings.READ_YOUR_WRITES_SECONDS > 0:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window_seconds=settings.READ_YOUR_WRITES_SECONDS,
+        path_prefix='/api/v1/groceries',
+    )
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +132,9 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# in-flight request tracking for shutdown draining; outermost, so it sees the whole request
+app.add_middleware(InFlightRequestMiddleware, readiness=readiness)
+
 # ── Exception handlers ──────────────────────────────────────────────────────
 register_exception_handlers(app)
 
@@ -0,0 +1,40 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.exception_handlers import error_response
+from app.core.exceptions import ServiceUnavailableException
+from app.core.readiness import Readiness
+
+# probes keep answering while draining, so the orchestrator sees `draining`
+HEALTH_PATH_PREFIX = '/api/v1/health/'
+
+
+class InFlightRequestMiddleware:
+    """
+    Counts in-flight HTTP requests for shutdown draining, and turns new ones
+    away with 503 once draining started.
+
+    Plain ASGI rather than BaseHTTPMiddleware: a streamed response (export)
+    stays in flight until its last chunk is sent, not just its headers.
+    """
+
+    def __init__(self, app: ASGIApp, *, readiness: Readiness):
+        self.app = app
+        self.readiness = readiness
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['path'].startswith(HEALTH_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        if self.readiness.draining:
+            self.readiness.rejected_while_draining += 1
+            response = error_response(ServiceUnavailableException(message='Server is shutting down'))
+            response.headers['Connection'] = 'close'
+            await response(scope, receive, send)
+            return
+
+        self.readiness.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.readiness.request_finished()
@@ -0,0 +1,40 @@
+import time
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from app.db.replicas import READ_YOUR_WRITES_COOKIE
+
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    After a successful write under `path_prefix`, pins the client's reads there
+    to the primary for `window_seconds` (cookie read by `get_read_db`), so it
+    never reads its own write back from a replica that hasn't replayed it yet.
+    Writes elsewhere (login, register) don't touch replicated reads.
+    """
+
+    def __init__(self, app, *, window_seconds: int, path_prefix: str):
+        super().__init__(app)
+        self.window_seconds = window_seconds
+        self.path_prefix = path_prefix
+
+    async def dispatch(self, request: Request, call_next):
+        response: Response = await call_next(request)
+        if (
+                request.method not in SAFE_METHODS
+                and response.status_code < 400
+                and request.url.path.startswith(self.path_prefix)
+        ):
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                f'{time.time() + self.window_seconds:.3f}',
+                max_age=self.window_seconds,
+                path=self.path_prefix,
+                httponly=True,
+                samesite='lax',
+            )
+        return response
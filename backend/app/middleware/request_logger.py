@@ -5,6 +5,8 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
+from app.core.request_timing import current_timing
+
 # We'll get this logger from the root logger you already configured
 logger = logging.getLogger("request")
 
@@ -26,9 +28,17 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
         try:
             response: Response = await call_next(request)
             process_time = (time.perf_counter() - start_time) * 1000
+            # set by ServerTimingMiddleware; the fields also ride on the record for structured handlers
+            timing = current_timing()
+            db_summary = (
+                f" | DB: {timing.statements} queries {timing.db_seconds * 1000:.2f}ms"
+                f" | Serialization: {timing.serialization_seconds * 1000:.2f}ms"
+            ) if timing else ""
             logger.info(
                 f"FINISHED | {request.method} | {request.url.path} | "
-                f"Status: {response.status_code} | Duration: {process_time:.2f}ms")
+                f"Status: {response.status_code} | Duration: {process_time:.2f}ms{db_summary}",
+                extra=timing.log_fields() if timing else None,
+            )
             return response
 
         except Exception as e:
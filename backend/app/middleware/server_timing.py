@@ -0,0 +1,25 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from app.core.request_timing import track_request
+
+
+class ServerTimingMiddleware(BaseHTTPMiddleware):
+    """
+    Tracks the request's SQL statements, DB time and serialization time
+    (see app/core/request_timing.py) and reports them, with the total, in a
+    `Server-Timing` header. A streamed response's body is sent after the
+    header, so its serialization isn't included.
+    """
+
+    def __init__(self, app, *, send_header: bool = True):
+        super().__init__(app)
+        self.send_header = send_header
+
+    async def dispatch(self, request: Request, call_next):
+        with track_request() as timing:
+            response: Response = await call_next(request)
+            if self.send_header:
+                response.headers['Server-Timing'] = timing.server_timing()
+        return response
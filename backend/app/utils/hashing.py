@@ -1,16 +1,30 @@
 import logging
 from passlib.context import CryptContext
 
+from app.common.executor import BoundedExecutor
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+
 logger = logging.getLogger(__name__)
 
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 
+# Argon2 burns tens of milliseconds of CPU per call; run it off the event loop
+# (argon2-cffi releases the GIL) so a login burst can't stall other requests.
+password_hash_executor = BoundedExecutor(
+    name='password-hash',
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+    timeout_seconds=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
+register_metrics_source('password_hashing', password_hash_executor.stats)
+
 
-def hash_password(plain_password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(plain_password)
+async def hash_password(plain_password: str) -> str:
+    """Hash a password using argon2."""
+    return await password_hash_executor.run(pwd_context.hash, plain_password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a stored bcrypt hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a stored argon2 hash."""
+    return await password_hash_executor.run(pwd_context.verify, plain_password, hashed_password)
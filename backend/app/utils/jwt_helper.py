@@ -1,30 +1,63 @@
+import hashlib
+import time
+
 import jwt
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
+from app.common.cache import VersionedTTLCache
 from app.core.config import settings
 from app.core.exceptions import UnauthorizedException
+from app.core.metrics import register_metrics_source
+from app.utils.jwt_keys import get_key_ring
+
+# Verified claims by token digest, each kept until its token's `exp`. The
+# returned dicts are shared between requests: read them, never mutate them.
+claims_cache = VersionedTTLCache(
+    max_entries=settings.JWT_CLAIMS_CACHE_MAX_ENTRIES,
+    ttl_seconds=max(settings.ACCESS_TOKEN_EXPIRE_MINUTES, settings.REFRESH_TOKEN_EXPIRE_MINUTES) * 60,
+)
+register_metrics_source('jwt_claims_cache', claims_cache.stats)
 
 
 class JWTHelper:
     @staticmethod
-    def create_access_token(subject: str) -> str:
+    def create_access_token(subject: str, claims: dict[str, Any] | None = None) -> str:
         expiry_time = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode = {'exp': expiry_time, 'sub': str(subject), 'type': 'access'}
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        to_encode = {**(claims or {}), 'exp': expiry_time, 'sub': str(subject), 'type': 'access'}
+        return get_key_ring().sign(to_encode)
 
     @staticmethod
-    def create_refresh_token(subject: str) -> str:
-        expiry_time = datetime.now(timezone.utc) + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
-        to_encode = {'exp': expiry_time, 'sub': str(subject), 'type': 'refresh'}
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    def refresh_token_expiry() -> datetime:
+        return datetime.now(timezone.utc) + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
 
     @staticmethod
-    def verify_token(token: str) -> str | None:
+    def create_refresh_token(
+            subject: str,
+            claims: dict[str, Any] | None = None,
+            expires_at: datetime | None = None,
+    ) -> str:
+        expiry_time = expires_at or JWTHelper.refresh_token_expiry()
+        to_encode = {**(claims or {}), 'exp': expiry_time, 'sub': str(subject), 'type': 'refresh'}
+        return get_key_ring().sign(to_encode)
+
+    @staticmethod
+    def decode_token(token: str) -> dict[str, Any]:
+        digest = hashlib.sha256(token.encode()).digest() if isinstance(token, str) else None
+        claims = claims_cache.get(digest) if digest else None
+        if claims is not None:
+            return claims
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            email: str = payload.get('sub')
-            return email
+            claims = get_key_ring().verify(token)
         except jwt.ExpiredSignatureError as e:
             raise UnauthorizedException(message='Session expired, please login again') from e
         except jwt.InvalidTokenError as e:
             raise UnauthorizedException(message='Invalid token, please login again') from e
+        if digest and 'exp' in claims:
+            claims_cache.set(digest, claims, ttl_seconds=claims['exp'] - time.time())
+        return claims
+
+    @staticmethod
+    def verify_token(token: str) -> str | None:
+        email: str = JWTHelper.decode_token(token).get('sub')
+        return email
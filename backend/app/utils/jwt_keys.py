@@ -0,0 +1,107 @@
+"""
+JWT key material, parsed once per process.
+
+    •	HS256       → signs and verifies with SECRET_KEY, so every verifier needs the secret
+    •	EdDSA/ES256 → signs with the PEM private key in JWT_PRIVATE_KEY_FILE, verifies with
+    	              public keys only (the signing key's own plus those in JWT_JWKS_FILE)
+
+Asymmetric tokens carry the signing key's id in the `kid` header and are
+verified with exactly that key and its algorithm, so keys can be rotated by
+listing the previous public key in the JWKS file until its tokens expire.
+A verify-only worker or sidecar just sets ALGORITHM and JWT_JWKS_FILE.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from jwt.algorithms import get_default_algorithms
+
+from app.core.config import settings
+
+SYMMETRIC_ALGORITHMS = {'HS256'}
+ASYMMETRIC_ALGORITHMS = {'EdDSA', 'ES256'}
+
+# RFC 7638 required members per key type
+_THUMBPRINT_MEMBERS = {'OKP': ('crv', 'kty', 'x'), 'EC': ('crv', 'kty', 'x', 'y')}
+
+
+def jwk_thumbprint(jwk: dict[str, Any]) -> str:
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk['kty']]}
+    digest = hashlib.sha256(json.dumps(members, separators=(',', ':'), sort_keys=True).encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+
+@dataclass
+class JWTKeyRing:
+    algorithm: str
+    signing_key: Any = None
+    signing_kid: str | None = None
+    # kid → (parsed key, the only algorithm accepted with it)
+    verification_keys: dict[str | None, tuple[Any, str]] = field(default_factory=dict)
+    public_jwks: list[dict[str, Any]] = field(default_factory=list)
+
+    def sign(self, payload: dict[str, Any]) -> str:
+        if self.signing_key is None:
+            raise ValueError(f'No {self.algorithm} signing key configured, this process can only verify tokens')
+        headers = {'kid': self.signing_kid} if self.signing_kid else None
+        return jwt.encode(payload, self.signing_key, algorithm=self.algorithm, headers=headers)
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Raises jwt.InvalidTokenError (or a subclass) for any token it can't verify"""
+        kid = jwt.get_unverified_header(token).get('kid')
+        if kid not in self.verification_keys:
+            raise jwt.InvalidTokenError(f'Unknown key id {kid!r}')
+        key, algorithm = self.verification_keys[kid]
+        return jwt.decode(token, key, algorithms=[algorithm], options={'require': ['exp', 'sub']})
+
+
+def _load_private_key(ring: JWTKeyRing) -> None:
+    private_key = load_pem_private_key(Path(settings.JWT_PRIVATE_KEY_FILE).read_bytes(), password=None)
+    public_jwk = get_default_algorithms()[ring.algorithm].to_jwk(private_key.public_key(), as_dict=True)
+    ring.signing_key = private_key
+    ring.signing_kid = settings.JWT_KEY_ID or jwk_thumbprint(public_jwk)
+    public_jwk.update({'kid': ring.signing_kid, 'alg': ring.algorithm, 'use': 'sig'})
+    ring.verification_keys[ring.signing_kid] = (private_key.public_key(), ring.algorithm)
+    ring.public_jwks.append(public_jwk)
+
+
+def _load_jwks_file(ring: JWTKeyRing) -> None:
+    jwks = json.loads(Path(settings.JWT_JWKS_FILE).read_text())
+    for jwk_data in jwks['keys']:
+        jwk = jwt.PyJWK(jwk_data)
+        if jwk.algorithm_name not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f'Unsupported key in {settings.JWT_JWKS_FILE}: {jwk.algorithm_name}')
+        kid = jwk.key_id or jwk_thumbprint(jwk_data)
+        ring.verification_keys.setdefault(kid, (jwk.key, jwk.algorithm_name))
+        if all(known.get('kid') != kid for known in ring.public_jwks):
+            ring.public_jwks.append({**jwk_data, 'kid': kid})
+
+
+@cache
+def get_key_ring() -> JWTKeyRing:
+    """Parsed once; call it on startup so bad key configuration fails fast"""
+    ring = JWTKeyRing(algorithm=settings.ALGORITHM)
+    if ring.algorithm in SYMMETRIC_ALGORITHMS:
+        if not settings.SECRET_KEY:
+            raise ValueError(f'SECRET_KEY is required for {ring.algorithm}')
+        ring.signing_key = settings.SECRET_KEY
+        ring.signing_kid = settings.JWT_KEY_ID
+        ring.verification_keys[settings.JWT_KEY_ID] = (settings.SECRET_KEY, ring.algorithm)
+        return ring
+
+    if ring.algorithm not in ASYMMETRIC_ALGORITHMS:
+        raise ValueError(f'Unsupported ALGORITHM {ring.algorithm}')
+    if settings.JWT_PRIVATE_KEY_FILE:
+        _load_private_key(ring)
+    if settings.JWT_JWKS_FILE:
+        _load_jwks_file(ring)
+    if not ring.verification_keys:
+        raise ValueError(f'{ring.algorithm} needs JWT_PRIVATE_KEY_FILE and/or JWT_JWKS_FILE')
+    return ring
@@ -0,0 +1,8 @@
+from datetime import date, datetime, timezone
+
+
+def month_start(offset: int = 0, today: date | None = None) -> date:
+    """First day of the (UTC) month `offset` months from the current one (negative = past)"""
+    today = today or datetime.now(timezone.utc).date()
+    month_index = today.year * 12 + today.month - 1 + offset
+    return date(month_index // 12, month_index % 12 + 1, 1)
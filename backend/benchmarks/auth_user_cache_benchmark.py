@@ -0,0 +1,99 @@
+"""
+Authentication overhead on a protected grocery write route.
+
+Creates a throwaway user, then sends `--requests` `DELETE /{grocery_id}`
+requests for random (non-existent) ids — a protected write that passes
+authentication and answers 404 without changing any data — in three modes:
+
+    •	database → user cache disabled: one `user` lookup per request (the old behaviour)
+    •	cache    → user cache on (populated by the login)
+    •	claims   → AUTH_TRUST_TOKEN_CLAIMS on: no user lookup at all
+
+The route's own work is identical in every mode, so the latency difference
+is the per-request cost of authentication. The throwaway user is deleted at
+the end.
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.auth_user_cache_benchmark --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.db.session import async_session_factory, engine
+from app.features.auth.cache import user_cache, user_cache_stats
+from app.features.auth.models import User
+from app.main import app
+from app.utils.jwt_helper import claims_cache
+
+PASSWORD = 'benchmark-password'
+
+
+async def _register_and_login(client: httpx.AsyncClient, email: str) -> str:
+    await client.post('/api/v1/auth/register', json={
+        'username': f'bench-{email[:8]}', 'email': email, 'password': PASSWORD,
+    })
+    response = await client.post('/api/v1/auth/login', json={'email': email, 'password': PASSWORD})
+    response.raise_for_status()
+    return response.json()['data']['access_token']
+
+
+async def _run(client: httpx.AsyncClient, token: str, requests: int) -> list[float]:
+    headers = {'Authorization': f'Bearer {token}'}
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.delete(f'/api/v1/groceries/{uuid.uuid4()}', headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 404, response.text
+    return timings
+
+
+async def main(requests: int) -> None:
+    email = f'{uuid.uuid4().hex[:12]}@benchmark.local'
+    max_entries = user_cache.max_entries
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark') as client:
+        token = await _register_and_login(client, email)
+        try:
+            modes = {}
+            user_cache.max_entries = 0
+            modes['database'] = await _run(client, token, requests)
+            user_cache.max_entries = max_entries
+            await client.post('/api/v1/auth/login', json={'email': email, 'password': PASSWORD})
+            modes['cache'] = await _run(client, token, requests)
+            settings.AUTH_TRUST_TOKEN_CLAIMS = True
+            modes['claims'] = await _run(client, token, requests)
+        finally:
+            settings.AUTH_TRUST_TOKEN_CLAIMS = False
+            user_cache.max_entries = max_entries
+            async with async_session_factory() as session:
+                await session.execute(delete(User).where(User.email == email))
+                await session.commit()
+
+    baseline = statistics.mean(modes['database'])
+    print(f"{'mode':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'vs database':>14}")
+    for mode, timings in modes.items():
+        mean = statistics.mean(timings)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(
+            f'{mode:<10}{mean:>10.2f}{statistics.median(timings):>10.2f}{p95:>10.2f}'
+            f'{(1 - mean / baseline) * 100:>13.1f}%'
+        )
+    print('\nuser cache:', user_cache_stats())
+    print('token claims cache:', claims_cache.stats())
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,90 @@
+"""
+Bulk create throughput — one `POST /` per item vs one `POST /bulk`.
+
+Everything runs inside ONE transaction that is rolled back at the end (the
+repository's commits only release savepoints), so the target database is
+left untouched. For each size both write paths are timed:
+
+    •	single → `GroceryRepository.add_grocery` per item (add, commit, refresh)
+    •	bulk   → `GroceryRepository.bulk_add_groceries` (multi-row INSERT ... RETURNING)
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.bulk_insert_benchmark --sizes 100 1000 10000
+
+Never point this at a production database.
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.enums import GroceryType, Seller, GroceryCategory
+from app.db.session import engine
+from app.features.grocery.models import Grocery
+from app.features.grocery.repository import GroceryRepository
+
+
+def build_values(size: int) -> list[dict]:
+    sellers = list(Seller)
+    return [
+        {
+            'name': f'Bulk item {index}',
+            'brand': 'Brand',
+            'type': list(GroceryType)[index % len(GroceryType)],
+            'current_price': 10 + index % 500,
+            'current_seller': sellers[index % len(sellers)],
+            'low_stock_threshold': 3,
+            'quantity_in_stock': index % 7,
+            'category': list(GroceryCategory)[index % len(GroceryCategory)],
+            'best_seller': sellers[index % len(sellers)],
+            'best_price': 10 + index % 500,
+        }
+        for index in range(size)
+    ]
+
+
+async def single_path(repo: GroceryRepository, values: list[dict]) -> None:
+    for item in values:
+        await repo.add_grocery(Grocery(**item))
+
+
+async def bulk_path(repo: GroceryRepository, values: list[dict]) -> None:
+    await repo.bulk_add_groceries(values)
+
+
+async def _time(path, repo: GroceryRepository, values: list[dict]) -> float:
+    start = time.perf_counter()
+    await path(repo, values)
+    elapsed = time.perf_counter() - start
+    repo.session.expunge_all()
+    return elapsed
+
+
+async def main(sizes: list[int]) -> None:
+    print(f"{'items':>8}{'single s':>12}{'items/s':>10}{'bulk s':>10}{'items/s':>10}{'speedup':>10}")
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            session = AsyncSession(bind=conn, join_transaction_mode='create_savepoint', expire_on_commit=False)
+            repo = GroceryRepository(session)
+            for size in sizes:
+                values = build_values(size)
+                single_s = await _time(single_path, repo, values)
+                bulk_s = await _time(bulk_path, repo, values)
+                print(
+                    f'{size:>8}{single_s:>12.2f}{size / single_s:>10,.0f}'
+                    f'{bulk_s:>10.3f}{size / bulk_s:>10,.0f}{single_s / bulk_s:>9.1f}x'
+                )
+            await session.close()
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
@@ -0,0 +1,142 @@
+"""
+First-request latency after a cold start — with and without the startup warm-up.
+
+Every run starts a fresh Python process (nothing imported, compiled or
+connected yet) with STARTUP_WARM_UP off or on. The process runs the app's
+lifespan, then sends the same sequence of requests twice, in-process:
+
+    •	burst  → POOL_SIZE concurrent `GET /groceries/?limit=20` (pool opening)
+    •	detail → `GET /groceries/{id}` of the first listed grocery
+    •	login  → `POST /auth/login` (Argon2 verify)
+    •	docs   → `GET /openapi.json` (`custom_openapi`)
+
+and reports startup time plus the first ("cold") and second ("warm") round
+per request, as the median over `--runs` processes. The grocery response
+cache is disabled so every read reaches the database. A throwaway user is
+registered for the logins and deleted at the end.
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.cold_start_benchmark --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+PASSWORD = 'benchmark-password'
+REQUESTS = ('burst', 'detail', 'login', 'docs')
+
+
+async def _timed(request) -> float:
+    start = time.perf_counter()
+    response = await request
+    elapsed = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return elapsed
+
+
+async def _round(client, email: str, concurrency: int) -> dict[str, float]:
+    start = time.perf_counter()
+    responses = await asyncio.gather(*[
+        client.get('/api/v1/groceries/', params={'limit': 20}) for _ in range(concurrency)
+    ])
+    timings = {'burst': (time.perf_counter() - start) * 1000}
+    for response in responses:
+        response.raise_for_status()
+    items = responses[0].json()['data']
+    detail_path = f"/api/v1/groceries/{items[0]['id']}" if items else '/api/v1/groceries/summary'
+    timings['detail'] = await _timed(client.get(detail_path))
+    timings['login'] = await _timed(client.post('/api/v1/auth/login', json={'email': email, 'password': PASSWORD}))
+    timings['docs'] = await _timed(client.get('/openapi.json'))
+    return timings
+
+
+async def child(email: str) -> None:
+    """One cold process: import, start up, two rounds of requests, print JSON"""
+    start = time.perf_counter()
+    import httpx
+    from app.core.config import settings
+    from app.features.grocery.cache import grocery_response_cache
+    from app.main import app
+
+    grocery_response_cache.max_entries = 0
+    result = {}
+    async with app.router.lifespan_context(app):
+        result['startup'] = (time.perf_counter() - start) * 1000
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=60) as client:
+            result['cold'] = await _round(client, email, settings.POOL_SIZE)
+            result['warm'] = await _round(client, email, settings.POOL_SIZE)
+    print(json.dumps(result))
+
+
+def _spawn(email: str, warm_up: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.cold_start_benchmark', '--child', email],
+        env={**os.environ, 'STARTUP_WARM_UP': str(warm_up).lower(), 'LOG_LEVEL': 'WARNING'},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    # the JSON line is the last one; startup banners come before it
+    return json.loads(output.strip().splitlines()[-1])
+
+
+async def _register(email: str) -> None:
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=60) as client:
+        response = await client.post('/api/v1/auth/register', json={
+            'username': f'bench-{email[:8]}', 'email': email, 'password': PASSWORD,
+        })
+        response.raise_for_status()
+
+
+async def _delete_user(email: str) -> None:
+    from sqlalchemy import delete
+    from app.db.session import async_session_factory, engine
+    from app.features.auth.models import User
+
+    async with async_session_factory() as session:
+        await session.execute(delete(User).where(User.email == email))
+        await session.commit()
+    await engine.dispose()
+
+
+async def main(runs: int) -> None:
+    email = f'{uuid.uuid4().hex[:12]}@benchmark.local'
+    await _register(email)
+    try:
+        # one child at a time, so runs don't compete for CPU or connections
+        results = {warm_up: [_spawn(email, warm_up) for _ in range(runs)] for warm_up in (False, True)}
+    finally:
+        await _delete_user(email)
+
+    print(f"{'warm-up':<9}{'round':<7}{'startup ms':>12}" + ''.join(f'{name + " ms":>12}' for name in REQUESTS))
+    for warm_up, samples in results.items():
+        for round_name in ('cold', 'warm'):
+            startup = statistics.median(sample['startup'] for sample in samples) if round_name == 'cold' else None
+            row = f"{'on' if warm_up else 'off':<9}{round_name:<7}{f'{startup:.1f}' if startup else '':>12}"
+            row += ''.join(
+                f'{statistics.median(sample[round_name][name] for sample in samples):>12.1f}' for name in REQUESTS
+            )
+            print(row)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--child', metavar='EMAIL', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(child(args.child))
+    else:
+        asyncio.run(main(args.runs))
@@ -0,0 +1,102 @@
+"""
+Read latency during a login storm — Argon2 on the event loop vs the
+password hashing thread pool.
+
+Creates a throwaway user, then for each mode runs `--readers` clients
+looping on `GET /groceries/` while `--logins` clients keep logging in, for
+`--seconds`, and reports the readers' latency percentiles:
+
+    •	idle     → readers only (reference)
+    •	inline   → PASSWORD_HASH_WORKERS=0: every verify blocks the event loop
+    •	executor → the bounded thread pool (PASSWORD_HASH_WORKERS / _QUEUE_SIZE)
+
+The grocery response cache is disabled, so each read hits the database.
+The throwaway user is deleted at the end.
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.login_storm_benchmark --seconds 10 --logins 8 --readers 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+from sqlalchemy import delete
+
+from app.db.session import async_session_factory, engine
+from app.features.auth.models import User
+from app.features.grocery.cache import grocery_response_cache
+from app.main import app
+from app.utils.hashing import password_hash_executor
+
+PASSWORD = 'benchmark-password'
+
+
+async def _reader(client: httpx.AsyncClient, stop_at: float, timings: list[float]) -> None:
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        response = await client.get('/api/v1/groceries/', params={'limit': 20})
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+
+async def _login(client: httpx.AsyncClient, email: str, stop_at: float, counts: dict[int, int]) -> None:
+    while time.perf_counter() < stop_at:
+        response = await client.post('/api/v1/auth/login', json={'email': email, 'password': PASSWORD})
+        counts[response.status_code] = counts.get(response.status_code, 0) + 1
+
+
+async def _run(client: httpx.AsyncClient, email: str, seconds: float, logins: int, readers: int):
+    stop_at = time.perf_counter() + seconds
+    timings: list[float] = []
+    counts: dict[int, int] = {}
+    await asyncio.gather(
+        *[_reader(client, stop_at, timings) for _ in range(readers)],
+        *[_login(client, email, stop_at, counts) for _ in range(logins)],
+    )
+    return timings, counts
+
+
+async def main(seconds: float, logins: int, readers: int) -> None:
+    email = f'{uuid.uuid4().hex[:12]}@benchmark.local'
+    workers = password_hash_executor.workers
+    grocery_response_cache.max_entries = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=60) as client:
+        await client.post('/api/v1/auth/register', json={
+            'username': f'bench-{email[:8]}', 'email': email, 'password': PASSWORD,
+        })
+        try:
+            results = {'idle': await _run(client, email, seconds, 0, readers)}
+            password_hash_executor.workers = 0
+            results['inline'] = await _run(client, email, seconds, logins, readers)
+            password_hash_executor.workers = workers
+            results['executor'] = await _run(client, email, seconds, logins, readers)
+        finally:
+            password_hash_executor.workers = workers
+            async with async_session_factory() as session:
+                await session.execute(delete(User).where(User.email == email))
+                await session.commit()
+
+    print(f"{'mode':<10}{'reads':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}  logins by status")
+    for mode, (timings, counts) in results.items():
+        p99 = statistics.quantiles(timings, n=100, method='inclusive')[-1]
+        print(
+            f'{mode:<10}{len(timings):>8}{statistics.median(timings):>10.2f}{p99:>10.2f}'
+            f'{max(timings):>10.2f}  {counts or "-"}'
+        )
+    print('\npassword hashing:', password_hash_executor.stats())
+    password_hash_executor.shutdown()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--logins', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.logins, args.readers))
@@ -0,0 +1,140 @@
+"""
+Grocery response cache — hit ratio, queries and latency of list/detail reads.
+
+Runs the real app in-process inside ONE transaction that is rolled back at the
+end (every request session joins it through a savepoint, so the target
+database is left untouched). Seeds `--rows` groceries, then replays the same
+read-mostly workload with the response cache off and on:
+
+    •	reads  → `GET /groceries/` over a few filter/sort combinations and
+    	`GET /groceries/{id}` over a hot set of items, picked at random
+    •	writes → one `PUT /groceries/{id}` every `--write-every` requests,
+    	which invalidates the whole cache
+
+and reports the cache hit ratio, SQL statements per read (from the
+`Server-Timing` header) and read latency. A hit serves the ETag and the body
+from the cache, so it runs no statement at all; a miss runs the freshness
+query and the page/item query.
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.response_cache_benchmark --requests 5000 --write-every 50
+
+Never point this at a production database.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+import uuid
+
+import httpx
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine, get_db, get_read_db
+from app.features.grocery.cache import grocery_response_cache
+from app.features.grocery.models import Grocery
+from app.main import app
+from app.utils.hashing import password_hash_executor
+from benchmarks.search_benchmark import SEED_SQL
+
+PASSWORD = 'benchmark-password'
+LIST_PARAMS = [
+    {},
+    {'sort': '-current_price'},
+    {'category': 'food'},
+    {'category': 'oil', 'sort': 'name'},
+    {'stock_status': 'below_stock'},
+    {'fields': 'name,brand,current_price'},
+]
+HOT_ITEMS = 50
+_STATEMENTS = re.compile(r'desc="(\d+) queries"')
+
+
+async def _login(client: httpx.AsyncClient) -> dict[str, str]:
+    email = f'{uuid.uuid4().hex[:12]}@benchmark.local'
+    credentials = {'email': email, 'password': PASSWORD}
+    (await client.post('/api/v1/auth/register', json={**credentials, 'username': email[:12]})).raise_for_status()
+    response = await client.post('/api/v1/auth/login', json=credentials)
+    response.raise_for_status()
+    return {'Authorization': f"Bearer {response.json()['data']['access_token']}"}
+
+
+async def _replay(client: httpx.AsyncClient, headers: dict[str, str], item_ids: list[str], requests: int,
+                  write_every: int) -> tuple[list[float], list[int]]:
+    chooser = random.Random(42)
+    latencies, statements = [], []
+    for index in range(1, requests + 1):
+        if index % write_every == 0:
+            response = await client.put(
+                f'/api/v1/groceries/{chooser.choice(item_ids)}',
+                json={'current_price': chooser.randint(10, 999)}, headers=headers,
+            )
+            response.raise_for_status()
+            # a fresh client per writer window: the read-your-writes cookie would bypass the cache
+            client.cookies.clear()
+            continue
+        if chooser.random() < 0.5:
+            request = client.get('/api/v1/groceries/', params=chooser.choice(LIST_PARAMS))
+        else:
+            request = client.get(f'/api/v1/groceries/{chooser.choice(item_ids)}')
+        start = time.perf_counter()
+        response = await request
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        statements.append(int(_STATEMENTS.search(response.headers['server-timing']).group(1)))
+    return latencies, statements
+
+
+async def main(rows: int, requests: int, write_every: int) -> None:
+    cache_size = grocery_response_cache.max_entries
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+
+        async def joined_session():
+            async with AsyncSession(bind=conn, join_transaction_mode='create_savepoint',
+                                    expire_on_commit=False) as session:
+                yield session
+
+        app.dependency_overrides[get_db] = joined_session
+        app.dependency_overrides[get_read_db] = joined_session
+        try:
+            await conn.execute(SEED_SQL, {'start': 0, 'stop': rows})
+            await conn.execute(text('ANALYZE grocery'))
+            item_ids = [str(item_id) for item_id in (await conn.scalars(select(Grocery.id).limit(HOT_ITEMS))).all()]
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url='http://benchmark', timeout=60) as client:
+                headers = await _login(client)
+                client.cookies.clear()
+                print(f'{rows:,} rows, {requests:,} requests, one write every {write_every}')
+                print(f"{'cache':<7}{'hit ratio':>11}{'queries/read':>14}{'median ms':>11}{'p95 ms':>9}")
+                for max_entries in (0, cache_size):
+                    grocery_response_cache.max_entries = max_entries
+                    grocery_response_cache.bump_version()
+                    grocery_response_cache.hits = grocery_response_cache.misses = 0
+                    latencies, statements = await _replay(client, headers, item_ids, requests, write_every)
+                    stats = grocery_response_cache.stats()
+                    print(
+                        f"{'on' if max_entries else 'off':<7}{stats['hit_ratio']:>11.1%}"
+                        f'{statistics.mean(statements):>14.2f}{statistics.median(latencies):>11.2f}'
+                        f'{statistics.quantiles(latencies, n=20)[-1]:>9.2f}'
+                    )
+        finally:
+            app.dependency_overrides.clear()
+            grocery_response_cache.max_entries = cache_size
+            await transaction.rollback()
+    password_hash_executor.shutdown()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--write-every', type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests, args.write_every))
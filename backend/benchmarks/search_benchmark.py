@@ -0,0 +1,125 @@
+"""
+Search latency benchmark — legacy cast-to-String ILIKE scan vs the indexed search.
+
+Seeds synthetic groceries inside ONE transaction that is rolled back at the end,
+so the target database is left untouched. After each size is reached the table
+is ANALYZEd and both implementations are timed for a few representative terms:
+
+    •	legacy  → the old `_build_search_conditions` statement, all matching rows
+    •	indexed → `GroceryRepository.get_groceries(search=...)`, first page
+
+Usage (from backend/, database migrated to head, pg_trgm available):
+    python -m benchmarks.search_benchmark --sizes 10000 100000 1000000
+
+Never point this at a production database.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import select, or_, cast, String, text
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection
+
+from app.common.pagination import CursorParams
+from app.db.session import engine
+from app.features.grocery.filters import GroceryFilterParams
+from app.features.grocery.models import Grocery
+from app.features.grocery.repository import GroceryRepository
+
+TERMS = ['lentil', 'red len', 'shwap', '120', 'no-such-item']
+
+SEED_SQL = text("""
+    INSERT INTO grocery (
+        id, name, brand, type, current_price, current_seller, low_stock_threshold,
+        quantity_in_stock, should_include, category, best_seller, best_price
+    )
+    SELECT
+        gen_random_uuid(),
+        (ARRAY['Red', 'Green', 'Fresh', 'Organic', 'Premium', 'Local', 'Classic', 'Family'])[1 + g % 8]
+            || ' ' ||
+        (ARRAY['Lentil', 'Rice', 'Oil', 'Soap', 'Biscuit', 'Sugar', 'Salt', 'Flour', 'Tea', 'Milk',
+               'Onion', 'Garlic', 'Shampoo', 'Toothpaste', 'Noodles', 'Juice', 'Ghee'])[1 + (g / 8) % 17]
+            || ' ' || g,
+        (ARRAY['Teer', 'Pran', 'Radhuni', 'Fresh', 'ACI', 'Lux', 'Square'])[1 + g % 7],
+        (ARRAY['WEIGHT', 'SACK', 'CAN', 'PIECE', 'PACKET', 'BOTTLE'])[1 + g % 6]::grocerytype,
+        10 + g % 990,
+        (ARRAY['MEENA', 'SHWAPNO', 'LOCAL', 'COMILLA', 'AGORA', 'ONLINE'])[1 + g % 6]::seller,
+        1 + g % 5,
+        g % 20,
+        g % 2 = 0,
+        (ARRAY['TOILETRIES', 'FOOD', 'COOKIES', 'OIL', 'OTHER'])[1 + g % 5]::grocerycategory,
+        (ARRAY['MEENA', 'SHWAPNO', 'LOCAL', 'COMILLA', 'AGORA', 'ONLINE'])[1 + (g / 6) % 6]::seller,
+        10 + g % 900
+    FROM generate_series(:start, :stop - 1) AS g
+""")
+
+
+def legacy_search_condition(search: str):
+    """The pre-index implementation, kept verbatim for comparison."""
+    term = f"%{search}%"
+    text_fields = [Grocery.name, Grocery.brand]
+    cast_fields = [
+        Grocery.type, Grocery.current_seller, Grocery.best_seller, Grocery.category,
+        Grocery.current_price, Grocery.quantity_in_stock, Grocery.low_stock_threshold, Grocery.best_price,
+    ]
+    search_conditions = (
+            [field.ilike(term) for field in text_fields]
+            + [cast(field, String).ilike(term) for field in cast_fields]
+    )
+    return or_(*search_conditions)
+
+
+async def _time(coro_factory, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def _run_size(conn: AsyncConnection, repeats: int) -> list[tuple[str, float, float]]:
+    session = AsyncSession(bind=conn, join_transaction_mode='create_savepoint')
+    repo = GroceryRepository(session)
+    results = []
+    for term in TERMS:
+        async def legacy():
+            await session.scalars(select(Grocery).where(legacy_search_condition(term)))
+            session.expunge_all()
+
+        async def indexed():
+            await repo.get_groceries(GroceryFilterParams(search=term), CursorParams())
+            session.expunge_all()
+
+        results.append((term, await _time(legacy, repeats), await _time(indexed, repeats)))
+    await session.close()
+    return results
+
+
+async def main(sizes: list[int], repeats: int) -> None:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            seeded = 0
+            for size in sorted(sizes):
+                await conn.execute(SEED_SQL, {'start': seeded, 'stop': size})
+                seeded = size
+                await conn.execute(text('ANALYZE grocery'))
+
+                print(f'\n{size:,} rows (median of {repeats}, ms)')
+                print(f"{'term':<14}{'legacy':>12}{'indexed':>12}{'speedup':>10}")
+                for term, legacy_ms, indexed_ms in await _run_size(conn, repeats):
+                    print(f'{term:<14}{legacy_ms:>12.2f}{indexed_ms:>12.2f}{legacy_ms / indexed_ms:>9.1f}x')
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeats))
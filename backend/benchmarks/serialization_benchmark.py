@@ -0,0 +1,108 @@
+"""
+Serialization micro-benchmark — FastAPI's response_model path vs ApiJSONResponse.
+
+    •	current → endpoint returns an `ApiResponseSchema`; FastAPI validates it
+                  against `response_model`, serializes it to python and
+                  `JSONResponse` json.dumps it (what `serialize_response` does)
+    •	fast    → `ApiJSONResponse.from_data`, a cached TypeAdapter dumping the
+                  payload straight to bytes inside the rendered envelope
+
+Both outputs are checked to be identical (timestamp aside) before timing.
+No database needed.
+
+Usage (from backend/):
+    python -m benchmarks.serialization_benchmark --sizes 1000 10000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.common.enums import GroceryType, Seller, GroceryCategory
+from app.common.responses import ApiJSONResponse
+from app.core.api_response_schema import PaginatedApiResponseSchema, CursorPaginationSchema
+from app.features.grocery.schemas.response_schemas import GroceryListResponseSchema
+
+MESSAGE = 'Grocery list fetched successfully'
+RESPONSE_FIELD = create_model_field(
+    name='Response_list_groceries',
+    type_=PaginatedApiResponseSchema[GroceryListResponseSchema],
+    mode='serialization',
+)
+
+
+def build_items(size: int) -> List[GroceryListResponseSchema]:
+    return [
+        GroceryListResponseSchema.model_validate({
+            'id': uuid.uuid4(),
+            'name': f'Grocery item {index}',
+            'brand': 'Brand',
+            'type': list(GroceryType)[index % len(GroceryType)],
+            'current_price': 10 + index % 500,
+            'current_seller': list(Seller)[index % len(Seller)],
+            'low_stock_threshold': 3,
+            'quantity_in_stock': index % 7,
+            'should_include': index % 2 == 0,
+            'category': list(GroceryCategory)[index % len(GroceryCategory)],
+            'best_seller': Seller.MEENA,
+            'best_price': 10 + index % 400,
+        })
+        for index in range(size)
+    ]
+
+
+async def current_path(items, pagination) -> bytes:
+    envelope = PaginatedApiResponseSchema(success=True, data=items, message=MESSAGE, pagination=pagination)
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=envelope)
+    return JSONResponse(content).body
+
+
+async def fast_path(items, pagination) -> bytes:
+    return ApiJSONResponse.from_data(
+        items, List[GroceryListResponseSchema], message=MESSAGE, pagination=pagination
+    ).body
+
+
+async def _time(path, items, pagination, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await path(items, pagination)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _without_timestamp(body: bytes) -> dict:
+    payload = json.loads(body)
+    payload.pop('timestamp')
+    return payload
+
+
+async def main(sizes: List[int], repeats: int) -> None:
+    pagination = CursorPaginationSchema(limit=50, next_cursor='abc', has_more=True)
+    print(f"{'items':>8}{'current ms':>14}{'fast ms':>12}{'speedup':>10}")
+    for size in sizes:
+        items = build_items(size)
+        current, fast = await current_path(items, pagination), await fast_path(items, pagination)
+        assert _without_timestamp(current) == _without_timestamp(fast), 'wire format differs'
+        assert current.split(b'"timestamp"')[0] == fast.split(b'"timestamp"')[0]
+
+        current_ms = await _time(current_path, items, pagination, repeats)
+        fast_ms = await _time(fast_path, items, pagination, repeats)
+        print(f'{size:>8}{current_ms:>14.2f}{fast_ms:>12.2f}{current_ms / fast_ms:>9.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000])
+    parser.add_argument('--repeats', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeats))
@@ -0,0 +1,89 @@
+"""
+Per-query latency of the hot statements in each DB_STATEMENT_CACHE_MODE.
+
+For every mode a single-connection engine is built with that mode's
+connect_args, and the hot read statements are executed `--iterations`
+times each (after a short warm-up):
+
+    •	get_groceries      → `GroceryRepository.get_groceries`, first page, default sort
+    •	get_user_by_email  → `AuthRepository.get_user_by_email`
+
+Read-only; nothing is written. Run it against a direct connection: the
+`pooler*` modes work there too and show the cost of re-preparing, while
+`direct` can't be used through a transaction-mode pooler at all.
+
+Usage (from backend/, database migrated to head):
+    python -m benchmarks.statement_cache_benchmark --iterations 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.common.pagination import CursorParams
+from app.core.config import settings
+from app.db.statement_cache import StatementCacheMode, statement_cache_connect_args
+from app.features.auth.repository import AuthRepository
+from app.features.grocery.filters import GroceryFilterParams
+from app.features.grocery.repository import GroceryRepository
+
+WARM_UP = 50
+
+
+async def _time(query, iterations: int) -> list[float]:
+    for _ in range(WARM_UP):
+        await query()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await query()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def _run_mode(mode: StatementCacheMode, iterations: int) -> dict[str, list[float]]:
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        pool_size=1,
+        max_overflow=0,
+        connect_args=statement_cache_connect_args(mode),
+    )
+    try:
+        async with AsyncSession(engine) as session:
+            groceries = GroceryRepository(session)
+            users = AuthRepository(session)
+            columns = groceries._READ_COLUMNS
+
+            async def get_groceries():
+                await groceries.get_groceries(GroceryFilterParams(), CursorParams(), columns)
+
+            async def get_user_by_email():
+                await users.get_user_by_email('benchmark@example.com')
+
+            return {
+                'get_groceries': await _time(get_groceries, iterations),
+                'get_user_by_email': await _time(get_user_by_email, iterations),
+            }
+    finally:
+        await engine.dispose()
+
+
+async def main(iterations: int) -> None:
+    print(f"{'mode':<14}{'statement':<20}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode in StatementCacheMode:
+        for statement, timings in (await _run_mode(mode, iterations)).items():
+            p99 = statistics.quantiles(timings, n=100, method='inclusive')[-1]
+            print(
+                f'{mode.value:<14}{statement:<20}{statistics.mean(timings):>10.3f}'
+                f'{statistics.median(timings):>10.3f}{p99:>10.3f}'
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=2_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -16,12 +16,20 @@ if config.config_file_name is not None:
 # Import ALL your models here (critical for autogenerate!)
 from app.core.config import settings
 from app.db.base import Base
-from app.features.grocery.models import Grocery
-from app.features.auth.models import User
+from app.db.statement_cache import statement_cache_connect_args
+from app.features.grocery.models import Grocery, PRICE_HISTORY_PARTITION_PREFIX
+from app.features.auth.models import User, RefreshToken
 
 target_metadata = Base.metadata
 
 
+def include_object(obj, name, type_, reflected, compare_to):
+    """Skip the monthly price history partitions — created at runtime, not by the models"""
+    if type_ == "table" and reflected and compare_to is None and name.startswith(PRICE_HISTORY_PARTITION_PREFIX):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -43,6 +51,7 @@ def do_run_migrations(connection):
         compare_type=True,
         compare_server_default=True,
         render_as_batch=True,  # helpful for PostgresSQL in some cases
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -57,10 +66,7 @@ async def run_async_migrations_online():
         config_section,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
-        connect_args={
-            "prepared_statement_cache_size": 0,
-            "statement_cache_size": 0,
-        },
+        connect_args=statement_cache_connect_args(settings.DB_STATEMENT_CACHE_MODE),
     )
 
     async with connectable.connect() as connection:
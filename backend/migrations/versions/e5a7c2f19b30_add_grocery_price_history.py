@@ -0,0 +1,204 @@
+"""add grocery price history
+
+Revision ID: e5a7c2f19b30
+Revises: d91b5e7c0a44
+Create Date: 2026-10-18 14:05:41.228190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c2f19b30'
+down_revision: Union[str, Sequence[str], None] = 'd91b5e7c0a44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+seller_enum = postgresql.ENUM(
+    'MEENA', 'SHWAPNO', 'LOCAL', 'COMILLA', 'DEFAULT', 'AGORA', 'ONLINE',
+    name='seller', create_type=False
+)
+
+# Creates the month's partition if it doesn't exist yet. Rows that already
+# landed in the default partition for that month are moved into it first,
+# otherwise attaching the new range would fail.
+ENSURE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION grocery_price_history_ensure_partition(month_start date) RETURNS void AS $$
+DECLARE
+    partition_name text := format('grocery_price_history_p%s', to_char(month_start, 'YYYY_MM'));
+    lower_bound timestamptz := date_trunc('month', month_start::timestamp) AT TIME ZONE 'UTC';
+    upper_bound timestamptz := (date_trunc('month', month_start::timestamp) + interval '1 month') AT TIME ZONE 'UTC';
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE grocery_price_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    EXECUTE format(
+        'WITH moved AS (
+             DELETE FROM grocery_price_history_default
+             WHERE recorded_at >= $1 AND recorded_at < $2
+             RETURNING *
+         )
+         INSERT INTO %I SELECT * FROM moved',
+        partition_name
+    ) USING lower_bound, upper_bound;
+    EXECUTE format(
+        'ALTER TABLE grocery_price_history ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, lower_bound, upper_bound
+    );
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Appends one history row per new or changed price and folds the same rows
+# into the monthly rollup, in one statement per triggering statement
+# (transition tables), so a 10k-row bulk write costs two INSERTs, not 20k.
+RECORD_PRICES_SQL = """
+    WITH recorded AS (
+        INSERT INTO grocery_price_history (grocery_id, seller, price)
+        SELECT new_rows.id, new_rows.current_seller, new_rows.current_price
+        FROM {new_rows}
+        {changed_only}
+        RETURNING grocery_id, seller, price, recorded_at
+    )
+    INSERT INTO grocery_price_rollup AS rollup (
+        grocery_id, seller, month, min_price, max_price, price_sum, price_count, last_price, last_recorded_at
+    )
+    SELECT
+        grocery_id,
+        seller,
+        date_trunc('month', recorded_at AT TIME ZONE 'UTC')::date,
+        min(price),
+        max(price),
+        sum(price),
+        count(*),
+        (array_agg(price ORDER BY recorded_at DESC))[1],
+        max(recorded_at)
+    FROM recorded
+    GROUP BY 1, 2, 3
+    ON CONFLICT (grocery_id, seller, month) DO UPDATE SET
+        min_price = LEAST(rollup.min_price, excluded.min_price),
+        max_price = GREATEST(rollup.max_price, excluded.max_price),
+        price_sum = rollup.price_sum + excluded.price_sum,
+        price_count = rollup.price_count + excluded.price_count,
+        last_price = CASE
+            WHEN excluded.last_recorded_at >= rollup.last_recorded_at THEN excluded.last_price
+            ELSE rollup.last_price
+        END,
+        last_recorded_at = GREATEST(rollup.last_recorded_at, excluded.last_recorded_at);
+"""
+
+RECORD_INSERTED_PRICES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION grocery_record_inserted_prices() RETURNS trigger AS $$
+BEGIN
+    {RECORD_PRICES_SQL.format(new_rows='new_rows', changed_only='')}
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Only rows whose price or seller actually changed get a history row.
+PRICE_CHANGED_FILTER = """
+        JOIN old_rows ON old_rows.id = new_rows.id
+        WHERE (old_rows.current_price, old_rows.current_seller)
+              IS DISTINCT FROM (new_rows.current_price, new_rows.current_seller)"""
+
+RECORD_UPDATED_PRICES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION grocery_record_updated_prices() RETURNS trigger AS $$
+BEGIN
+    {RECORD_PRICES_SQL.format(new_rows='new_rows', changed_only=PRICE_CHANGED_FILTER)}
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.execute(sa.schema.CreateSequence(sa.Sequence('grocery_price_history_id_seq')))
+    op.create_table('grocery_price_history',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('grocery_price_history_id_seq'::regclass)"), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('grocery_id', sa.UUID(), nullable=False),
+    sa.Column('seller', seller_enum, nullable=False),
+    sa.Column('price', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['grocery_id'], ['grocery.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'recorded_at'),
+    postgresql_partition_by='RANGE (recorded_at)'
+    )
+    with op.batch_alter_table('grocery_price_history', schema=None) as batch_op:
+        batch_op.create_index('ix_grocery_price_history_grocery_id', ['grocery_id'], unique=False)
+        batch_op.create_index('ix_grocery_price_history_recorded_at', ['recorded_at'], unique=False, postgresql_using='brin')
+
+    op.create_table('grocery_price_rollup',
+    sa.Column('grocery_id', sa.UUID(), nullable=False),
+    sa.Column('seller', seller_enum, nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('min_price', sa.Integer(), nullable=False),
+    sa.Column('max_price', sa.Integer(), nullable=False),
+    sa.Column('price_sum', sa.BigInteger(), nullable=False),
+    sa.Column('price_count', sa.Integer(), nullable=False),
+    sa.Column('last_price', sa.Integer(), nullable=False),
+    sa.Column('last_recorded_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['grocery_id'], ['grocery.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('grocery_id', 'seller', 'month')
+    )
+    # ### end Alembic commands ###
+
+    # partitions: a catch-all default, then this month and the next two
+    # (the app keeps creating upcoming months on startup)
+    op.execute('CREATE TABLE grocery_price_history_default PARTITION OF grocery_price_history DEFAULT')
+    op.execute(ENSURE_PARTITION_FUNCTION)
+    op.execute("""
+        SELECT grocery_price_history_ensure_partition((date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => n))::date)
+        FROM generate_series(0, 2) AS n
+    """)
+
+    op.execute(RECORD_INSERTED_PRICES_FUNCTION)
+    op.execute(RECORD_UPDATED_PRICES_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER grocery_record_inserted_prices
+        AFTER INSERT ON grocery
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION grocery_record_inserted_prices()
+    """)
+    op.execute("""
+        CREATE TRIGGER grocery_record_updated_prices
+        AFTER UPDATE ON grocery
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION grocery_record_updated_prices()
+    """)
+
+    # history starts with every grocery's current price
+    op.execute(RECORD_PRICES_SQL.format(
+        new_rows='(SELECT id, current_seller, current_price FROM grocery) AS new_rows',
+        changed_only='',
+    ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS grocery_record_updated_prices ON grocery')
+    op.execute('DROP TRIGGER IF EXISTS grocery_record_inserted_prices ON grocery')
+    op.execute('DROP FUNCTION IF EXISTS grocery_record_updated_prices()')
+    op.execute('DROP FUNCTION IF EXISTS grocery_record_inserted_prices()')
+    op.execute('DROP FUNCTION IF EXISTS grocery_price_history_ensure_partition(date)')
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table('grocery_price_rollup')
+    with op.batch_alter_table('grocery_price_history', schema=None) as batch_op:
+        batch_op.drop_index('ix_grocery_price_history_recorded_at', postgresql_using='brin')
+        batch_op.drop_index('ix_grocery_price_history_grocery_id')
+
+    # dropping the partitioned table drops every partition with it
+    op.drop_table('grocery_price_history')
+    op.execute(sa.schema.DropSequence(sa.Sequence('grocery_price_history_id_seq')))
+    # ### end Alembic commands ###
@@ -0,0 +1,97 @@
+"""
+Fixtures for tests against a real PostgreSQL migrated to head (the `tests`
+CI workflow runs one; locally, point the DB_* settings at a disposable database).
+
+Every test runs inside ONE transaction that is rolled back afterwards: the
+app's sessions join it through a savepoint, so nothing a test writes is kept.
+"""
+
+import uuid
+from contextlib import contextmanager
+from typing import AsyncIterator, Callable, ContextManager, Iterator
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.request_timing import RequestTiming, track_request
+from app.db.session import engine, get_db, get_read_db
+from app.features.grocery.cache import grocery_response_cache
+from app.main import app
+from app.utils.hashing import password_hash_executor
+
+PASSWORD = 'test-password'
+
+
+@pytest.fixture(scope='session', autouse=True)
+async def _dispose_engine() -> AsyncIterator[None]:
+    yield
+    password_hash_executor.shutdown()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def connection() -> AsyncIterator[AsyncConnection]:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+@pytest.fixture
+async def db_session(connection: AsyncConnection) -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(bind=connection, join_transaction_mode='create_savepoint',
+                            expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+async def client(connection: AsyncConnection, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[httpx.AsyncClient]:
+    async def joined_session():
+        async with AsyncSession(bind=connection, join_transaction_mode='create_savepoint',
+                                expire_on_commit=False) as session:
+            yield session
+
+    # every read must reach the database
+    monkeypatch.setattr(grocery_response_cache, 'max_entries', 0)
+    app.dependency_overrides[get_db] = joined_session
+    app.dependency_overrides[get_read_db] = joined_session
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test', timeout=60) as http_client:
+            yield http_client
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def auth_headers(client: httpx.AsyncClient) -> dict[str, str]:
+    email = f'{uuid.uuid4().hex[:12]}@test.local'
+    credentials = {'email': email, 'password': PASSWORD}
+    (await client.post('/api/v1/auth/register', json={**credentials, 'username': email[:12]})).raise_for_status()
+    response = await client.post('/api/v1/auth/login', json=credentials)
+    response.raise_for_status()
+    # the read-your-writes cookie of these writes isn't part of what a test measures
+    client.cookies.clear()
+    return {'Authorization': f"Bearer {response.json()['data']['access_token']}"}
+
+
+@contextmanager
+def _assert_query_count(expected: int) -> Iterator[RequestTiming]:
+    with track_request() as timing:
+        yield timing
+    assert timing.statements == expected, f'{timing.statements} SQL statement(s) ran, expected {expected}'
+
+
+@pytest.fixture
+def assert_query_count() -> Callable[[int], ContextManager[RequestTiming]]:
+    """
+    Fails unless exactly `expected` statements run inside the block, counted by
+    the request-timing contextvar (requests made inside it included):
+
+        with assert_query_count(2):
+            await client.get('/api/v1/groceries/')
+    """
+    return _assert_query_count
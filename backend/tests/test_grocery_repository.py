@@ -0,0 +1,85 @@
+"""
+`GroceryRepository` writes: one statement plus the commit, no reload afterwards, and a new table version.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import event, select
+
+from app.common.enums import GroceryType, Seller
+from app.core.exceptions import ResourceNotFoundException
+from app.features.grocery.models import Grocery
+from app.features.grocery.repository import GroceryRepository
+
+
+def _grocery() -> Grocery:
+    return Grocery(
+        name=f'repository-{uuid.uuid4().hex[:8]}',
+        brand='check',
+        type=GroceryType.CAN,
+        current_price=120,
+        current_seller=Seller.LOCAL,
+        best_price=120,
+        best_seller=Seller.LOCAL,
+        low_stock_threshold=2,
+        quantity_in_stock=5,
+    )
+
+
+@pytest.fixture
+def commits(db_session) -> list[None]:
+    committed: list[None] = []
+    event.listen(db_session.sync_session, 'after_commit', lambda _session: committed.append(None))
+    return committed
+
+
+async def test_add_grocery(db_session, commits, assert_query_count):
+    repo = GroceryRepository(db_session)
+    with assert_query_count(1):
+        grocery = await repo.add_grocery(_grocery())
+        # server defaults come back with the INSERT ... RETURNING, not a reload
+        assert grocery.id is not None
+        assert grocery.created_at is not None
+        assert grocery.updated_at is not None
+    assert len(commits) == 1
+
+
+async def test_delete_grocery(db_session, commits, assert_query_count):
+    repo = GroceryRepository(db_session)
+    grocery = await repo.add_grocery(_grocery())
+    commits.clear()
+    with assert_query_count(1):
+        assert await repo.delete_grocery(grocery.id) == grocery.id
+    assert len(commits) == 1
+
+
+async def test_delete_missing_grocery(db_session, commits, assert_query_count):
+    with assert_query_count(1):
+        assert await GroceryRepository(db_session).delete_grocery(uuid.uuid4()) is None
+    assert len(commits) == 1
+
+
+
+async def test_bulk_patch_with_missing_id_changes_nothing(db_session, commits):
+    repo = GroceryRepository(db_session)
+    grocery_id = (await repo.add_grocery(_grocery())).id
+    missing_id = uuid.uuid4()
+    commits.clear()
+    with pytest.raises(ResourceNotFoundException, match=str(missing_id)):
+        await repo.bulk_patch_groceries([
+            {'id': grocery_id, 'quantity_in_stock': 9},
+            {'id': missing_id, 'quantity_in_stock': 9},
+        ])
+    assert commits == []
+    quantity = await db_session.scalar(select(Grocery.quantity_in_stock).where(Grocery.id == grocery_id))
+    assert quantity == 5
+
+
+async def test_every_write_bumps_the_version(db_session):
+    repo = GroceryRepository(db_session)
+    before = await repo.get_version()
+    grocery_id = (await repo.add_grocery(_grocery())).id
+    after_insert = await repo.get_version()
+    await repo.delete_grocery(grocery_id)
+    assert before < after_insert < await repo.get_version()
@@ -0,0 +1,14 @@
+"""
+`/api/v1/metrics` — per-worker runtime metrics, for signed-in users only.
+"""
+
+
+async def test_metrics_require_authentication(client):
+    response = await client.get('/api/v1/metrics/')
+    assert response.status_code == 401
+
+
+async def test_metrics(client, auth_headers):
+    response = await client.get('/api/v1/metrics/', headers=auth_headers)
+    assert response.status_code == 200
+    assert {'db_pool', 'db_replicas', 'grocery_response_cache'} <= response.json()['data'].keys()
@@ -0,0 +1,120 @@
+"""
+Query budgets — every grocery endpoint issues a fixed number of SQL statements,
+whatever the size of the request. Bulk and batch endpoints are called with a
+few and with many items under the same budget, so an N+1 loop or an extra
+refresh / reload in `GroceryRepository` fails here.
+"""
+
+import uuid
+
+import pytest
+
+BASE = '/api/v1/groceries'
+FEW, MANY = 3, 30
+
+
+def _grocery(index: int) -> dict:
+    return {
+        'name': f'query-count-{uuid.uuid4().hex[:8]}-{index}',
+        'brand': 'check',
+        'type': 'can',
+        'current_price': 100 + index,
+        'current_seller': 'local',
+        'low_stock_threshold': 2,
+        'quantity_in_stock': 5,
+    }
+
+
+@pytest.fixture
+async def grocery_ids(client, auth_headers) -> list[str]:
+    response = await client.post(
+        f'{BASE}/bulk', json={'items': [_grocery(index) for index in range(MANY)]}, headers=auth_headers,
+    )
+    response.raise_for_status()
+    client.cookies.clear()
+    return [item['id'] for item in response.json()['data']]
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'fields': 'name,brand'},
+    {'search': 'query-count'},
+    {'category': 'food', 'sort': '-current_price'},
+])
+async def test_list(client, grocery_ids, assert_query_count, params):
+    # freshness (ETag) + page
+    with assert_query_count(2):
+        response = await client.get(f'{BASE}/', params=params)
+    assert response.status_code == 200
+
+
+async def test_detail(client, grocery_ids, assert_query_count):
+    # updated_at (ETag) + row
+    with assert_query_count(2):
+        response = await client.get(f'{BASE}/{grocery_ids[0]}')
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('size', [FEW, MANY])
+async def test_batch(client, grocery_ids, assert_query_count, size):
+    with assert_query_count(1):
+        response = await client.get(f'{BASE}/batch', params={'ids': ','.join(grocery_ids[:size])})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('path', ['/summary', '/shopping-list'])
+async def test_aggregates(client, grocery_ids, assert_query_count, path):
+    with assert_query_count(1):
+        response = await client.get(f'{BASE}{path}')
+    assert response.status_code == 200
+
+
+async def test_price_stats(client, grocery_ids, assert_query_count):
+    with assert_query_count(1):
+        response = await client.get(f'{BASE}/{grocery_ids[0]}/price-stats')
+    assert response.status_code == 200
+
+
+async def test_create(client, auth_headers, assert_query_count):
+    with assert_query_count(1):
+        response = await client.post(f'{BASE}/', json=_grocery(0), headers=auth_headers)
+    assert response.status_code == 201
+
+
+@pytest.mark.parametrize('size', [FEW, MANY])
+async def test_bulk_create(client, auth_headers, assert_query_count, size):
+    with assert_query_count(1):
+        response = await client.post(
+            f'{BASE}/bulk', json={'items': [_grocery(index) for index in range(size)]}, headers=auth_headers,
+        )
+    assert response.status_code == 201
+
+
+async def test_update(client, auth_headers, grocery_ids, assert_query_count):
+    with assert_query_count(1):
+        response = await client.put(f'{BASE}/{grocery_ids[0]}', json={'current_price': 90}, headers=auth_headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('size', [FEW, MANY])
+async def test_bulk_should_include(client, auth_headers, grocery_ids, assert_query_count, size):
+    with assert_query_count(1):
+        response = await client.patch(
+            f'{BASE}/bulk/should-include',
+            json={'grocery_ids': grocery_ids[:size], 'should_include': True}, headers=auth_headers,
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('size', [FEW, MANY])
+async def test_bulk_patch(client, auth_headers, grocery_ids, assert_query_count, size):
+    items = [{'id': grocery_id, 'quantity_in_stock': 1} for grocery_id in grocery_ids[:size]]
+    with assert_query_count(1):
+        response = await client.patch(f'{BASE}/bulk', json={'items': items}, headers=auth_headers)
+    assert response.status_code == 200
+
+
+async def test_delete(client, auth_headers, grocery_ids, assert_query_count):
+    with assert_query_count(1):
+        response = await client.delete(f'{BASE}/{grocery_ids[0]}', headers=auth_headers)
+    assert response.status_code == 200
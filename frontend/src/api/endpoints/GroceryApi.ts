@@ -8,7 +8,7 @@ import type {IGroceryDetailApiResponse} from "../types/responses/GroceryDetailRe
 import type {IPayloadGroceryItemUpdate} from "../types/requests/grocery/UpdateGroceryItem.ts";
 import type {IGroceryFilterParams} from "../types/requests/grocery/GroceryFilterParams.ts";
 import type {IGroceryBulkUpdatePayload} from "../types/requests/grocery/BulkUpdateGroceryItem.ts";
-import type {IApiResponse} from "../../types/IApiResponse.ts";
+import type {IApiResponse, IPaginatedApiResponse} from "../../types/IApiResponse.ts";
 
 
 const toGroceryListItem = (item: GroceryListResponse): IGroceryListItem => ({...item});
@@ -20,9 +20,19 @@ async function apiGet<T>(url: string, params?: object): Promise<T> {
 }
 
 // ---------------- GENERICS -------------------------------------
+// the list endpoint is cursor paginated -> follow next_cursor until the last page
 export const getGroceries = async (filters?: IGroceryFilterParams): Promise<IGroceryListItem[]> => {
-    const response = await apiGet<GroceryListResponse[]>(API_ENDPOINTS.GROCERY.GROCERY_LIST, filters);
-    return response.map(item => (toGroceryListItem(item)));
+    const items: IGroceryListItem[] = [];
+    let cursor: string | null = null;
+    do {
+        const params: object = cursor ? {...filters, cursor} : {...filters};
+        const response = await axiosInstance.get<IPaginatedApiResponse<GroceryListResponse>>(
+            API_ENDPOINTS.GROCERY.GROCERY_LIST, {params}
+        );
+        items.push(...response.data.data.map(item => (toGroceryListItem(item))));
+        cursor = response.data.pagination.next_cursor;
+    } while (cursor);
+    return items;
 }
 
 export const getGroceryDetail = async (grocery_id: string): Promise<IGroceryDetail> => {
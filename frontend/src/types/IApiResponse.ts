@@ -3,4 +3,14 @@ export interface IApiResponse<T> {
     data: T;
     message: string;
     timestamp: string;
-}
\ No newline at end of file
+}
+
+export interface ICursorPagination {
+    limit: number;
+    next_cursor: string | null;
+    has_more: boolean;
+}
+
+export interface IPaginatedApiResponse<T> extends IApiResponse<T[]> {
+    pagination: ICursorPagination;
+}